@@ -0,0 +1,59 @@
+"""
+Mede o ImagePipeline: tempo para pré-processar um lote de fotos com threads e com processos, e o tamanho
+enviado (base64) com e sem pré-processamento.
+
+As fotos são geradas com ruído (o pior caso para o JPEG) no tamanho de uma câmera de celular de 12 MP.
+
+Uso:
+    python benchmarks/bench_image_pipeline.py --images 8 --workers 1,2,4
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from PIL import Image
+from evolutionapi_client.tools.image_pipeline import ImagePipeline
+
+def make_images(directory: str, count: int, size: tuple[int, int]) -> list[str]:
+    paths = []
+    for index in range(count):
+        path = os.path.join(directory, f"photo-{index}.jpg")
+        Image.effect_noise(size, 30 + index).convert("RGB").save(path, quality=92)
+        paths.append(path)
+    return paths
+
+def run(paths: list[str], workers: int, processes: bool) -> tuple[float, int]:
+    with tempfile.TemporaryDirectory() as output_dir, ImagePipeline(output_dir=output_dir, workers=workers, processes=processes) as pipeline:
+        start = time.perf_counter()
+        results = pipeline.prepare(paths)
+        elapsed = time.perf_counter() - start
+    return elapsed, sum(result["bytes"] for result in results)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", type=int, default=8)
+    parser.add_argument("--workers", default="1,2,4")
+    parser.add_argument("--width", type=int, default=4000)
+    parser.add_argument("--height", type=int, default=3000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_images(directory, args.images, (args.width, args.height))
+        original = sum(os.path.getsize(path) for path in paths)
+        print(f"{'pool':>9} {'workers':>7} {'tempo s':>8} {'img/s':>7} {'base64 MB':>10} {'original MB':>12}")
+        for workers in [int(value) for value in args.workers.split(",")]:
+            for processes in (False, True):
+                elapsed, processed = run(paths, workers, processes)
+                pool = "processos" if processes else "threads"
+                print(
+                    f"{pool:>9} {workers:>7} {elapsed:>8.2f} {len(paths) / elapsed:>7.1f} "
+                    f"{processed * 4 / 3 / 1e6:>10.2f} {original * 4 / 3 / 1e6:>12.2f}"
+                )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Mede o tempo de import do cliente com `python -X importtime` e verifica o orçamento de import.
+
+Falha (exit code 1) se o import ultrapassar o orçamento ou carregar módulos pesados que só
+devem ser importados sob demanda (PyMuPDF, Pillow, httpx).
+
+Uso:
+    python benchmarks/bench_import.py --budget-ms 250 --runs 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE = "evolutionapi_client"
+FORBIDDEN = ("fitz", "pymupdf", "PIL", "httpx")
+
+def measure() -> tuple[float, set]:
+    """
+    Importa o cliente em um processo novo.
+
+    Returns:
+        tuple[float, set]: Tempo cumulativo de import do pacote (ms) e módulos de nível superior carregados.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    total_us = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        name = name.strip()
+        modules.add(name.split(".")[0])
+        if name == MODULE:
+            total_us = int(cumulative)
+    return total_us / 1000, modules
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=250)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    times = []
+    loaded = set()
+    for _ in range(args.runs):
+        elapsed, modules = measure()
+        times.append(elapsed)
+        loaded |= modules
+
+    best = min(times)
+    heavy = sorted(loaded.intersection(FORBIDDEN))
+    print(f"import {MODULE}: melhor {best:.1f} ms | mediana {sorted(times)[len(times) // 2]:.1f} ms | orçamento {args.budget_ms:.0f} ms")
+
+    failed = False
+    if heavy:
+        print(f"[ERRO] Módulos pesados carregados no import: {', '.join(heavy)}")
+        failed = True
+    if best > args.budget_ms:
+        print("[ERRO] Tempo de import acima do orçamento.")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Mede o custo de enfileirar no Outbox e a vazão de consumo com 1, 2, 4... processos worker.
+
+O servidor mock (benchmarks/mock_server.py) roda em um processo próprio, com latência configurável,
+e cada rodada usa um arquivo de fila novo. Os workers rodam sem espaçamento entre envios (`no_delay`),
+para medir a vazão da fila e não a política anti-bloqueio.
+
+Uso:
+    python benchmarks/bench_outbox.py --messages 2000 --processes 1,2,4 --threads 4 --latency-ms 20
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from multiprocessing import Process
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from evolutionapi_client import EvolutionAPIClient
+from evolutionapi_client.send.outbox import run_outbox_worker
+
+INSTANCE = "instance-0"
+
+def no_delay(index: int) -> float:
+    return 0
+
+def start_mock(latency_ms: float) -> tuple[subprocess.Popen, str]:
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "benchmarks", "mock_server.py"), "--port", "0", "--latency-ms", str(latency_ms)],
+        stdout=subprocess.PIPE, text=True
+    )
+    return process, process.stdout.readline().strip().rsplit(" ", 1)[-1]
+
+def run(url: str, messages: int, processes: int, threads: int) -> tuple[float, float]:
+    with tempfile.TemporaryDirectory() as tmp, EvolutionAPIClient(url, "bench", INSTANCE) as client:
+        with client.outbox(os.path.join(tmp, "outbox.db")) as outbox:
+            start = time.perf_counter()
+            for index in range(messages):
+                outbox.enqueue_text(f"5511{900000000 + index:09d}", "bench")
+            enqueue_us = (time.perf_counter() - start) / messages * 1e6
+            outbox.flush()
+
+            workers = [Process(target=run_outbox_worker, args=(url, "bench", INSTANCE, outbox.db_path, threads, no_delay)) for _ in range(processes)]
+            start = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            while outbox.stats()["pending"]:
+                time.sleep(0.05)
+            elapsed = time.perf_counter() - start
+            for worker in workers:
+                worker.terminate()
+                worker.join()
+    return enqueue_us, messages / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--processes", default="1,2,4")
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    server, url = start_mock(args.latency_ms)
+    try:
+        print(f"{'processos':>9} {'enqueue us':>11} {'envios/s':>10}")
+        for processes in [int(value) for value in args.processes.split(",")]:
+            enqueue_us, throughput = run(url, args.messages, processes, args.threads)
+            print(f"{processes:>9} {enqueue_us:>11.1f} {throughput:>10.1f}")
+    finally:
+        server.terminate()
+        server.wait()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Compara o tempo e o pico de memória (RSS) da compressão de PDFs.
+
+Gera um PDF sintético com páginas "escaneadas" (imagens com ruído) e comprime-o com:
+    legacy   implementação anterior: renderiza serialmente e mantém todas as páginas como PIL.Image
+    serial   compress_pdf_file(workers=1): escrita incremental no próprio processo
+    parallel compress_pdf_file(workers=N): pool de processos + escrita incremental
+
+Cada variante roda em um processo novo para medir o pico de RSS isoladamente (processo principal e
+maior processo do pool).
+
+Uso:
+    python benchmarks/bench_pdf_compress.py --pages 60 --workers 4
+"""
+import argparse
+import io
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+def make_pdf(path: str, pages: int):
+    """Gera um PDF A4 com uma imagem JPEG de ruído por página, semelhante a um documento escaneado."""
+    import fitz
+    from PIL import Image
+
+    noise = Image.effect_noise((620, 877), 64).convert("RGB")
+    doc = fitz.open()
+    for number in range(pages):
+        buffer = io.BytesIO()
+        noise.rotate(number % 360).save(buffer, format="JPEG", quality=90)
+        page = doc.new_page(width=595, height=842)
+        page.insert_image(page.rect, stream=buffer.getvalue())
+        page.insert_text((72, 72), f"Página {number + 1}", fontsize=24)
+    doc.save(path)
+    doc.close()
+
+def legacy_compress(input_path: str, output_path: str, quality: int = 50):
+    import fitz
+    from PIL import Image
+
+    doc = fitz.open(input_path)
+    images = []
+    for page in doc:
+        pix = page.get_pixmap(dpi=150)
+        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+        compressed_io = io.BytesIO()
+        img.save(compressed_io, format="JPEG", quality=quality)
+        images.append(Image.open(io.BytesIO(compressed_io.getvalue())))
+    doc.close()
+    if images:
+        images[0].save(output_path, save_all=True, append_images=images[1:], format="PDF")
+
+def run_variant(variant: str, input_path: str, output_path: str, workers: int):
+    from evolutionapi_client.tools.func_tools import compress_pdf_file
+
+    start = time.perf_counter()
+    if variant == "legacy":
+        legacy_compress(input_path, output_path)
+    else:
+        compress_pdf_file(input_path, output_path, workers=1 if variant == "serial" else workers)
+    elapsed = time.perf_counter() - start
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    print(f"{elapsed:.3f} {own:.1f} {children:.1f} {os.path.getsize(output_path)}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=60)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--variants", default="legacy,serial,parallel")
+    parser.add_argument("--run", nargs=3, metavar=("VARIANT", "INPUT", "OUTPUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        return run_variant(*args.run, args.workers)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "input.pdf")
+        make_pdf(source, args.pages)
+        print(f"PDF sintético: {args.pages} páginas, {os.path.getsize(source) / 1024 / 1024:.1f} MB | workers={args.workers}")
+        print(f"{'variante':<10}{'tempo (s)':>12}{'RSS principal (MB)':>22}{'RSS worker (MB)':>18}{'saída (MB)':>14}")
+
+        baseline = None
+        for variant in args.variants.split(","):
+            output = os.path.join(tmp, f"{variant}.pdf")
+            proc = subprocess.run(
+                [sys.executable, __file__, "--workers", str(args.workers), "--run", variant, source, output],
+                capture_output=True, text=True, check=True
+            )
+            elapsed, own, children, size = proc.stdout.splitlines()[-1].split()
+            elapsed = float(elapsed)
+            baseline = baseline or elapsed
+            print(
+                f"{variant:<10}{elapsed:>12.2f}{float(own):>22.1f}{float(children):>18.1f}"
+                f"{int(size) / 1024 / 1024:>14.1f}   ({baseline / elapsed:.2f}x)"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Mede o Provisioner sobre uma frota simulada: primeira execução (cria tudo) e reexecução (nada a alterar),
+com diferentes limites de concorrência.
+
+O servidor mock (benchmarks/mock_server.py) guarda instâncias, configurações, webhooks e integrações
+Chatwoot em memória, então a reexecução encontra o estado aplicado pela primeira.
+
+Uso:
+    python benchmarks/bench_provisioner.py --instances 300 --workers 1,8,32 --latency-ms 50
+"""
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from mock_server import MockConfig, start_mock_server
+from evolutionapi_client import EvolutionAPIClient
+
+def fleet(count: int) -> list[dict]:
+    return [
+        {
+            "name": f"frota-{index}",
+            "token": f"token-{index}",
+            "number": f"5511{900000000 + index:09d}",
+            "settings": {"reject_call": True, "groups_ignore": True},
+            "webhook_url": "http://127.0.0.1:9/webhook",
+            "webhook_events": [4, 5, 19],
+            "chatwoot": {"account_id": 1, "chatwoot_token": "token", "chatwoot_url": "http://127.0.0.1:9"},
+            "connect": False
+        }
+        for index in range(count)
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--instances", type=int, default=300)
+    parser.add_argument("--workers", default="1,8,32")
+    parser.add_argument("--latency-ms", type=float, default=50)
+    args = parser.parse_args()
+
+    specs = fleet(args.instances)
+    print(f"{'workers':>7} {'1a execução s':>14} {'reexecução s':>13} {'requisições':>12} {'alteradas':>10}")
+    for workers in [int(value) for value in args.workers.split(",")]:
+        config = MockConfig(latency_ms=args.latency_ms, instances=0)
+        server, url = start_mock_server(config)
+        try:
+            with EvolutionAPIClient(url, "bench") as client:
+                provisioner = client.provisioner(max_workers=workers)
+                first = provisioner.apply(specs)
+                before = config.stats["requests"]
+                rerun = provisioner.apply(specs)
+                requests = config.stats["requests"] - before
+        finally:
+            server.shutdown()
+        changed = rerun["summary"]["created"] + rerun["summary"]["updated"]
+        print(f"{workers:>7} {first['elapsed']:>14.2f} {rerun['elapsed']:>13.2f} {requests:>12} {changed:>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Suíte de benchmarks do cliente contra o servidor mock local (benchmarks/mock_server.py).
+
+Para cada carga (text, media, status, group) e cada nível de concorrência, dispara o mesmo volume de
+chamadas pelo EvolutionAPIClient e reporta vazão, latência p50/p99 por chamada e pico de memória (RSS).
+
+O mock roda em um processo próprio e cada combinação carga x concorrência roda em um processo novo, para
+que o pico de RSS de uma medição não contamine a seguinte e o servidor não dispute o GIL com o cliente.
+A semente fixa do mock torna a sequência de latências e erros injetados reprodutível.
+
+Cargas:
+    text    message.send_text_message
+    media   media.send_media com um arquivo de --media-kb KB
+    status  status.send_status_text
+    group   group.fetch_all_groups(get_participants=True)
+
+Uso:
+    python benchmarks/bench_suite.py --requests 500 --concurrency 1,8,32 --latency-ms 20 --rate-429 0.01
+    python benchmarks/bench_suite.py --workloads text,group --json resultados.json
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+WORKLOADS = ("text", "media", "status", "group")
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+def recipient(index: int) -> str:
+    # Terminar em 1 evita os números "0000" que o mock trata como fora do WhatsApp (respostas 400).
+    return f"5511{900000001 + index * 10:09d}"
+
+def make_call(client, workload: str, media_path: str):
+    if workload == "text":
+        return lambda index: client.message.send_text_message(recipient(index), "bench", delay=0)
+    if workload == "media":
+        return lambda index: client.media.send_media(recipient(index), media_path, caption="bench", delay=0)
+    if workload == "status":
+        return lambda index: client.status.send_status_text("bench", delay=0)
+    if workload == "group":
+        return lambda index: client.group.fetch_all_groups(get_participants=True)
+    raise ValueError(f"Carga desconhecida: {workload}")
+
+def run_workload(url: str, workload: str, total: int, concurrency: int, media_path: str) -> dict:
+    """Executa uma carga no processo atual e retorna as medições."""
+    from evolutionapi_client import EvolutionAPIClient
+    from evolutionapi_client.transport import HTTPTransport
+
+    transport = HTTPTransport(pool_maxsize=concurrency)
+    with EvolutionAPIClient(url, "bench", "instance-0", transport=transport) as client:
+        call = make_call(client, workload, media_path)
+        call(0)
+
+        def one(index: int) -> float:
+            start = time.perf_counter()
+            call(index)
+            return time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            latencies = list(pool.map(one, range(total)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        "workload": workload,
+        "concurrency": concurrency,
+        "requests": total,
+        "throughput": total / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    }
+
+def start_mock(args) -> tuple[subprocess.Popen, str]:
+    command = [
+        sys.executable, os.path.join(ROOT, "benchmarks", "mock_server.py"), "--port", "0",
+        "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+        "--error-rate", str(args.error_rate), "--rate-429", str(args.rate_429),
+        "--retry-after", str(args.retry_after), "--groups", str(args.groups),
+        "--participants", str(args.participants), "--seed", str(args.seed)
+    ]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline().strip()
+    if not line:
+        process.kill()
+        raise RuntimeError("Servidor mock não iniciou")
+    return process, line.rsplit(" ", 1)[-1]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workloads", default=",".join(WORKLOADS))
+    parser.add_argument("--concurrency", default="1,8,32")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--media-kb", type=int, default=256)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--rate-429", type=float, default=0)
+    parser.add_argument("--retry-after", type=float, default=0.1)
+    parser.add_argument("--groups", type=int, default=50)
+    parser.add_argument("--participants", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", metavar="ARQUIVO", help="Também grava os resultados em JSON.")
+    parser.add_argument("--run", nargs=5, metavar=("URL", "WORKLOAD", "TOTAL", "CONCURRENCY", "MEDIA"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        url, workload, total, concurrency, media_path = args.run
+        print(json.dumps(run_workload(url, workload, int(total), int(concurrency), media_path)))
+        return
+
+    workloads = [workload.strip() for workload in args.workloads.split(",") if workload.strip()]
+    levels = [int(level) for level in args.concurrency.split(",")]
+    server, url = start_mock(args)
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            media_path = os.path.join(tmp, "bench.jpg")
+            with open(media_path, "wb") as f:
+                f.write(os.urandom(args.media_kb * 1024))
+
+            print(f"{'carga':<8} {'conc':>5} {'req/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'pico RSS MB':>12}")
+            for workload in workloads:
+                for concurrency in levels:
+                    output = subprocess.run(
+                        [sys.executable, __file__, "--run", url, workload, str(args.requests), str(concurrency), media_path],
+                        capture_output=True, text=True, check=True
+                    ).stdout
+                    # Só a última linha: avisos de bibliotecas podem ir para o stdout.
+                    result = json.loads(output.strip().splitlines()[-1])
+                    results.append(result)
+                    print(
+                        f"{workload:<8} {concurrency:>5} {result['throughput']:>10.1f} {result['p50_ms']:>9.2f} "
+                        f"{result['p99_ms']:>9.2f} {result['peak_rss_mb']:>12.1f}"
+                    )
+    finally:
+        server.terminate()
+        server.wait()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": {key: value for key, value in vars(args).items() if key not in ("run", "json")}, "results": results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Compara a vazão de requisições com e sem pool de conexões (HTTPTransport x requests.post).
+
+Sobe o servidor mock local (benchmarks/mock_server.py) e dispara no endpoint /message/sendText
+o mesmo volume de requisições pelos dois caminhos.
+
+Uso:
+    python benchmarks/bench_transport.py --requests 2000 --threads 8
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from evolutionapi_client.transport import HTTPTransport
+from mock_server import start_mock_server
+
+def run(post, url: str, total: int, threads: int) -> float:
+    payload = {"number": "5511999999999", "text": "bench", "delay": 1000, "link_preview": False}
+    headers = {"apikey": "bench", "Content-Type": "application/json"}
+
+    def one(_):
+        post(url, json=payload, headers=headers).content
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(one, range(total)))
+    return total / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    server, base_url = start_mock_server()
+    url = f"{base_url}/message/sendText/bench"
+
+    unpooled = run(requests.post, url, args.requests, args.threads)
+    with HTTPTransport(pool_maxsize=args.threads) as transport:
+        pooled = run(transport.post, url, args.requests, args.threads)
+    server.shutdown()
+
+    print(f"requests.post (sem pool): {unpooled:10.1f} req/s")
+    print(f"HTTPTransport (com pool): {pooled:10.1f} req/s")
+    print(f"ganho:                    {pooled / unpooled:10.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""
+Servidor local que imita a EvolutionAPI para benchmarks e testes manuais.
+
+Implementa /message/sendText, /message/sendMedia, /message/sendStatus, /message/sendLocation, /group/*,
+/instance/*, /settings/*, /chat/whatsappNumbers, /webhook/* e /chatwoot/*, com latência, taxa de erros 500
+e respostas 429 (com Retry-After) configuráveis. O sorteio de erros usa uma semente fixa, então a mesma
+sequência de requisições produz a mesma sequência de respostas.
+
+Números terminados em "0000" são tratados como fora do WhatsApp (resposta 400 com `exists: false`).
+Instâncias criadas, configurações, webhooks e integrações Chatwoot ficam guardados em memória e são
+retornados por fetchInstances e pelos endpoints /find.
+
+Uso:
+    python benchmarks/mock_server.py --port 8080 --latency-ms 50 --jitter-ms 10 --error-rate 0.01 --rate-429 0.02
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class MockConfig:
+    def __init__(
+        self,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0,
+        rate_429: float = 0,
+        retry_after: float = 1,
+        instances: int = 3,
+        groups: int = 50,
+        participants: int = 20,
+        seed: int = 42
+    ):
+        """
+        Comportamento do servidor mock.
+
+        Args:
+            latency_ms (float): Latência base de cada resposta, em milissegundos. Defaults to 0.
+            jitter_ms (float): Variação uniforme somada à latência, em milissegundos. Defaults to 0.
+            error_rate (float): Fração das requisições respondidas com 500. Defaults to 0.
+            rate_429 (float): Fração das requisições respondidas com 429. Defaults to 0.
+            retry_after (float): Valor do header Retry-After nas respostas 429, em segundos. Defaults to 1.
+            instances (int): Quantidade de instâncias "open" em /instance/fetchInstances. Defaults to 3.
+            groups (int): Quantidade de grupos em /group/fetchAllGroups. Defaults to 50.
+            participants (int): Participantes por grupo. Defaults to 20.
+            seed (int): Semente do sorteio de latência e erros. Defaults to 42.
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.instances = instances
+        self.groups = groups
+        self.participants = participants
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "errors": 0, "throttled": 0, "bytes_in": 0}
+        self.state = {"created": {}, "settings": {}, "webhook": {}, "chatwoot": {}}
+
+    def draw(self) -> tuple[float, str | None]:
+        """Sorteia a latência e a falha injetada ("500", "429" ou None) da próxima requisição."""
+        with self.lock:
+            delay = (self.latency_ms + self.random.uniform(0, self.jitter_ms)) / 1000
+            roll = self.random.random()
+        if roll < self.rate_429:
+            return delay, "429"
+        if roll < self.rate_429 + self.error_rate:
+            return delay, "500"
+        return delay, None
+
+def _message_response(number: str, instance: str, message: dict, message_type: str) -> dict:
+    return {
+        "key": {"remoteJid": f"{number}@s.whatsapp.net", "fromMe": True, "id": uuid.uuid4().hex[:20].upper()},
+        "pushName": "",
+        "status": "PENDING",
+        "message": message,
+        "messageType": message_type,
+        "messageTimestamp": int(time.time()),
+        "instanceId": instance,
+        "source": "unknown"
+    }
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    config = MockConfig()
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, body, headers: dict = None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_body(self) -> dict:
+        length = int(self.headers.get("Content-Length", 0))
+        data = self.rfile.read(length) if length else b""
+        with self.config.lock:
+            self.config.stats["bytes_in"] += len(data)
+        return json.loads(data) if data else {}
+
+    def _handle(self):
+        config = self.config
+        body = self._read_body()
+        with config.lock:
+            config.stats["requests"] += 1
+        delay, failure = config.draw()
+        if delay:
+            time.sleep(delay)
+
+        if failure == "429":
+            with config.lock:
+                config.stats["throttled"] += 1
+            return self._reply(429, {"status": 429, "error": "Too Many Requests"}, {"Retry-After": str(config.retry_after)})
+        if failure == "500":
+            with config.lock:
+                config.stats["errors"] += 1
+            return self._reply(500, {"status": 500, "error": "Internal Server Error"})
+
+        parts = self.path.split("?", 1)[0].strip("/").split("/")
+        route = "/".join(parts[:2])
+        instance = parts[2] if len(parts) > 2 else ""
+        handler = ROUTES.get(route)
+        if handler is None:
+            return self._reply(404, {"status": 404, "error": "Not Found", "response": {"message": [f"Cannot {self.command} /{route}"]}})
+        status, response = handler(self, instance, body)
+        self._reply(status, response)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+def _send_text(handler, instance, body):
+    number = str(body.get("number", ""))
+    if number.endswith("0000"):
+        return 400, {
+            "status": 400,
+            "error": "Bad Request",
+            "response": {"message": [{"exists": False, "jid": f"{number}@s.whatsapp.net", "number": number}]}
+        }
+    return 201, _message_response(number, instance, {"conversation": body.get("text", "")}, "conversation")
+
+def _send_media(handler, instance, body):
+    return 201, _message_response(body.get("number", ""), instance, {"mediaType": body.get("mediatype")}, f"{body.get('mediatype', 'document')}Message")
+
+def _send_status(handler, instance, body):
+    return 201, _message_response("status", instance, {"type": body.get("type")}, "statusMessage")
+
+def _send_location(handler, instance, body):
+    location = {"degreesLatitude": body.get("latitude"), "degreesLongitude": body.get("longitude")}
+    return 201, _message_response(body.get("number", ""), instance, {"locationMessage": location}, "locationMessage")
+
+def _groups(config: MockConfig) -> list:
+    return [
+        {
+            "id": f"1203630{index:011d}@g.us",
+            "subject": f"Grupo {index}",
+            "size": config.participants,
+            "participants": [
+                {"id": f"55119{(index * config.participants + member) % 10 ** 8:08d}@s.whatsapp.net", "admin": "admin" if member == 0 else None}
+                for member in range(config.participants)
+            ]
+        }
+        for index in range(config.groups)
+    ]
+
+def _fetch_all_groups(handler, instance, body):
+    groups = _groups(handler.config)
+    if "getParticipants=false" in handler.path:
+        for group in groups:
+            group.pop("participants")
+    return 200, groups
+
+def _create_group(handler, instance, body):
+    return 201, {"id": f"1203630{uuid.uuid4().int % 10 ** 11:011d}@g.us", "subject": body.get("subject"), "participants": body.get("participants", [])}
+
+DEFAULT_SETTINGS = {
+    "rejectCall": False, "msgCall": "", "groupsIgnore": False, "alwaysOnline": False,
+    "readMessages": False, "readStatus": False, "syncFullHistory": False
+}
+
+def _fetch_instances(handler, instance, body):
+    config = handler.config
+    instances = [
+        {"name": f"instance-{index}", "connectionStatus": "open", "token": f"token-{index}", "ownerJid": f"55119{index:08d}@s.whatsapp.net"}
+        for index in range(config.instances)
+    ]
+    with config.lock:
+        instances += [dict(created) for created in config.state["created"].values()]
+        for item in instances:
+            item["Setting"] = config.state["settings"].get(item["name"], DEFAULT_SETTINGS)
+    return 200, instances
+
+def _create_instance(handler, instance, body):
+    config = handler.config
+    name = body.get("instanceName")
+    with config.lock:
+        if name in config.state["created"] or name in {f"instance-{index}" for index in range(config.instances)}:
+            return 403, {"status": 403, "error": "Forbidden", "response": {"message": [f'This name "{name}" is already in use.']}}
+        config.state["created"][name] = {"name": name, "connectionStatus": "close", "token": body.get("token"), "ownerJid": None}
+        config.state["settings"][name] = {key: body.get(key, value) for key, value in DEFAULT_SETTINGS.items()}
+    return 201, {"instance": {"instanceName": name, "status": "created"}, "hash": body.get("token"), "qrcode": {"base64": ""}}
+
+def _connect_instance(handler, instance, body):
+    with handler.config.lock:
+        created = handler.config.state["created"].get(instance)
+        if created is not None:
+            created["connectionStatus"] = "connecting"
+    return 200, {"pairingCode": None, "code": f"2@{uuid.uuid4().hex}", "base64": "data:image/png;base64,", "count": 1}
+
+def _delete_instance(handler, instance, body):
+    with handler.config.lock:
+        for values in handler.config.state.values():
+            values.pop(instance, None)
+    return _instance_action(handler, instance, body)
+
+def _store(kind: str, field: str = None):
+    def handler_(handler, instance, body):
+        with handler.config.lock:
+            handler.config.state[kind][instance] = body.get(field) if field else body
+        return 201, {**body, "instance": instance}
+    return handler_
+
+def _find(kind: str, default=None):
+    def handler_(handler, instance, body):
+        with handler.config.lock:
+            return 200, handler.config.state[kind].get(instance, default)
+    return handler_
+
+def _connection_state(handler, instance, body):
+    return 200, {"instance": {"instanceName": instance, "state": "open"}}
+
+def _instance_action(handler, instance, body):
+    return 200, {"status": "SUCCESS", "error": False, "response": {"message": "OK", "instance": instance or body.get("instanceName")}}
+
+def _whatsapp_numbers(handler, instance, body):
+    return 200, [
+        {"exists": not str(number).endswith("0000"), "jid": f"{number}@s.whatsapp.net", "number": str(number)}
+        for number in body.get("numbers", [])
+    ]
+
+ROUTES = {
+    "message/sendText": _send_text,
+    "message/sendMedia": _send_media,
+    "message/sendStatus": _send_status,
+    "message/sendLocation": _send_location,
+    "group/fetchAllGroups": _fetch_all_groups,
+    "group/create": _create_group,
+    "instance/fetchInstances": _fetch_instances,
+    "instance/connectionState": _connection_state,
+    "instance/create": _create_instance,
+    "instance/connect": _connect_instance,
+    "instance/logout": _instance_action,
+    "instance/delete": _delete_instance,
+    "settings/set": _store("settings"),
+    "settings/find": _find("settings", DEFAULT_SETTINGS),
+    "chat/whatsappNumbers": _whatsapp_numbers,
+    "webhook/set": _store("webhook", "webhook"),
+    "webhook/find": _find("webhook"),
+    "chatwoot/set": _store("chatwoot"),
+    "chatwoot/find": _find("chatwoot")
+}
+
+def start_mock_server(config: MockConfig = None, host: str = "127.0.0.1", port: int = 0) -> tuple[ThreadingHTTPServer, str]:
+    """
+    Inicia o servidor mock em uma thread.
+
+    Returns:
+        tuple[ThreadingHTTPServer, str]: O servidor (use `shutdown()` para encerrar) e sua URL base.
+    """
+    handler = type("ConfiguredMockHandler", (MockHandler,), {"config": config or MockConfig()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="mock-evolution-api", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--rate-429", type=float, default=0)
+    parser.add_argument("--retry-after", type=float, default=1)
+    parser.add_argument("--instances", type=int, default=3)
+    parser.add_argument("--groups", type=int, default=50)
+    parser.add_argument("--participants", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    config = MockConfig(
+        args.latency_ms, args.jitter_ms, args.error_rate, args.rate_429, args.retry_after,
+        args.instances, args.groups, args.participants, args.seed
+    )
+    server, url = start_mock_server(config, args.host, args.port)
+    print(f"Mock EvolutionAPI em {url}", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(json.dumps(config.stats))
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,11 @@
 from .client import EvolutionAPIClient
+from .transport import HTTPTransport
+from .resilience import CircuitOpenError, Resilience, RetryPolicy
+from .metrics import Metrics
+
+def __getattr__(name):
+    # O cliente assíncrono depende do httpx (extra "async") e só é importado quando usado.
+    if name in ("AsyncEvolutionAPIClient", "AsyncHTTPTransport"):
+        from . import aio
+        return getattr(aio, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
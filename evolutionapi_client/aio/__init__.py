@@ -0,0 +1,3 @@
+from .client import AsyncEvolutionAPIClient
+from .transport import AsyncHTTPTransport
+from .scheduler import AsyncSendScheduler
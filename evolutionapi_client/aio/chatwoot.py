@@ -0,0 +1,21 @@
+from evolutionapi_client.integrations.chatwoot import ChatwootIntegration
+from evolutionapi_client.serialization import response_json
+from .instance import AsyncInstanceManager
+
+class AsyncChatwootIntegration(AsyncInstanceManager):
+    _chatwoot_payload = ChatwootIntegration._chatwoot_payload
+
+    async def create_chatwoot_integration(self, account_id: int, chatwoot_token: str, chatwoot_url: str, sign_msg: bool = True, reopen_conversation: bool = True, conversation_pending: bool = False, import_contacts: bool = True, import_messages: bool = True, days_limit_import_messages: int = 1, auto_create: bool = True, instance_name: str = None):
+        name = instance_name or self.instance_name
+        url = f"{self.base_url}/chatwoot/set/{name}"
+        payload = self._chatwoot_payload(
+            account_id, chatwoot_token, chatwoot_url, sign_msg, reopen_conversation, conversation_pending,
+            import_contacts, import_messages, days_limit_import_messages, auto_create, name
+        )
+        r = await self.transport.post(url, instance=name, json=payload, headers=self.headers)
+        return r
+
+    async def find_chatwoot_integration(self, instance_name: str = None) -> dict | None:
+        name = instance_name or self.instance_name
+        response = await self._request("get", f"/chatwoot/find/{name}", name)
+        return response_json(response) if response is not None else None
@@ -0,0 +1,72 @@
+from .transport import AsyncHTTPTransport
+from .instance import AsyncInstanceManager
+from .group import AsyncGroupManager
+from .chatwoot import AsyncChatwootIntegration
+from .send import AsyncSendMessage, AsyncSendMedia, AsyncSendStatus, AsyncSendLocation
+from evolutionapi_client.tools.media_cache import MediaCache
+from evolutionapi_client.instance.registry import InstanceRegistry
+from evolutionapi_client.send.existence import ExistenceCache
+from evolutionapi_client.tools.file_server import FileServer
+from evolutionapi_client.tools.image_pipeline import ImagePipeline
+
+class AsyncEvolutionAPIClient():
+    def __init__(self, url: str, api_global_key: str, set_instance: str = None, transport: AsyncHTTPTransport = None, media_cache: MediaCache = None, registry: InstanceRegistry = None, existence_cache: ExistenceCache = None, file_server: FileServer = None, image_pipeline: ImagePipeline = None):
+        """
+        Cliente assíncrono da API Evolution, espelhando o EvolutionAPIClient.
+
+        Todos os gerenciadores compartilham um único AsyncHTTPTransport. A instância informada em
+        `set_instance` é carregada ao entrar no contexto (`async with`) ou via `await set_instance(nome)`.
+
+        Args:
+            url (str): URL base da API.
+            api_global_key (str): Chave de API global para autenticação.
+            set_instance (str, optional): Nome da instância a ser setada ao iniciar. Defaults to None.
+            transport (AsyncHTTPTransport, optional): Transporte assíncrono compartilhado. Defaults to None.
+            media_cache (MediaCache, optional): Cache de mídia compartilhado pelos envios. Defaults to None.
+            registry (InstanceRegistry, optional): Cache de instâncias compartilhado pelos gerenciadores. Defaults to None.
+            existence_cache (ExistenceCache, optional): Cache de números fora do WhatsApp usado pelos envios. Defaults to None.
+            file_server (FileServer, optional): Servidor de arquivos para enviar mídia local por URL. Defaults to None.
+            image_pipeline (ImagePipeline, optional): Pré-processamento das imagens antes do envio. Defaults to None.
+        """
+        self.base_url = url.rstrip('/')
+        self.transport = transport or AsyncHTTPTransport()
+        self.media_cache = media_cache or MediaCache()
+        self.existence_cache = existence_cache
+        self.file_server = file_server
+        self.image_pipeline = image_pipeline
+        self._initial_instance = set_instance
+        self.instance = AsyncInstanceManager(url, api_global_key, self.transport, registry)
+        self.registry = self.instance.registry
+        self.group = AsyncGroupManager(url, api_global_key, self.transport, self.registry)
+        self.chatwoot = AsyncChatwootIntegration(url, api_global_key, self.transport, self.registry)
+        self._bind_senders()
+
+    def _bind_senders(self):
+        self.location = AsyncSendLocation(self.instance)
+        self.message = AsyncSendMessage(self.instance, self.existence_cache)
+        self.media = AsyncSendMedia(self.instance, self.media_cache, self.existence_cache, self.file_server, self.image_pipeline)
+        self.status = AsyncSendStatus(self.instance, self.media_cache, self.file_server, self.image_pipeline)
+
+    async def set_instance(self, instance_name: str) -> dict:
+        """
+        Seta a instância em todos os gerenciadores com uma única consulta à API.
+        """
+        instance = await self.instance.set_instance(instance_name)
+        for manager in (self.group, self.chatwoot):
+            manager.instance = self.instance.instance
+            manager.instance_name = self.instance.instance_name
+            manager.instance_key = self.instance.instance_key
+        self._bind_senders()
+        return instance
+
+    async def aclose(self):
+        """Fecha as conexões do transporte assíncrono compartilhado."""
+        await self.transport.aclose()
+
+    async def __aenter__(self):
+        if self._initial_instance:
+            await self.set_instance(self._initial_instance)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
@@ -0,0 +1,39 @@
+from typing import List
+from evolutionapi_client.serialization import response_json
+from .instance import AsyncInstanceManager
+
+class AsyncGroupManager(AsyncInstanceManager):
+    async def create_group(self, group_name: str, participants: list, description: str = "") -> dict:
+        """
+            Cria um grupo na instância conectada.
+
+            Args:
+                group_name (str): Nome do grupo.
+                participants (list): Lista de numeros de telefone dos participantes. Informar JID dos participantes.
+                description (str, optional): Descricao do grupo. Defaults to "".
+
+            Returns:
+                dict: Dicionário com a resposta da API.
+        """
+        url = f"{self.base_url}/group/create/{self.instance_name}"
+        payload = {
+            "subject": group_name,
+            "description": description,
+            "participants": participants
+        }
+        r = await self.transport.post(url, instance=self.instance_name, json=payload, headers=self.headers)
+        return response_json(r)
+
+    async def fetch_all_groups(self, get_participants: bool = True) -> List[dict]:
+        """
+        Busca todos os grupos da instância.
+
+        Args:
+            get_participants (bool): Defina como True para incluir a lista de  participantes de cada grupo na resposta. O padrão é True.
+        """
+        url = f"{self.base_url}/group/fetchAllGroups/{self.instance_name}"
+        params = {
+            "getParticipants": str(get_participants).lower()
+        }
+        r = await self.transport.get(url, instance=self.instance_name, headers=self.headers, params=params)
+        return response_json(r)
@@ -0,0 +1,123 @@
+from evolutionapi_client.instance.manager import InstanceManager
+from evolutionapi_client.instance.registry import InstanceRegistry
+from evolutionapi_client.serialization import response_json
+from .transport import AsyncHTTPTransport
+
+class AsyncInstanceManager(InstanceManager):
+    def __init__(self, url: str, api_global_key: str, transport: AsyncHTTPTransport = None, registry: InstanceRegistry = None):
+        """
+        Versão assíncrona do InstanceManager.
+
+        A instância não é setada no construtor; utilize `await set_instance(nome)`.
+
+        Args:
+            url (str): URL base da API.
+            api_global_key (str): Chave de API global para autenticação.
+            transport (AsyncHTTPTransport, optional): Transporte assíncrono compartilhado. Defaults to None.
+            registry (InstanceRegistry, optional): Cache de instâncias compartilhado. Defaults to None.
+        """
+        super().__init__(url, api_global_key, None, transport or AsyncHTTPTransport(), registry)
+
+    async def _request(self, method: str, endpoint: str, instance: str = None, **kwargs):
+        """
+        Método interno para realizar requisições HTTP padronizadas.
+
+        Returns:
+            httpx.Response | None: Resposta da requisição ou None em caso de erro.
+        """
+        try:
+            url = f"{self.base_url}{endpoint}"
+            response = await self.transport.request(method, url, instance=instance, headers=self.headers, **kwargs)
+            response.raise_for_status()
+            return response
+        except Exception as e:
+            print(f"[ERRO] {method.upper()} {endpoint}: {e}")
+            return None
+
+    # Os métodos síncronos abaixo apenas montam o payload e retornam self._request(...),
+    # que aqui é uma corrotina; basta aguardá-la.
+
+    async def create_instance(
+        self,
+        instance_name: str,
+        token: str,
+        number: str,
+        reject_call: bool = True,
+        msg_call: str = "Este número não aceita chamadas.",
+        groups_ignore: bool = True,
+        always_online: bool = True,
+        read_messages: bool = True,
+        read_status: bool = True,
+        sync_full_history: bool = True
+    ):
+        return await super().create_instance(
+            instance_name, token, number, reject_call, msg_call, groups_ignore, always_online, read_messages, read_status, sync_full_history
+        )
+
+    async def fetch_instances(self, refresh: bool = False):
+        instances = None if refresh else self.registry.instances()
+        if instances is None:
+            response = await self._request("get", "/instance/fetchInstances")
+            if not response:
+                return {}
+            instances = response_json(response)
+            self.registry.store_instances(instances)
+        return instances
+
+    async def connect_instance(self, instance_name: str):
+        return await super().connect_instance(instance_name)
+
+    async def logout_instance(self, instance_name: str):
+        return await super().logout_instance(instance_name)
+
+    async def delete_instance(self, instance_name: str):
+        return await super().delete_instance(instance_name)
+
+    async def get_connection_state(self, instance_name: str = None, refresh: bool = False) -> dict:
+        name = instance_name or self.instance_name
+        state = None if refresh else self.registry.get("state", name)
+        if state is None:
+            state = response_json(await self._request("get", f"/instance/connectionState/{name}", name))
+            self.registry.store("state", name, state)
+        return state
+
+    async def set_instance_settings(
+        self,
+        reject_call: bool = True,
+        msg_call: str = "Este número não aceita chamadas.",
+        groups_ignore: bool = True,
+        always_online: bool = True,
+        read_messages: bool = True,
+        read_status: bool = True,
+        sync_full_history: bool = True,
+        instance_name: str = None
+    ):
+        return await super().set_instance_settings(
+            reject_call, msg_call, groups_ignore, always_online, read_messages, read_status, sync_full_history, instance_name
+        )
+
+    async def find_instance_settings(self, instance_name: str, refresh: bool = False):
+        settings = None if refresh else self.registry.get("settings", instance_name)
+        if settings is None:
+            settings = await self._request("get", f"/settings/find/{instance_name}", instance_name)
+            if settings is not None:
+                self.registry.store("settings", instance_name, settings)
+        return settings
+
+    async def set_webhook(self, webhook_url: str, event_codes: list[int] = None, instance_name: str = None):
+        return await super().set_webhook(webhook_url, event_codes, instance_name)
+
+    async def find_webhook(self, instance_name: str = None) -> dict | None:
+        name = instance_name or self.instance_name
+        response = await self._request("get", f"/webhook/find/{name}", name)
+        return response_json(response) if response is not None else None
+
+    async def set_instance(self, instance_name: str) -> dict:
+        for instance in await self.fetch_instances():
+            if instance['name'] == instance_name and instance['connectionStatus'] == 'open':
+                self.instance = instance
+                self.instance_name = instance['name']
+                self.instance_key = instance['token']
+                return instance
+        print(f"[WARN] Instância '{instance_name}' não encontrada ou desconectada.")
+        return None
@@ -0,0 +1,43 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable
+from evolutionapi_client.tools.func_chat import calculate_send_delay
+from evolutionapi_client.send.scheduler import SendPacer, SLEEPING_SENDERS, sender_key
+
+class AsyncSendScheduler:
+    def __init__(self, delay_policy: Callable[[int], float] = calculate_send_delay):
+        """
+        Versão assíncrona do SendScheduler: um único event loop controla o ritmo de várias instâncias.
+
+        Args:
+            delay_policy (Callable[[int], float]): Política de espaçamento por instância. Defaults to calculate_send_delay.
+        """
+        self.pacer = SendPacer(delay_policy)
+
+    def submit(self, func: Callable[..., Awaitable], *args, key: Hashable = None, **kwargs) -> asyncio.Task:
+        """
+        Agenda um envio assíncrono e retorna imediatamente uma Task.
+
+        Args:
+            func (Callable[..., Awaitable]): Método de envio, ex: client.message.send_text_message.
+            key (Hashable, optional): Fila de ritmo. Por padrão, o nome da instância do sender.
+
+        Returns:
+            asyncio.Task: Resolve com o retorno de `func`.
+        """
+        if isinstance(getattr(func, "__self__", None), SLEEPING_SENDERS):
+            kwargs.setdefault("delay", 0)
+        if key is None:
+            key = sender_key(func)
+
+        loop = asyncio.get_running_loop()
+        # O pacer usa time.monotonic(), mesmo relógio do loop padrão do asyncio.
+        slot = self.pacer.reserve(key, loop.time())
+        return loop.create_task(self._run(slot, func, args, kwargs))
+
+    @staticmethod
+    async def _run(slot: float, func: Callable[..., Awaitable], args: tuple, kwargs: dict):
+        loop = asyncio.get_running_loop()
+        wait = slot - loop.time()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return await func(*args, **kwargs)
@@ -0,0 +1,182 @@
+import asyncio
+import os
+import httpx
+from evolutionapi_client.send.message import SendMessage
+from evolutionapi_client.send.media import SendMedia
+from evolutionapi_client.send.status import SendStatus, iter_chunks, chunk_result, broadcast_summary, warn_repeated_upload
+from evolutionapi_client.send.location import SendLocation
+from evolutionapi_client.tools.func_chat import validate_number, iter_validate_numbers
+from evolutionapi_client.tools.func_tools import get_api_response, media_body_kwargs
+from evolutionapi_client.send.existence import missing_response
+from evolutionapi_client.serialization import response_json
+
+class ReplayableAsyncBody:
+    def __init__(self, body):
+        """Envolve um Base64JSONBody para que o httpx possa reenviá-lo em retentativas."""
+        self.body = body
+
+    def __aiter__(self):
+        return self.body.aiter()
+
+def httpx_body(body: dict, headers: dict) -> dict:
+    """
+    Adapta o retorno de media_body_kwargs para o httpx.AsyncClient.
+
+    Corpos já serializados (bytes) vão como `content`; corpos em streaming (Base64JSONBody) são enviados por um
+    iterador assíncrono com Content-Length.
+    """
+    data = body.get("data")
+    if data is None:
+        return {**body, "headers": headers}
+    if isinstance(data, bytes):
+        return {"content": data, "headers": headers}
+    return {"content": ReplayableAsyncBody(data), "headers": {**headers, "Content-Length": str(len(data))}}
+
+class AsyncSendMessage(SendMessage):
+    async def _post_message(self, number: str, body: dict, delay: int = 5) -> dict:
+        # O cache é SQLite (bloqueante): as consultas rodam fora do event loop.
+        if self.existence_cache is not None and number and await asyncio.to_thread(self.existence_cache.is_known_missing, number):
+            return missing_response(number)
+
+        url = f"{self.base_url}/message/sendText/{self.instance_name}"
+        response = await self.transport.post(url, instance=self.instance_name, **httpx_body(body, self.headers))
+        await self.transport.sleep(delay)
+        result = response_json(response)
+        if self.existence_cache is not None and number:
+            await asyncio.to_thread(self.existence_cache.record_response, number, result)
+        return result
+
+    async def send_text_message(self, number: str, message: str, delay: int = 5) -> dict:
+        return await super().send_text_message(number, message, delay)
+
+    async def send_message_with_link(self, number: str, message: str, link_preview=True, delay: int = 5):
+        return await super().send_message_with_link(number, message, link_preview, delay)
+
+    async def send_prepared(self, template, number: str, delay: int = 5) -> dict:
+        return await super().send_prepared(template, number, delay)
+
+class AsyncSendMedia(SendMedia):
+    async def send_media(self, number: str, file_path: str, file_name: str = "", caption: str = "", delay: int = 10, max_size_mb: float = None) -> dict:
+        skipped = await asyncio.to_thread(self._known_missing, validate_number(number))
+        if skipped is not None:
+            return skipped
+
+        source_path = await asyncio.to_thread(self._preprocess, file_path)
+        file_path = await asyncio.to_thread(self._fit_to_size, source_path, max_size_mb)
+        try:
+            # O payload lê o arquivo inteiro (hash do MediaCache); ele, a leitura e a codificação rodam fora do event loop.
+            payload = await asyncio.to_thread(self._media_payload, number, file_path, file_name, caption)
+            with self.transport.phase("encode"):
+                body = await asyncio.to_thread(media_body_kwargs, payload, "media", file_path, self.stream_threshold_mb, self.media_cache, self.file_server, self.url_threshold_mb)
+            url = f"{self.base_url}/message/sendMedia/{self.instance_name}"
+
+            try:
+                r = await self.transport.post(url, instance=self.instance_name, **httpx_body(body, self.headers))
+                await self.transport.sleep(delay)
+                result = get_api_response(r)
+                if self.existence_cache is not None:
+                    await asyncio.to_thread(self.existence_cache.record_response, payload["number"], result)
+            except Exception as e:
+                print(f"Erro ao enviar mensagem de mídia: {e}")
+                return {
+                    "success": False,
+                    "status_code": None,
+                    "message": str(e),
+                    "response": None
+                }
+        finally:
+            if self._is_temporary(file_path, source_path):
+                os.remove(file_path)
+        return result
+
+class AsyncSendStatus(SendStatus):
+    async def _send_status(self, payload: dict, delay: int = 2, file_path: str = None) -> httpx.Response:
+        body = {"json": payload}
+        if file_path:
+            with self.transport.phase("encode"):
+                body = await asyncio.to_thread(media_body_kwargs, payload, "content", file_path, self.stream_threshold_mb, self.media_cache, self.file_server, self.url_threshold_mb)
+        return await self._post_status(body, delay)
+
+    async def _post_status(self, body: dict, delay: int = 2) -> httpx.Response:
+        url = f"{self.base_url}/message/sendStatus/{self.instance_name}"
+        try:
+            r = await self.transport.post(url, instance=self.instance_name, **httpx_body(body, self.headers))
+            await self.transport.sleep(delay)
+            return r
+        except Exception as e:
+            print(f"[ERRO] Falha ao enviar status: {e}")
+            raise
+
+    async def send_status_text(self, content: str, background_color="#D3D3D3", font=5, delay=2) -> httpx.Response:
+        return await super().send_status_text(content, background_color, font, delay)
+
+    async def send_status_image(self, image_path: str, caption="", delay=2) -> dict:
+        file_path = await asyncio.to_thread(self._preprocess, image_path) if os.path.isfile(image_path) else None
+        payload = self._status_payload("image", None if file_path else image_path, caption=caption)
+        return response_json(await self._send_status(payload, delay, file_path))
+
+    async def send_status_video(self, video_path: str, caption="", delay=2):
+        return await super().send_status_video(video_path, caption, delay)
+
+    async def send_status_audio(self, audio_path: str, caption="", delay=2):
+        return await super().send_status_audio(audio_path, caption, delay)
+
+    async def send_prepared(self, template, status_jid_list: list[str], delay=2) -> httpx.Response:
+        return await super().send_prepared(template, status_jid_list, delay)
+
+    async def prepare_status(self, type: str, content: str, caption="", background_color="#D3D3D3", font=5):
+        # Pré-processamento e codificação da mídia rodam fora do event loop.
+        return await asyncio.to_thread(super().prepare_status, type, content, caption, background_color, font)
+
+    async def broadcast_status(self, template, numbers, chunk_size: int = 1000, max_workers: int = 4, interval: float = 1) -> dict:
+        from evolutionapi_client.aio.scheduler import AsyncSendScheduler
+
+        scheduler = AsyncSendScheduler(lambda _: interval)
+        in_flight = asyncio.Semaphore(max_workers)
+        # Assim como na versão síncrona, só `max_workers * 2` lotes ficam agendados por vez.
+        window = asyncio.Semaphore(max_workers * 2)
+        chunks = []
+        pending = set()
+
+        async def send_chunk(index: int, chunk: list[str]):
+            try:
+                async with in_flight:
+                    try:
+                        chunks.append(chunk_result(index, chunk, await self.send_prepared(template, chunk, delay=0)))
+                    except Exception as e:
+                        chunks.append(chunk_result(index, chunk, error=e))
+            finally:
+                window.release()
+
+        rejected = {}
+        for index, chunk in enumerate(iter_chunks(iter_validate_numbers(numbers, jid=True, counts=rejected), chunk_size)):
+            if index == 1:
+                warn_repeated_upload(template, self.url_threshold_mb)
+            await window.acquire()
+            task = scheduler.submit(send_chunk, index, chunk, key=self.instance_name)
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        await asyncio.gather(*pending)
+        return broadcast_summary(chunks, rejected)
+
+class AsyncSendLocation(SendLocation):
+    async def send_location(self, number: str, name: str, address: str, latitude: float, longitude: float, delay: int = 1000, link_preview: bool = True, mentionsEveryOne=None, mentioned=None, quoted=None) -> dict:
+        return await super().send_location(number, name, address, latitude, longitude, delay, link_preview, mentionsEveryOne, mentioned, quoted)
+
+    async def _post_location(self, body: dict) -> dict:
+        url = f"{self.base_url}/message/sendLocation/{self.instance_name}"
+        response = None
+        try:
+            response = await self.transport.post(url, instance=self.instance_name, **httpx_body(body, self.headers))
+            response.raise_for_status()
+            return response_json(response)
+        except httpx.HTTPError as e:
+            return {
+                "success": False,
+                "status_code": response.status_code if response is not None else None,
+                "message": str(e),
+                "response": getattr(response, "text", None)
+            }
+
+    async def send_prepared(self, template, number: str) -> dict:
+        return await super().send_prepared(template, number)
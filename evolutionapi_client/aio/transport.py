@@ -0,0 +1,108 @@
+import asyncio
+import httpx
+from contextlib import nullcontext
+from evolutionapi_client.resilience import Resilience
+from evolutionapi_client.metrics import Metrics, endpoint_label
+from evolutionapi_client.serialization import dumps
+
+def is_connect_error(error: Exception) -> bool:
+    """Indica se a exceção do httpx ocorreu antes de a requisição chegar ao servidor."""
+    return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+
+class AsyncHTTPTransport:
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        max_concurrency: int = 100,
+        timeout: float | tuple | None = (10, 120),
+        resilience: Resilience | bool = True,
+        metrics: Metrics = None
+    ):
+        """
+        Transporte HTTP assíncrono compartilhado, baseado em um único httpx.AsyncClient.
+
+        Args:
+            max_connections (int): Limite total de conexões abertas no pool. Defaults to 100.
+            max_keepalive_connections (int): Conexões ociosas mantidas vivas para reuso. Defaults to 20.
+            max_concurrency (int): Quantidade máxima de requisições em andamento ao mesmo tempo. Defaults to 100.
+            timeout (float | tuple | None): Timeout padrão das requisições, no formato (connect, read). Defaults to (10, 120).
+            resilience (Resilience | bool): Camada de retentativas e circuit breaker. True usa a configuração padrão
+                e False desativa. Defaults to True.
+            metrics (Metrics, optional): Coletor de métricas das requisições e sleeps. Defaults to None (desativado).
+        """
+        self.metrics = metrics
+        self.resilience = Resilience() if resilience is True else (resilience or None)
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            ),
+            timeout=timeout
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def request(self, method: str, url: str, instance: str = None, **kwargs) -> httpx.Response:
+        """
+        Realiza uma requisição HTTP respeitando o limite de concorrência.
+
+        Args:
+            method (str): Método HTTP (get, post, put, delete).
+            url (str): URL completa do endpoint.
+            instance (str, optional): Instância alvo, usada como chave do circuit breaker. Defaults to None.
+
+        Returns:
+            httpx.Response: Resposta da requisição.
+
+        Raises:
+            CircuitOpenError: Se o circuito da instância estiver aberto.
+        """
+        if kwargs.get("json") is not None:
+            kwargs["content"] = dumps(kwargs.pop("json"))
+            kwargs["headers"] = {"Content-Type": "application/json", **(kwargs.get("headers") or {})}
+
+        async def send():
+            # O semáforo é liberado durante o backoff entre tentativas.
+            async with self._semaphore:
+                return await self.client.request(method.upper(), url, **kwargs)
+
+        if self.metrics is not None:
+            send = self.metrics.ainstrument(send, method, endpoint_label(url, instance))
+        if self.resilience is None:
+            return await send()
+        return await self.resilience.acall(method, instance or "*", send, is_connect_error)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("get", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("post", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("put", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("delete", url, **kwargs)
+
+    async def sleep(self, seconds: float, reason: str = "delay"):
+        """Sleep dos envios (delay entre mensagens), contabilizado nas métricas."""
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+        if self.metrics is not None:
+            self.metrics.observe_sleep(seconds, reason)
+
+    def phase(self, name: str):
+        """Context manager que mede uma fase local (ex: "encode") quando as métricas estão ativas."""
+        return nullcontext() if self.metrics is None else self.metrics.phase(name)
+
+    async def aclose(self):
+        """Fecha todas as conexões abertas do pool."""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
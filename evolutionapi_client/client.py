@@ -1,4 +1,5 @@
 import requests
+from .transport import HTTPTransport
 from .instance.manager import InstanceManager
 from .group.manager import GroupManager
 from .send.message import SendMessage
@@ -6,22 +7,83 @@ from .send.location import SendLocation
 from .send.media import SendMedia
 from .send.status import SendStatus
 from .integrations.chatwoot import ChatwootIntegration
+from .tools.media_cache import MediaCache
+from .instance.registry import InstanceRegistry
+from .instance.pool import InstancePool
+from .instance.provisioner import Provisioner
+from .send.existence import ExistenceCache
+from .send.outbox import Outbox
+from .tools.file_server import FileServer
+from .tools.image_pipeline import ImagePipeline
 
 class EvolutionAPIClient():
-    def __init__(self, url:str, api_global_key:str, set_instance:str=None):
+    def __init__(self, url:str, api_global_key:str, set_instance:str=None, transport:HTTPTransport=None, media_cache:MediaCache=None, registry:InstanceRegistry=None, existence_cache:ExistenceCache=None, file_server:FileServer=None, image_pipeline:ImagePipeline=None):
         self.base_url = url.rstrip('/')
         self.headers = {"apikey": api_global_key, "Content-Type": "application/json"}
-        self.instance = InstanceManager(url, api_global_key, set_instance)
-        self.group = GroupManager(url, api_global_key, set_instance)
+        self.transport = transport or HTTPTransport()
+        self.media_cache = media_cache or MediaCache()
+        self.existence_cache = existence_cache
+        self.file_server = file_server
+        self.image_pipeline = image_pipeline
+        self.instance = InstanceManager(url, api_global_key, set_instance, self.transport, registry)
+        self.registry = self.instance.registry
+        self.group = GroupManager(url, api_global_key, set_instance, self.transport, self.registry)
         self.location = SendLocation(self.instance)
-        self.message = SendMessage(self.instance)
-        self.media = SendMedia(self.instance)
-        self.status = SendStatus(self.instance)
-        self.chatwoot = ChatwootIntegration(url, api_global_key, set_instance)
-    
+        self.message = SendMessage(self.instance, self.existence_cache)
+        self.media = SendMedia(self.instance, self.media_cache, self.existence_cache, file_server, image_pipeline)
+        self.status = SendStatus(self.instance, self.media_cache, file_server, image_pipeline)
+        self.chatwoot = ChatwootIntegration(url, api_global_key, set_instance, self.transport, self.registry)
+
     def _request(self, method:str, endpoint:str, **kwargs)->requests.Response:
         clean_endpoint = endpoint.strip('/')
         url = f"{self.base_url}/{clean_endpoint}/{self.instance.instance_name}"
         headers = self.headers
-        return requests.request(method, url, headers=headers, **kwargs)
+        return self.transport.request(method, url, instance=self.instance.instance_name, headers=headers, **kwargs)
+
+    def instance_pool(self, strategy: str = "least_loaded", **kwargs) -> InstancePool:
+        """
+        Cria um pool com as instâncias conectadas do servidor para distribuir os envios entre elas.
+
+        Args:
+            strategy (str): "least_loaded", "round_robin" ou "sticky". Defaults to "least_loaded".
+            **kwargs: Demais parâmetros de InstancePool (refresh_interval, cooldown, instances).
+
+        Returns:
+            InstancePool: Pool que compartilha o transporte, o registro e os caches do cliente.
+        """
+        return InstancePool(self.instance, strategy, self.media_cache, existence_cache=self.existence_cache, file_server=self.file_server, image_pipeline=self.image_pipeline, **kwargs)
+
+    def outbox(self, db_path: str, **kwargs) -> Outbox:
+        """
+        Abre a fila de saída persistente da instância do cliente.
+
+        Args:
+            db_path (str): Arquivo SQLite da fila.
+            **kwargs: Demais parâmetros de Outbox (visibility_timeout, max_attempts, batch_size...).
+
+        Returns:
+            Outbox: Fila que usa os senders deste cliente. Use `outbox.worker()` para consumi-la.
+        """
+        return Outbox(self, db_path, **kwargs)
+
+    def provisioner(self, max_workers: int = 8) -> Provisioner:
+        """
+        Cria um provisionador declarativo de instâncias, configurações, webhooks e integrações Chatwoot.
+
+        Args:
+            max_workers (int): Instâncias provisionadas em paralelo. Defaults to 8.
+
+        Returns:
+            Provisioner: Provisionador que usa o transporte e o registro do cliente. Veja `Provisioner.apply`.
+        """
+        return Provisioner(self.instance, self.chatwoot, max_workers)
+
+    def close(self):
+        """Fecha as conexões do transporte HTTP compartilhado."""
+        self.transport.close()
+
+    def __enter__(self):
+        return self
 
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,232 @@
+import json
+import sqlite3
+import threading
+from time import time
+from evolutionapi_client.group.manager import GroupManager
+from evolutionapi_client.instance.webhook import WebhookEvents
+
+GROUP_EVENTS = (WebhookEvents.GROUPS_UPSERT, WebhookEvents.GROUP_UPDATE, WebhookEvents.GROUP_PARTICIPANTS_UPDATE)
+
+def _participant_jid(participant: str | dict) -> str:
+    """Aceita o JID, o número ou o dicionário de participante retornado pela API."""
+    if isinstance(participant, dict):
+        participant = participant.get("id", "")
+    return participant if "@" in participant else f"{participant}@s.whatsapp.net"
+
+class GroupCache:
+    def __init__(self, manager: GroupManager = None, ttl: float = 600, db_path: str = None):
+        """
+        Cache local dos grupos da instância e de seus participantes, com índices por JID do grupo,
+        por participante e por assunto.
+
+        O cache é preenchido uma vez com fetch_all_groups(get_participants=True) e mantido atualizado pelos
+        eventos GROUPS_UPSERT, GROUP_UPDATE e GROUP_PARTICIPANTS_UPDATE (ver `attach`). Uma nova carga completa
+        só acontece quando o cache fica velho: após `ttl` segundos desde a última carga ou quando chega um evento
+        de um grupo desconhecido.
+
+        Args:
+            manager (GroupManager, optional): Gerenciador usado nas cargas completas. Sem ele, o cache depende
+                de `load` e dos eventos. Defaults to None.
+            ttl (float): Segundos entre reconciliações com a API. Defaults to 600.
+            db_path (str, optional): Arquivo SQLite para persistir o cache entre execuções. Defaults to None (apenas memória).
+        """
+        self.manager = manager
+        self.ttl = ttl
+        self.loaded_at = None
+        self.stale = True
+        self._groups = {}
+        self._by_participant = {}
+        self._by_subject = {}
+        self._lock = threading.RLock()
+        self._reconcile_lock = threading.Lock()
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.executescript(
+                "CREATE TABLE IF NOT EXISTS groups (jid TEXT PRIMARY KEY, data TEXT NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);"
+            )
+            self._restore()
+
+    def _restore(self):
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'loaded_at'").fetchone()
+        with self._lock:
+            for (data,) in self._db.execute("SELECT data FROM groups"):
+                self._index(json.loads(data))
+            if row:
+                self.loaded_at = float(row[0])
+                self.stale = False
+
+    def _persist(self, groups: list[dict], replace: bool = False):
+        if self._db is None:
+            return
+        with self._db:
+            if replace:
+                self._db.execute("DELETE FROM groups")
+                self._db.execute("INSERT OR REPLACE INTO meta VALUES ('loaded_at', ?)", (str(self.loaded_at),))
+            self._db.executemany(
+                "INSERT OR REPLACE INTO groups VALUES (?, ?)",
+                [(group["id"], json.dumps(group, ensure_ascii=False)) for group in groups]
+            )
+
+    def _index(self, group: dict):
+        jid = group["id"]
+        self._unindex(jid)
+        group["participants"] = [
+            {**participant, "id": _participant_jid(participant)} if isinstance(participant, dict) else {"id": _participant_jid(participant), "admin": None}
+            for participant in group.get("participants") or []
+        ]
+        self._groups[jid] = group
+        for participant in group["participants"]:
+            self._by_participant.setdefault(participant["id"], set()).add(jid)
+        self._by_subject.setdefault((group.get("subject") or "").casefold(), set()).add(jid)
+
+    def _unindex(self, jid: str):
+        group = self._groups.pop(jid, None)
+        if group is None:
+            return
+        for participant in group.get("participants") or []:
+            jids = self._by_participant.get(participant["id"])
+            if jids:
+                jids.discard(jid)
+                if not jids:
+                    del self._by_participant[participant["id"]]
+        subject = (group.get("subject") or "").casefold()
+        jids = self._by_subject.get(subject)
+        if jids:
+            jids.discard(jid)
+            if not jids:
+                del self._by_subject[subject]
+
+    def load(self, groups: list[dict]):
+        """Substitui todo o conteúdo do cache pela lista de grupos informada (formato de fetch_all_groups)."""
+        with self._lock:
+            self._groups.clear()
+            self._by_participant.clear()
+            self._by_subject.clear()
+            for group in groups:
+                self._index(dict(group))
+            self.loaded_at = time()
+            self.stale = False
+            self._persist(list(self._groups.values()), replace=True)
+
+    def is_stale(self) -> bool:
+        return self.stale or self.loaded_at is None or time() - self.loaded_at >= self.ttl
+
+    def reconcile(self, force: bool = False) -> bool:
+        """
+        Recarrega todos os grupos da API se o cache estiver velho (ou se `force`).
+
+        Returns:
+            bool: True se uma carga completa foi feita.
+        """
+        if self.manager is None or not (force or self.is_stale()):
+            return False
+        with self._reconcile_lock:
+            # Outra thread pode ter recarregado o cache enquanto esta aguardava.
+            if not (force or self.is_stale()):
+                return False
+            groups = self.manager.fetch_all_groups(get_participants=True)
+            if not isinstance(groups, list):
+                print(f"[ERRO] Falha ao carregar grupos: {groups}")
+                return False
+            self.load(groups)
+            return True
+
+    def get(self, group_jid: str) -> dict | None:
+        """Retorna os dados do grupo pelo JID (ex: "1203630...@g.us")."""
+        self.reconcile()
+        with self._lock:
+            return self._groups.get(group_jid)
+
+    def groups_of(self, participant: str) -> list[dict]:
+        """Retorna os grupos dos quais o participante (JID ou número) faz parte."""
+        self.reconcile()
+        with self._lock:
+            return [self._groups[jid] for jid in self._by_participant.get(_participant_jid(participant), ())]
+
+    def find_by_subject(self, subject: str, exact: bool = True) -> list[dict]:
+        """
+        Busca grupos pelo assunto, sem diferenciar maiúsculas e minúsculas.
+
+        Args:
+            subject (str): Assunto do grupo.
+            exact (bool): Se False, retorna os grupos cujo assunto contém `subject`. Defaults to True.
+        """
+        self.reconcile()
+        key = subject.casefold()
+        with self._lock:
+            if exact:
+                jids = self._by_subject.get(key, ())
+            else:
+                jids = [jid for name, jids in self._by_subject.items() if key in name for jid in jids]
+            return [self._groups[jid] for jid in jids]
+
+    def all(self) -> list[dict]:
+        self.reconcile()
+        with self._lock:
+            return list(self._groups.values())
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def _update_group(self, update: dict):
+        group = self._groups.get(update.get("id"))
+        if group is None:
+            self.stale = True
+            return
+        self._index({**group, **update, "participants": update.get("participants", group["participants"])})
+
+    def _update_participants(self, update: dict):
+        group = self._groups.get(update.get("id"))
+        if group is None:
+            self.stale = True
+            return
+        action = update.get("action")
+        jids = {_participant_jid(participant) for participant in update.get("participants") or []}
+        participants = [dict(participant) for participant in group["participants"]]
+        if action == "add":
+            known = {participant["id"] for participant in participants}
+            participants += [{"id": jid, "admin": None} for jid in jids - known]
+        elif action == "remove":
+            participants = [participant for participant in participants if participant["id"] not in jids]
+        elif action in ("promote", "demote"):
+            for participant in participants:
+                if participant["id"] in jids:
+                    participant["admin"] = "admin" if action == "promote" else None
+        self._index({**group, "participants": participants, "size": len(participants)})
+
+    def apply_event(self, event: WebhookEvents, payload: dict):
+        """
+        Aplica um evento de grupo ao cache. Pode ser registrado diretamente como handler do WebhookReceiver.
+
+        Eventos de outras instâncias (campo "instance" diferente da instância do gerenciador) são ignorados.
+        """
+        if self.manager is not None and payload.get("instance") not in (None, self.manager.instance_name):
+            return
+        data = payload.get("data")
+        updates = data if isinstance(data, list) else [data] if isinstance(data, dict) else []
+        with self._lock:
+            for update in updates:
+                if event == WebhookEvents.GROUPS_UPSERT:
+                    self._index(dict(update))
+                elif event == WebhookEvents.GROUP_UPDATE:
+                    self._update_group(update)
+                elif event == WebhookEvents.GROUP_PARTICIPANTS_UPDATE:
+                    self._update_participants(update)
+            self._persist([self._groups[update["id"]] for update in updates if update.get("id") in self._groups])
+
+    def attach(self, receiver):
+        """
+        Registra o cache no WebhookReceiver para os eventos GROUPS_UPSERT, GROUP_UPDATE e GROUP_PARTICIPANTS_UPDATE.
+
+        Args:
+            receiver (WebhookReceiver): Receptor de webhooks da aplicação.
+        """
+        for event in GROUP_EVENTS:
+            receiver.add_handler(event, self.apply_event)
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
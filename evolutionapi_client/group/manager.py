@@ -1,10 +1,10 @@
-import requests
 from typing import List
 from evolutionapi_client.instance.manager import InstanceManager
+from evolutionapi_client.serialization import response_json
 
 class GroupManager(InstanceManager):
-    def __init__(self, url, api_global_key, set_instance=None):
-        super().__init__(url, api_global_key, set_instance)
+    def __init__(self, url, api_global_key, set_instance=None, transport=None, registry=None):
+        super().__init__(url, api_global_key, set_instance, transport, registry)
 
     def create_group(self, group_name:str, participants:list, description:str="") -> dict:
         """
@@ -24,8 +24,8 @@ class GroupManager(InstanceManager):
             "description": description,
             "participants": participants
         }
-        r = requests.post(url, json=payload, headers=self.headers)
-        return r.json()
+        r = self.transport.post(url, instance=self.instance_name, json=payload, headers=self.headers)
+        return response_json(r)
     
     def fetch_all_groups(self, get_participants: bool = True) -> List[dict]:
         """
@@ -39,5 +39,5 @@ class GroupManager(InstanceManager):
             "getParticipants": str(get_participants).lower()
         }
         
-        r = requests.get(url, headers=self.headers, params=params)
-        return r.json()
\ No newline at end of file
+        r = self.transport.get(url, instance=self.instance_name, headers=self.headers, params=params)
+        return response_json(r)
\ No newline at end of file
@@ -2,9 +2,12 @@ import requests
 from evolutionapi_client.tools.func_chat import validate_number
 from .webhook import WebhookConfig, WebhookEvents
 from .proxy import ProxyConfig
+from .registry import InstanceRegistry
+from evolutionapi_client.transport import HTTPTransport
+from evolutionapi_client.serialization import response_json
 
 class InstanceManager:
-    def __init__(self, url:str, api_global_key:str, set_instance: str = None):
+    def __init__(self, url:str, api_global_key:str, set_instance: str = None, transport: HTTPTransport = None, registry: InstanceRegistry = None):
         """
         Classe responsável por gerenciar instâncias da API Evolution.
 
@@ -12,6 +15,8 @@ class InstanceManager:
             url (str): URL base da API.
             api_global_key (str): Chave de API global para autenticação.
             set_instance (str, optional): Nome da instância a ser setada automaticamente. Defaults to None.
+            transport (HTTPTransport, optional): Transporte HTTP compartilhado. Se não informado, um novo é criado. Defaults to None.
+            registry (InstanceRegistry, optional): Cache de instâncias compartilhado. Se não informado, um novo é criado. Defaults to None.
         """
         self.base_url = url.rstrip('/')
         self.api_global_key = api_global_key
@@ -22,24 +27,27 @@ class InstanceManager:
         self.instance_name = None
         self.instance_key = None
         self.instance = None
+        self.transport = transport or HTTPTransport()
+        self.registry = registry or InstanceRegistry()
 
         if set_instance:
             self.set_instance(set_instance)
 
-    def _request(self, method: str, endpoint: str, **kwargs):
+    def _request(self, method: str, endpoint: str, instance: str = None, **kwargs):
         """
         Método interno para realizar requisições HTTP padronizadas.
 
         Args:
             method (str): Método HTTP (get, post, put, delete).
             endpoint (str): Caminho do endpoint da API.
+            instance (str, optional): Instância alvo, usada pelo circuit breaker do transporte. Defaults to None.
 
         Returns:
             requests.Response | None: Resposta da requisição ou None em caso de erro.
         """
         try:
             url = f"{self.base_url}{endpoint}"
-            response = requests.request(method, url, headers=self.headers, **kwargs)
+            response = self.transport.request(method, url, instance=instance, headers=self.headers, **kwargs)
             response.raise_for_status()
             return response
         except Exception as e:
@@ -128,24 +136,44 @@ class InstanceManager:
                 sync_full_history
             )
         }
-        return self._request("post", "/instance/create", json=payload)
+        self.registry.invalidate(instance_name)
+        return self._request("post", "/instance/create", instance_name, json=payload)
 
-    def fetch_instances(self):
-        response = self._request("get", "/instance/fetchInstances")
-        return response.json() if response else {}
+    def fetch_instances(self, refresh: bool = False):
+        """
+        Lista as instâncias do servidor. Dentro do TTL do registro, retorna a lista em cache sem nova requisição.
+
+        Args:
+            refresh (bool): Ignora o cache e consulta a API. Defaults to False.
+        """
+        instances = None if refresh else self.registry.instances()
+        if instances is None:
+            response = self._request("get", "/instance/fetchInstances")
+            if not response:
+                return {}
+            instances = response_json(response)
+            self.registry.store_instances(instances)
+        return instances
 
     def connect_instance(self, instance_name: str):
-        return self._request("get", f"/instance/connect/{instance_name}")
+        self.registry.invalidate(instance_name)
+        return self._request("get", f"/instance/connect/{instance_name}", instance_name)
 
     def logout_instance(self, instance_name: str):
-        return self._request("get", f"/instance/logout/{instance_name}")
+        self.registry.invalidate(instance_name)
+        return self._request("get", f"/instance/logout/{instance_name}", instance_name)
 
     def delete_instance(self, instance_name: str):
-        return self._request("delete", f"/instance/delete/{instance_name}")
+        self.registry.invalidate(instance_name)
+        return self._request("delete", f"/instance/delete/{instance_name}", instance_name)
 
-    def get_connection_state(self, instance_name: str = None) -> dict:
+    def get_connection_state(self, instance_name: str = None, refresh: bool = False) -> dict:
         name = instance_name or self.instance_name
-        return self._request("get", f"/instance/connectionState/{name}").json()
+        state = None if refresh else self.registry.get("state", name)
+        if state is None:
+            state = response_json(self._request("get", f"/instance/connectionState/{name}", name))
+            self.registry.store("state", name, state)
+        return state
 
     def set_instance_settings(
         self,
@@ -155,8 +183,10 @@ class InstanceManager:
         always_online: bool = True,
         read_messages: bool = True,
         read_status: bool = True,
-        sync_full_history: bool = True
+        sync_full_history: bool = True,
+        instance_name: str = None
     ):
+        name = instance_name or self.instance_name
         payload = self._instance_params(
             reject_call,
             msg_call,
@@ -166,10 +196,16 @@ class InstanceManager:
             read_status,
             sync_full_history
         )
-        return self._request("put", f"/settings/set/{self.instance_name}", json=payload)
+        self.registry.invalidate(name)
+        return self._request("put", f"/settings/set/{name}", name, json=payload)
 
-    def find_instance_settings(self, instance_name: str):
-        return self._request("get", f"/settings/find/{instance_name}")
+    def find_instance_settings(self, instance_name: str, refresh: bool = False):
+        settings = None if refresh else self.registry.get("settings", instance_name)
+        if settings is None:
+            settings = self._request("get", f"/settings/find/{instance_name}", instance_name)
+            if settings is not None:
+                self.registry.store("settings", instance_name, settings)
+        return settings
 
     def set_instance(self, instance_name: str) -> dict:
         for instance in self.fetch_instances():
@@ -181,7 +217,28 @@ class InstanceManager:
         print(f"[WARN] Instância '{instance_name}' não encontrada ou desconectada.")
         return None
 
-    # Webhook and Proxy configuration coming soon
+    def set_webhook(self, webhook_url: str, event_codes: list[int] = None, instance_name: str = None):
+        """
+        Configura o webhook de uma instância.
+
+        Args:
+            webhook_url (str): URL que receberá os eventos.
+            event_codes (list[int], optional): Códigos de WebhookEvents. Defaults to None (apenas APPLICATION_STARTUP).
+            instance_name (str, optional): Instância alvo. Defaults to None (instância atual).
+
+        Returns:
+            requests.Response | None: Resposta da configuração ou None em caso de erro.
+        """
+        name = instance_name or self.instance_name
+        return self._request("post", f"/webhook/set/{name}", name, json=WebhookConfig().set_webhook(webhook_url, event_codes))
+
+    def find_webhook(self, instance_name: str = None) -> dict | None:
+        """Retorna a configuração de webhook da instância (None se não houver ou em caso de erro)."""
+        name = instance_name or self.instance_name
+        response = self._request("get", f"/webhook/find/{name}", name)
+        return response_json(response) if response is not None else None
+
+    # Proxy configuration coming soon
     
     
     
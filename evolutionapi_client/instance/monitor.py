@@ -0,0 +1,220 @@
+import threading
+from time import monotonic
+from typing import Callable
+from .manager import InstanceManager
+from .webhook import WebhookEvents
+
+StateListener = Callable[[str, str | None, str], None]
+
+class ConnectionMonitor:
+    def __init__(
+        self,
+        manager: InstanceManager,
+        min_interval: float = 5,
+        max_interval: float = 300,
+        backoff: float = 2,
+        bulk_threshold: int = 5
+    ):
+        """
+        Mantém em memória o estado de conexão de todas as instâncias do servidor.
+
+        Os eventos CONNECTION_UPDATE (ver `attach`) são a fonte principal. Como reserva, uma thread consulta
+        periodicamente cada instância: o intervalo começa em `min_interval` e é multiplicado por `backoff` a cada
+        consulta sem mudança, até `max_interval`. Uma mudança de estado volta o intervalo ao mínimo. Quando várias
+        instâncias vencem ao mesmo tempo, uma única chamada a fetch_instances substitui as consultas individuais.
+
+        `state(nome)` e `is_open(nome)` leem apenas a tabela em memória, sem requisições.
+
+        Args:
+            manager (InstanceManager): Gerenciador usado nas consultas (transporte e registro compartilhados).
+            min_interval (float): Menor intervalo, em segundos, entre consultas de uma instância. Defaults to 5.
+            max_interval (float): Maior intervalo, em segundos, entre consultas de uma instância estável. Defaults to 300.
+            backoff (float): Fator de aumento do intervalo a cada consulta sem mudança. Defaults to 2.
+            bulk_threshold (int): Instâncias vencidas a partir das quais usa fetch_instances. Defaults to 5.
+        """
+        self.manager = manager
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.bulk_threshold = bulk_threshold
+        self._states = {}
+        self._schedule = {}
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def state(self, instance_name: str) -> str | None:
+        """Último estado conhecido ("open", "connecting", "close"...) ou None se a instância é desconhecida."""
+        return self._states.get(instance_name)
+
+    def is_open(self, instance_name: str) -> bool:
+        return self._states.get(instance_name) == "open"
+
+    def states(self) -> dict:
+        """Cópia da tabela {instância: estado}."""
+        with self._lock:
+            return dict(self._states)
+
+    def open_instances(self) -> list[str]:
+        with self._lock:
+            return [name for name, state in self._states.items() if state == "open"]
+
+    def subscribe(self, listener: StateListener) -> Callable[[], None]:
+        """
+        Registra uma função chamada com (instância, estado_anterior, novo_estado) a cada mudança.
+        Instâncias removidas do servidor são notificadas com novo_estado None.
+
+        Returns:
+            Callable[[], None]: Função que cancela a inscrição.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+        def unsubscribe():
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+        return unsubscribe
+
+    def _update(self, instance_name: str, state: str, from_event: bool = False):
+        now = monotonic()
+        with self._lock:
+            previous = self._states.get(instance_name)
+            self._states[instance_name] = state
+            interval = self._schedule.get(instance_name, (0, self.min_interval))[1]
+            if from_event:
+                # O webhook está funcionando para esta instância: a consulta fica como reserva distante.
+                interval = self.max_interval
+            elif previous == state:
+                interval = min(interval * self.backoff, self.max_interval)
+            else:
+                interval = self.min_interval
+            self._schedule[instance_name] = (now + interval, interval)
+            listeners = list(self._listeners) if previous != state else []
+        self._notify(listeners, instance_name, previous, state)
+
+    def _notify(self, listeners: list, instance_name: str, previous: str | None, state: str | None):
+        for listener in listeners:
+            try:
+                listener(instance_name, previous, state)
+            except Exception as e:
+                print(f"[ERRO] Listener de conexão ({instance_name}): {e}")
+
+    def _forget_missing(self, names: set):
+        with self._lock:
+            removed = {name: self._states.pop(name) for name in list(self._states) if name not in names}
+            for name in removed:
+                self._schedule.pop(name, None)
+            listeners = list(self._listeners)
+        for name, previous in removed.items():
+            self._notify(listeners, name, previous, None)
+
+    def refresh_all(self) -> bool:
+        """
+        Atualiza a tabela com uma única chamada a fetch_instances (também detecta instâncias novas e removidas).
+
+        Returns:
+            bool: False se a lista de instâncias não pôde ser consultada.
+        """
+        instances = self.manager.fetch_instances(refresh=True)
+        if not isinstance(instances, list):
+            return False
+        for instance in instances:
+            self._update(instance["name"], instance.get("connectionStatus"))
+        self._forget_missing({instance["name"] for instance in instances})
+        return True
+
+    def _load(self) -> bool:
+        try:
+            return self.refresh_all()
+        except Exception as e:
+            print(f"[ERRO] Falha ao carregar instâncias: {e}")
+            return False
+
+    def poll(self, instance_name: str):
+        """Consulta o estado de uma instância em /instance/connectionState."""
+        try:
+            state = self.manager.get_connection_state(instance_name, refresh=True)["instance"]["state"]
+        except Exception as e:
+            print(f"[WARN] Falha ao consultar conexão de '{instance_name}': {e}")
+            return
+        self._update(instance_name, state)
+
+    def handle_connection_update(self, event: WebhookEvents, payload: dict):
+        """
+        Handler de CONNECTION_UPDATE para o WebhookReceiver.
+
+        Exemplo:
+            receiver.add_handler(WebhookEvents.CONNECTION_UPDATE, monitor.handle_connection_update)
+        """
+        data = payload.get("data") or {}
+        name = payload.get("instance") or data.get("instance")
+        state = data.get("state")
+        if not name or not state:
+            return
+        self.manager.registry.store("state", name, {"instance": {"instanceName": name, "state": state}})
+        self._update(name, state, from_event=True)
+
+    def attach(self, receiver):
+        """Registra o monitor no WebhookReceiver para o evento CONNECTION_UPDATE."""
+        receiver.add_handler(WebhookEvents.CONNECTION_UPDATE, self.handle_connection_update)
+
+    def _due(self) -> tuple[list[str], float]:
+        now = monotonic()
+        with self._lock:
+            due = [name for name, (next_poll, _) in self._schedule.items() if next_poll <= now]
+            wait = min((next_poll for next_poll, _ in self._schedule.values()), default=now + self.max_interval) - now
+        return due, max(wait, 0.0)
+
+    def _defer(self, names: list[str]):
+        """Reagenda para `min_interval` as instâncias cuja consulta falhou e que continuam vencidas."""
+        now = monotonic()
+        with self._lock:
+            for name in names:
+                entry = self._schedule.get(name)
+                if entry is not None and entry[0] <= now:
+                    self._schedule[name] = (now + self.min_interval, entry[1])
+
+    def _run(self):
+        # Sem a carga inicial não há nada agendado: tenta de novo a cada `min_interval` até conseguir.
+        while not self._load():
+            if self._stop.wait(self.min_interval):
+                return
+        last_full = monotonic()
+
+        while not self._stop.is_set():
+            due, wait = self._due()
+            if len(due) >= self.bulk_threshold or monotonic() - last_full >= self.max_interval:
+                self._load()
+                last_full = monotonic()
+            else:
+                for name in due:
+                    self.poll(name)
+            if due:
+                self._defer(due)
+            else:
+                self._wake.wait(min(wait, self.max_interval))
+                self._wake.clear()
+
+    def start(self):
+        """Inicia a thread de monitoramento (faz a carga inicial com fetch_instances)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="connection-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
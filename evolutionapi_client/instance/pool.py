@@ -0,0 +1,322 @@
+import copy
+import itertools
+import json
+import threading
+import zlib
+from time import monotonic
+from typing import Any
+import requests
+from .manager import InstanceManager
+from .webhook import WebhookEvents
+from evolutionapi_client.send.message import SendMessage
+from evolutionapi_client.send.media import SendMedia
+from evolutionapi_client.send.status import SendStatus
+from evolutionapi_client.send.location import SendLocation
+from evolutionapi_client.tools.media_cache import MediaCache
+from evolutionapi_client.send.existence import ExistenceCache
+from evolutionapi_client.tools.file_server import FileServer
+from evolutionapi_client.tools.image_pipeline import ImagePipeline
+from evolutionapi_client.resilience import CircuitOpenError
+
+STRATEGIES = ("least_loaded", "round_robin", "sticky")
+
+class NoInstanceAvailable(Exception):
+    """Nenhuma instância conectada está disponível no pool."""
+
+def instance_failed(response: Any) -> bool:
+    """
+    Indica se o retorno de um método de envio aponta falha da instância (e não do pedido).
+
+    Considera falha as respostas 5xx e 429 e o dicionário padronizado sem status, que os senders retornam
+    quando a requisição nem chegou a ser respondida (erro de transporte, circuito aberto).
+    """
+    if not isinstance(response, dict):
+        return False
+    if "success" in response:
+        if response["success"]:
+            return False
+        status = response.get("status_code")
+        if status is None:
+            return True
+    else:
+        status = response.get("status")
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+class PooledInstance:
+    def __init__(self, manager: InstanceManager, instance: dict, media_cache: MediaCache = None, existence_cache: ExistenceCache = None, file_server: FileServer = None, image_pipeline: ImagePipeline = None):
+        """
+        Instância do pool com seus próprios senders.
+
+        Os senders copiam o nome da instância no construtor, por isso cada membro recebe uma cópia rasa do
+        InstanceManager apontando para a sua instância (o transporte e o registro continuam compartilhados).
+
+        Args:
+            manager (InstanceManager): Gerenciador base do cliente.
+            instance (dict): Dados da instância retornados por fetch_instances.
+            media_cache (MediaCache, optional): Cache de mídia compartilhado pelos senders. Defaults to None.
+            existence_cache (ExistenceCache, optional): Cache de números fora do WhatsApp compartilhado pelos senders. Defaults to None.
+            file_server (FileServer, optional): Servidor de arquivos para enviar mídia local por URL. Defaults to None.
+            image_pipeline (ImagePipeline, optional): Pré-processamento das imagens antes do envio. Defaults to None.
+        """
+        view = copy.copy(manager)
+        view.instance = instance
+        view.instance_name = instance["name"]
+        view.instance_key = instance.get("token")
+        self.name = view.instance_name
+        self.manager = view
+        self.message = SendMessage(view, existence_cache)
+        self.media = SendMedia(view, media_cache, existence_cache, file_server, image_pipeline)
+        self.status = SendStatus(view, media_cache, file_server, image_pipeline)
+        self.location = SendLocation(view)
+        self.in_flight = 0
+        self.sent = 0
+        self.failures = 0
+        self.down_until = 0.0
+
+    def available(self, now: float) -> bool:
+        return self.down_until <= now
+
+    def __repr__(self):
+        return f"PooledInstance({self.name!r}, in_flight={self.in_flight}, sent={self.sent})"
+
+class InstancePool:
+    def __init__(
+        self,
+        manager: InstanceManager,
+        strategy: str = "least_loaded",
+        media_cache: MediaCache = None,
+        refresh_interval: float = 30,
+        cooldown: float = 60,
+        instances: list[str] = None,
+        existence_cache: ExistenceCache = None,
+        file_server: FileServer = None,
+        image_pipeline: ImagePipeline = None
+    ):
+        """
+        Distribui os envios entre as instâncias conectadas (connectionStatus "open") do servidor.
+
+        Estratégias:
+            least_loaded: instância com menos envios em andamento (e, no empate, com menos envios no total).
+            round_robin: alterna entre as instâncias em ordem.
+            sticky: o mesmo destinatário sempre usa a mesma instância enquanto ela estiver disponível
+                (rendezvous hashing: remover uma instância só redistribui os destinatários dela).
+
+        Instâncias que falham no envio ou são reportadas como desconectadas (CONNECTION_UPDATE) saem de
+        rotação por `cooldown` segundos e só voltam se continuarem "open" na próxima atualização da lista.
+
+        Args:
+            manager (InstanceManager): Gerenciador de instâncias do cliente (transporte e registro compartilhados).
+            strategy (str): "least_loaded", "round_robin" ou "sticky". Defaults to "least_loaded".
+            media_cache (MediaCache, optional): Cache de mídia compartilhado pelos senders. Defaults to None.
+            refresh_interval (float): Intervalo mínimo, em segundos, entre atualizações da lista de instâncias. Defaults to 30.
+            cooldown (float): Tempo, em segundos, fora de rotação após uma falha ou desconexão. Defaults to 60.
+            instances (list[str], optional): Restringe o pool a estas instâncias. Defaults to None (todas).
+            existence_cache (ExistenceCache, optional): Cache de números fora do WhatsApp compartilhado pelos senders. Defaults to None.
+            file_server (FileServer, optional): Servidor de arquivos compartilhado pelos senders. Defaults to None.
+            image_pipeline (ImagePipeline, optional): Pré-processamento de imagens compartilhado pelos senders. Defaults to None.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Estratégia inválida: {strategy}. Use uma de {STRATEGIES}.")
+        self.manager = manager
+        self.strategy = strategy
+        self.media_cache = media_cache
+        self.existence_cache = existence_cache
+        self.file_server = file_server
+        self.image_pipeline = image_pipeline
+        self.refresh_interval = refresh_interval
+        self.cooldown = cooldown
+        self.allowed = set(instances) if instances else None
+        self._members = {}
+        self._refreshed_at = None
+        self._round_robin = itertools.count()
+        self._lock = threading.Lock()
+        self.refresh(force=True)
+
+    def refresh(self, force: bool = False) -> list[str]:
+        """
+        Atualiza os membros do pool a partir de fetch_instances (respeitando o TTL do registro).
+
+        Args:
+            force (bool): Consulta a API mesmo dentro do intervalo de atualização. Defaults to False.
+
+        Returns:
+            list[str]: Nomes das instâncias conectadas no pool.
+        """
+        if not force and self._refreshed_at is not None and monotonic() - self._refreshed_at < self.refresh_interval:
+            return self.names()
+
+        instances = self.manager.fetch_instances(refresh=force) or []
+        now = monotonic()
+        with self._lock:
+            connected = {}
+            for instance in instances:
+                name = instance.get("name")
+                if instance.get("connectionStatus") != "open" or (self.allowed and name not in self.allowed):
+                    continue
+                member = self._members.get(name)
+                if member is None:
+                    member = PooledInstance(self.manager, instance, self.media_cache, self.existence_cache, self.file_server, self.image_pipeline)
+                elif not member.available(now) and member.failures == 0:
+                    # Desconexão reportada por webhook: a lista confirma que voltou a ficar "open".
+                    member.down_until = 0.0
+                connected[name] = member
+            self._members = connected
+            self._refreshed_at = now
+            return list(connected)
+
+    def names(self) -> list[str]:
+        """Nomes das instâncias conectadas no pool, inclusive as temporariamente fora de rotação."""
+        with self._lock:
+            return list(self._members)
+
+    def members(self) -> list[PooledInstance]:
+        with self._lock:
+            return list(self._members.values())
+
+    def _pick(self, candidates: list[PooledInstance], number: str = None) -> PooledInstance:
+        if self.strategy == "round_robin":
+            return candidates[next(self._round_robin) % len(candidates)]
+        if self.strategy == "sticky" and number is not None:
+            return max(candidates, key=lambda member: zlib.crc32(f"{member.name}:{number}".encode()))
+        return min(candidates, key=lambda member: (member.in_flight, member.sent))
+
+    def acquire(self, number: str = None) -> PooledInstance:
+        """
+        Escolhe uma instância para o envio e a marca como ocupada. Deve ser seguido de `release`.
+
+        Args:
+            number (str, optional): Destinatário, usado pela estratégia "sticky". Defaults to None.
+
+        Returns:
+            PooledInstance: Instância escolhida.
+
+        Raises:
+            NoInstanceAvailable: Se nenhuma instância conectada estiver em rotação.
+        """
+        self.refresh()
+        now = monotonic()
+        with self._lock:
+            candidates = sorted(
+                (member for member in self._members.values() if member.available(now)),
+                key=lambda member: member.name
+            )
+            if not candidates:
+                raise NoInstanceAvailable("Nenhuma instância conectada disponível no pool.")
+            member = self._pick(candidates, number)
+            member.in_flight += 1
+            return member
+
+    def release(self, member: PooledInstance, ok: bool = True):
+        """
+        Libera a instância após o envio. Em caso de falha, ela sai de rotação por `cooldown` segundos.
+
+        Args:
+            member (PooledInstance): Instância retornada por `acquire`.
+            ok (bool | None): Se o envio foi concluído. None libera a instância sem contar sucesso nem falha
+                (erro do próprio pedido, ex: arquivo inexistente). Defaults to True.
+        """
+        with self._lock:
+            member.in_flight -= 1
+            if ok is None:
+                return
+            if ok:
+                member.sent += 1
+                member.failures = 0
+            else:
+                member.failures += 1
+                member.down_until = monotonic() + self.cooldown
+
+    def mark_down(self, instance_name: str, cooldown: float = None):
+        """Retira uma instância de rotação por `cooldown` segundos (padrão: o cooldown do pool)."""
+        with self._lock:
+            member = self._members.get(instance_name)
+            if member is not None:
+                member.down_until = monotonic() + (self.cooldown if cooldown is None else cooldown)
+
+    def mark_up(self, instance_name: str):
+        """Devolve uma instância à rotação imediatamente."""
+        with self._lock:
+            member = self._members.get(instance_name)
+            if member is not None:
+                member.down_until = 0.0
+                member.failures = 0
+
+    def handle_connection_update(self, event: WebhookEvents, payload: dict):
+        """
+        Handler de CONNECTION_UPDATE para o WebhookReceiver. Tira a instância de rotação assim que ela
+        deixa de estar "open" e força a atualização da lista quando uma instância se conecta.
+
+        Exemplo:
+            receiver.add_handler(WebhookEvents.CONNECTION_UPDATE, pool.handle_connection_update)
+        """
+        name = payload.get("instance")
+        state = (payload.get("data") or {}).get("state")
+        if name and state is not None:
+            self.handle_state_change(name, None, state)
+
+    def handle_state_change(self, instance_name: str, previous: str | None, state: str | None):
+        """
+        Listener para ConnectionMonitor.subscribe: aplica ao pool a mudança de estado de uma instância.
+
+        Exemplo:
+            monitor.subscribe(pool.handle_state_change)
+        """
+        name = instance_name
+        if state == "open":
+            self.mark_up(name)
+            self._refreshed_at = None
+        else:
+            self.manager.registry.invalidate(name)
+            self.mark_down(name, cooldown=float("inf"))
+
+    def call(self, sender: str, method: str, number: str, *args, **kwargs) -> Any:
+        """
+        Executa um método de envio na instância escolhida pela estratégia do pool.
+
+        Args:
+            sender (str): Sender da instância ("message", "media", "status" ou "location").
+            method (str): Nome do método do sender (ex: "send_text_message").
+            number (str): Destinatário, repassado como primeiro argumento do método.
+
+        Returns:
+            Any: Retorno do método de envio.
+
+        Apenas erros de transporte, circuito aberto, respostas 5xx/429 e respostas que não são JSON (ex: página
+        de erro HTML de um gateway) tiram a instância de rotação; erros do pedido (arquivo inexistente,
+        parâmetro inválido) são relançados sem afetar a instância.
+        """
+        member = self.acquire(number)
+        try:
+            response = getattr(getattr(member, sender), method)(number, *args, **kwargs)
+        except (requests.RequestException, CircuitOpenError, json.JSONDecodeError):
+            # JSONDecodeError também cobre o orjson.JSONDecodeError, subclasse dele.
+            self.release(member, ok=False)
+            raise
+        except BaseException:
+            self.release(member, ok=None)
+            raise
+        self.release(member, ok=not instance_failed(response))
+        return response
+
+    def send_text_message(self, number: str, message: str, delay: int = 5) -> dict:
+        return self.call("message", "send_text_message", number, message, delay)
+
+    def send_message_with_link(self, number: str, message: str, link_preview=True, delay: int = 5):
+        return self.call("message", "send_message_with_link", number, message, link_preview, delay)
+
+    def send_media(self, number: str, file_path: str, file_name: str = "", caption: str = "", delay: int = 10, max_size_mb: float = None) -> dict:
+        return self.call("media", "send_media", number, file_path, file_name, caption, delay, max_size_mb)
+
+    def stats(self) -> dict:
+        """Envios em andamento, concluídos e estado de rotação de cada instância."""
+        now = monotonic()
+        with self._lock:
+            return {
+                member.name: {
+                    "in_flight": member.in_flight,
+                    "sent": member.sent,
+                    "failures": member.failures,
+                    "available": member.available(now)
+                }
+                for member in self._members.values()
+            }
@@ -0,0 +1,247 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Iterable
+from evolutionapi_client.serialization import response_json
+from .manager import InstanceManager
+from .webhook import WebhookConfig
+
+class InstanceSpec:
+    def __init__(
+        self,
+        name: str,
+        token: str = None,
+        number: str = None,
+        settings: dict = None,
+        webhook_url: str = None,
+        webhook_events: list[int] = None,
+        chatwoot: dict = None,
+        connect: bool = True
+    ):
+        """
+        Estado desejado de uma instância. Campos None não são gerenciados pelo Provisioner.
+
+        Args:
+            name (str): Nome da instância.
+            token (str, optional): Token usado na criação. Defaults to None.
+            number (str, optional): Número usado na criação. Defaults to None.
+            settings (dict, optional): Argumentos de `set_instance_settings` (reject_call, msg_call, groups_ignore...). Defaults to None.
+            webhook_url (str, optional): URL do webhook. Defaults to None.
+            webhook_events (list[int], optional): Códigos de WebhookEvents do webhook. Defaults to None.
+            chatwoot (dict, optional): Argumentos de `create_chatwoot_integration` (account_id, chatwoot_token, chatwoot_url...). Defaults to None.
+            connect (bool): Solicita a conexão (QR code) se a instância não estiver conectada. Defaults to True.
+        """
+        self.name = name
+        self.token = token
+        self.number = number
+        self.settings = settings
+        self.webhook_url = webhook_url
+        self.webhook_events = webhook_events
+        self.chatwoot = chatwoot
+        self.connect = connect
+
+# Nomes equivalentes entre o payload enviado e a resposta dos endpoints /find (a API v2 aceita `byEvents` e
+# `base64` no /webhook/set, mas devolve `webhookByEvents` e `webhookBase64`).
+FIELD_ALIASES = {
+    "webhookByEvents": ("byEvents",),
+    "webhookBase64": ("base64",),
+    "byEvents": ("webhookByEvents",),
+    "base64": ("webhookBase64",)
+}
+
+_MISSING = object()
+
+def _normalize(value):
+    # Listas de eventos voltam da API em outra ordem; a ordem não é uma diferença.
+    return sorted(value) if isinstance(value, list) else value
+
+def _current_value(current: dict, key: str):
+    for name in (key, *FIELD_ALIASES.get(key, ())):
+        if name in current:
+            return current[name]
+    return _MISSING
+
+def diff_fields(desired: dict, current: dict | None) -> tuple[list[str], list[str]]:
+    """
+    Compara o estado desejado com o retornado pela API.
+
+    Cada campo é procurado na resposta pelo próprio nome e pelos nomes equivalentes de FIELD_ALIASES. Campos
+    ausentes na resposta (ex: tokens mascarados) não podem ser comparados e são devolvidos à parte, exceto
+    quando não há configuração alguma, caso em que todos os campos são considerados diferentes.
+
+    Returns:
+        tuple[list[str], list[str]]: Campos de `desired` cujo valor difere de `current` e campos que não
+            puderam ser verificados.
+    """
+    if not isinstance(current, dict) or not current:
+        return list(desired), []
+    changed, unverified = [], []
+    for key, value in desired.items():
+        found = _current_value(current, key)
+        if found is _MISSING:
+            unverified.append(key)
+        elif _normalize(found) != _normalize(value):
+            changed.append(key)
+    return changed, unverified
+
+class Provisioner:
+    def __init__(self, instance: InstanceManager, chatwoot=None, max_workers: int = 8):
+        """
+        Provisionamento declarativo e idempotente de instâncias, configurações, webhooks e integrações Chatwoot.
+
+        O estado atual é lido de `fetch_instances` (uma requisição para toda a frota) e dos endpoints /find de
+        cada instância; apenas as diferenças são enviadas. Rodar de novo sobre uma frota já provisionada faz só
+        as leituras, em paralelo, e não altera nada.
+
+        Args:
+            instance (InstanceManager): Gerenciador usado nas requisições (transporte e registro compartilhados).
+            chatwoot (ChatwootIntegration, optional): Necessário apenas para specs com `chatwoot`. Defaults to None.
+            max_workers (int): Instâncias provisionadas em paralelo. Defaults to 8.
+        """
+        self.instance = instance
+        self.chatwoot = chatwoot
+        self.max_workers = max_workers
+
+    def _current_settings(self, name: str, instance: dict) -> dict | None:
+        # A API v2 já devolve as configurações em fetchInstances; a v1 exige /settings/find.
+        if isinstance(instance.get("Setting"), dict):
+            return instance["Setting"]
+        response = self.instance.find_instance_settings(name, refresh=True)
+        return response_json(response) if response is not None else None
+
+    def _read(self, report: dict, step: str, read):
+        """Lê o estado atual de uma etapa; uma falha (ex: resposta que não é JSON) fica no relatório da etapa."""
+        try:
+            return True, read()
+        except Exception as e:
+            report["errors"][step] = f"Falha ao ler o estado atual: {e}"
+            return False, None
+
+    def _step(self, report: dict, step: str, diff: tuple[list[str], list[str]], apply, dry_run: bool):
+        changed, unverified = diff
+        if unverified:
+            report["unverified"][step] = unverified
+        if not changed:
+            report["unchanged"].append(step)
+            return None
+        report["changes"][step] = changed
+        if dry_run:
+            return None
+        try:
+            response = apply()
+        except Exception as e:
+            report["errors"][step] = str(e)
+            return None
+        if response is None or response.status_code >= 400:
+            status = getattr(response, "status_code", None)
+            report["errors"][step] = f"Falha na requisição (status {status})."
+        return response
+
+    def _provision(self, spec: InstanceSpec, current: dict, dry_run: bool) -> dict:
+        name = spec.name
+        report = {"name": name, "status": "unchanged", "changes": {}, "unchanged": [], "unverified": {}, "errors": {}, "qrcode": None}
+        instance = current.get(name)
+        created = instance is None
+
+        if created:
+            report["changes"]["instance"] = ["create"]
+            if not dry_run and self.instance.create_instance(name, spec.token, spec.number, **(spec.settings or {})) is None:
+                report["errors"]["instance"] = "Falha ao criar a instância."
+                report["status"] = "failed"
+                return report
+            # As configurações vão no payload de criação; webhook e Chatwoot ainda não existem.
+            instance = {"name": name, "connectionStatus": "close"}
+        elif spec.settings is not None:
+            desired = self.instance._instance_params(**spec.settings)
+            ok, current_settings = self._read(report, "settings", lambda: self._current_settings(name, instance))
+            if ok:
+                self._step(
+                    report, "settings", diff_fields(desired, current_settings),
+                    lambda: self.instance.set_instance_settings(**spec.settings, instance_name=name), dry_run
+                )
+
+        if spec.webhook_url is not None:
+            desired = WebhookConfig().set_webhook(spec.webhook_url, spec.webhook_events)["webhook"]
+            ok, current_webhook = (True, None) if created else self._read(report, "webhook", lambda: self.instance.find_webhook(name))
+            if ok:
+                self._step(
+                    report, "webhook", diff_fields(desired, current_webhook),
+                    lambda: self.instance.set_webhook(spec.webhook_url, spec.webhook_events, name), dry_run
+                )
+
+        if spec.chatwoot is not None:
+            desired = self.chatwoot._chatwoot_payload(**spec.chatwoot, name_inbox=name)
+            ok, current_chatwoot = (True, None) if created else self._read(report, "chatwoot", lambda: self.chatwoot.find_chatwoot_integration(name))
+            if ok:
+                self._step(
+                    report, "chatwoot", diff_fields(desired, current_chatwoot),
+                    lambda: self.chatwoot.create_chatwoot_integration(**spec.chatwoot, instance_name=name), dry_run
+                )
+
+        if spec.connect and instance.get("connectionStatus") != "open":
+            response = self._step(report, "connect", (["connect"], []), lambda: self.instance.connect_instance(name), dry_run)
+            if response is not None and response.status_code < 400:
+                _, body = self._read(report, "connect", lambda: response_json(response))
+                report["qrcode"] = (body.get("base64") or body.get("code")) if isinstance(body, dict) else None
+
+        if report["errors"]:
+            report["status"] = "failed"
+        elif created:
+            report["status"] = "created"
+        elif report["changes"]:
+            report["status"] = "updated"
+        return report
+
+    def _provision_safe(self, spec: InstanceSpec, current: dict, dry_run: bool) -> dict:
+        # Um erro inesperado em uma instância não interrompe o provisionamento das demais.
+        try:
+            return self._provision(spec, current, dry_run)
+        except Exception as e:
+            print(f"[ERRO] Provisionamento de '{spec.name}': {e}")
+            return {
+                "name": spec.name, "status": "failed", "changes": {}, "unchanged": [], "unverified": {},
+                "errors": {"instance": str(e)}, "qrcode": None
+            }
+
+    def apply(self, specs: Iterable[InstanceSpec | dict], dry_run: bool = False) -> dict:
+        """
+        Leva as instâncias ao estado descrito em `specs`.
+
+        Args:
+            specs (Iterable[InstanceSpec | dict]): Estado desejado. Dicionários são convertidos com InstanceSpec(**spec),
+                o que permite carregar a frota de um arquivo JSON ou YAML.
+            dry_run (bool): Apenas calcula as diferenças, sem enviar alterações. Defaults to False.
+
+        Returns:
+            dict: Contendo:
+                - instances (list[dict]): Relatório por instância, na ordem de `specs`: status ("created", "updated",
+                  "unchanged" ou "failed"), changes (campos alterados por etapa), unchanged (etapas sem alteração),
+                  unverified (campos ausentes na resposta da API, por etapa, que não puderam ser comparados),
+                  errors (mensagem por etapa, incluindo falhas de leitura do estado atual; um erro em uma instância
+                  não interrompe as demais) e qrcode (da conexão solicitada, se houver).
+                - summary (dict): Quantidade de instâncias por status.
+                - elapsed (float): Duração, em segundos.
+
+        Raises:
+            ValueError: Se alguma spec tiver `chatwoot` e o Provisioner não tiver uma integração Chatwoot.
+            RuntimeError: Se a lista de instâncias não puder ser consultada.
+        """
+        start = perf_counter()
+        specs = [spec if isinstance(spec, InstanceSpec) else InstanceSpec(**spec) for spec in specs]
+        if any(spec.chatwoot is not None for spec in specs) and self.chatwoot is None:
+            raise ValueError("InstanceSpec com chatwoot exige um Provisioner criado com `chatwoot`.")
+        instances = self.instance.fetch_instances(refresh=True)
+        if not isinstance(instances, list):
+            raise RuntimeError("Não foi possível consultar as instâncias do servidor.")
+        current = {instance["name"]: instance for instance in instances}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="provisioner") as pool:
+            reports = list(pool.map(lambda spec: self._provision_safe(spec, current, dry_run), specs))
+
+        summary = {"created": 0, "updated": 0, "unchanged": 0, "failed": 0}
+        for report in reports:
+            summary[report["status"]] += 1
+        return {"instances": reports, "summary": summary, "elapsed": perf_counter() - start}
+
+    def plan(self, specs: Iterable[InstanceSpec | dict]) -> dict:
+        """Atalho para `apply(specs, dry_run=True)`: mostra o que seria alterado."""
+        return self.apply(specs, dry_run=True)
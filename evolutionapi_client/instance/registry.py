@@ -0,0 +1,78 @@
+import threading
+from time import monotonic
+from typing import Any
+
+class InstanceRegistry:
+    def __init__(self, ttl: float = 30, state_ttl: float = 5):
+        """
+        Cache compartilhado, com TTL, das consultas de instâncias feitas pelos gerenciadores.
+
+        Guarda a lista retornada por /instance/fetchInstances e os resultados de get_connection_state e
+        find_instance_settings por instância. O registro não faz requisições: os gerenciadores consultam
+        o cache e, quando a entrada está ausente ou expirada, buscam na API e armazenam o resultado.
+
+        Args:
+            ttl (float): Validade, em segundos, da lista de instâncias e das configurações. Defaults to 30.
+            state_ttl (float): Validade, em segundos, do estado de conexão. Defaults to 5.
+        """
+        self.ttl = ttl
+        self.state_ttl = state_ttl
+        self._instances = None
+        self._instances_at = 0.0
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _ttl_for(self, kind: str) -> float:
+        return self.state_ttl if kind == "state" else self.ttl
+
+    def instances(self) -> list | None:
+        """Retorna a lista de instâncias em cache, ou None se ausente ou expirada."""
+        with self._lock:
+            if self._instances is not None and monotonic() - self._instances_at < self.ttl:
+                return self._instances
+            return None
+
+    def store_instances(self, instances: list):
+        with self._lock:
+            self._instances = instances
+            self._instances_at = monotonic()
+
+    def find(self, instance_name: str) -> dict | None:
+        """Retorna os dados da instância a partir da lista em cache, se ainda válida."""
+        for instance in self.instances() or []:
+            if instance.get("name") == instance_name:
+                return instance
+        return None
+
+    def get(self, kind: str, instance_name: str) -> Any:
+        """
+        Retorna um valor em cache de uma instância.
+
+        Args:
+            kind (str): Tipo do valor ("state" ou "settings").
+            instance_name (str): Nome da instância.
+
+        Returns:
+            Any: O valor em cache, ou None se ausente ou expirado.
+        """
+        with self._lock:
+            entry = self._values.get((kind, instance_name))
+            if entry and monotonic() - entry[1] < self._ttl_for(kind):
+                return entry[0]
+            return None
+
+    def store(self, kind: str, instance_name: str, value: Any):
+        with self._lock:
+            self._values[(kind, instance_name)] = (value, monotonic())
+
+    def invalidate(self, instance_name: str = None):
+        """
+        Descarta o cache de uma instância (e a lista de instâncias), ou todo o cache se `instance_name` for None.
+        """
+        with self._lock:
+            self._instances = None
+            if instance_name is None:
+                self._values.clear()
+            else:
+                for key in [key for key in self._values if key[1] == instance_name]:
+                    del self._values[key]
@@ -0,0 +1,326 @@
+import asyncio
+import inspect
+from typing import Awaitable, Callable
+from evolutionapi_client.serialization import loads
+from .webhook import WebhookEvents
+
+Handler = Callable[[WebhookEvents, dict], Awaitable[None] | None]
+
+def parse_event_name(name: str) -> WebhookEvents | None:
+    """
+    Converte o nome de evento enviado pela EvolutionAPI em um membro de WebhookEvents.
+
+    Aceita o campo "event" do corpo ("messages.upsert"), o sufixo da URL quando webhookByEvents
+    está ativo ("messages-upsert") e o próprio nome do enum ("MESSAGES_UPSERT").
+    """
+    if not name or not isinstance(name, str):
+        return None
+    key = name.strip("/").rsplit("/", 1)[-1].upper().replace(".", "_").replace("-", "_")
+    return WebhookEvents.__members__.get(key)
+
+class BodyTooLarge(Exception):
+    """Corpo da requisição maior que `max_body_bytes`."""
+
+class ReceiverStopped(Exception):
+    """O receptor foi encerrado antes de processar o evento."""
+
+async def read_chunked(reader: asyncio.StreamReader, limit: int) -> bytes:
+    """
+    Lê um corpo com Transfer-Encoding: chunked.
+
+    Raises:
+        BodyTooLarge: Se o corpo passar de `limit` bytes.
+        ValueError: Se o tamanho de um bloco for inválido.
+    """
+    chunks = []
+    total = 0
+    while True:
+        size = int((await reader.readline()).split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            # Trailers opcionais até a linha em branco.
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return b"".join(chunks)
+        total += size
+        if total > limit:
+            raise BodyTooLarge()
+        chunks.append(await reader.readexactly(size))
+        await reader.readline()
+
+class WebhookReceiver:
+    def __init__(self, queue_size: int = 10000, workers: int = 8, ack_fast: bool = True, run_sync_in_thread: bool = True, max_body_bytes: int = 32 * 1024 * 1024):
+        """
+        Receptor de webhooks da EvolutionAPI com fila limitada e pool de workers.
+
+        Pode ser usado como aplicação ASGI (uvicorn, hypercorn...) ou com o servidor HTTP embutido (`serve`).
+        Os handlers são registrados por evento com `on(...)`.
+
+        Args:
+            queue_size (int): Capacidade da fila de eventos pendentes. Defaults to 10000.
+            workers (int): Quantidade de workers processando a fila. Defaults to 8.
+            ack_fast (bool): Responde 200 assim que o evento entra na fila, antes do processamento. Com a fila
+                cheia, responde 503 com Retry-After. Se False, responde após os handlers terminarem. Defaults to True.
+            run_sync_in_thread (bool): Executa handlers síncronos em threads para não bloquear o event loop. Defaults to True.
+            max_body_bytes (int): Tamanho máximo do corpo; maiores recebem 413. Com webhookBase64, o corpo
+                inclui a mídia em base64. Defaults to 32 MiB.
+        """
+        self.queue_size = queue_size
+        self.workers = workers
+        self.ack_fast = ack_fast
+        self.run_sync_in_thread = run_sync_in_thread
+        self.max_body_bytes = max_body_bytes
+        self.stats = {"received": 0, "processed": 0, "rejected": 0, "errors": 0, "unhandled": 0}
+        self._handlers = {}
+        self._queue = None
+        self._tasks = []
+
+    def add_handler(self, event: WebhookEvents | int | str, handler: Handler):
+        """
+        Registra um handler para um evento. O handler recebe (evento, payload) e pode ser síncrono ou assíncrono.
+
+        Args:
+            event (WebhookEvents | int | str): Evento, código numérico (ver WebhookConfig.set_webhook) ou nome.
+            handler (Handler): Função chamada para cada evento recebido.
+        """
+        if isinstance(event, str):
+            member = parse_event_name(event)
+            if member is None:
+                raise ValueError(f"Evento inválido: {event}")
+        else:
+            member = WebhookEvents(event)
+        self._handlers.setdefault(member, []).append(handler)
+
+    def on(self, *events: WebhookEvents | int | str):
+        """
+        Decorator para registrar um handler em um ou mais eventos.
+
+        Exemplo:
+            @receiver.on(WebhookEvents.MESSAGES_UPSERT, WebhookEvents.MESSAGES_UPDATE)
+            async def handle(event, payload): ...
+        """
+        def decorator(handler: Handler) -> Handler:
+            for event in events:
+                self.add_handler(event, handler)
+            return handler
+        return decorator
+
+    async def start(self):
+        """Cria a fila e inicia os workers no event loop atual."""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(self.queue_size)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self, drain: bool = True):
+        """
+        Encerra os workers.
+
+        Sem `drain`, os eventos ainda na fila são descartados; as requisições que aguardam o processamento
+        (`ack_fast=False`) recebem 503 para que a EvolutionAPI reenvie o evento.
+
+        Args:
+            drain (bool): Processa os eventos já enfileirados antes de encerrar. Defaults to True.
+        """
+        if self._queue is None:
+            return
+        if drain:
+            await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        while not self._queue.empty():
+            _, _, done = self._queue.get_nowait()
+            if done is not None and not done.done():
+                done.set_exception(ReceiverStopped())
+        self._queue = None
+        self._tasks = []
+
+    async def _worker(self):
+        while True:
+            event, payload, done = await self._queue.get()
+            try:
+                await self.dispatch(event, payload)
+                # A requisição que aguarda `done` pode ter sido cancelada (cliente desconectou).
+                if done is not None and not done.done():
+                    done.set_result(True)
+            except asyncio.CancelledError:
+                # Worker encerrado por stop() no meio do processamento.
+                if done is not None and not done.done():
+                    done.set_exception(ReceiverStopped())
+                raise
+            except Exception as e:
+                self.stats["errors"] += 1
+                print(f"[ERRO] Webhook {event.name}: {e}")
+                if done is not None and not done.done():
+                    done.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    async def dispatch(self, event: WebhookEvents, payload: dict):
+        """Executa os handlers registrados para o evento."""
+        handlers = self._handlers.get(event)
+        if not handlers:
+            self.stats["unhandled"] += 1
+            return
+        for handler in handlers:
+            if inspect.iscoroutinefunction(handler):
+                await handler(event, payload)
+            elif self.run_sync_in_thread:
+                await asyncio.to_thread(handler, event, payload)
+            else:
+                handler(event, payload)
+        self.stats["processed"] += 1
+
+    async def receive(self, body: bytes, path: str = "") -> tuple[int, bytes]:
+        """
+        Processa o corpo de uma requisição de webhook e retorna o status HTTP e o corpo da resposta.
+
+        Args:
+            body (bytes): Corpo JSON enviado pela EvolutionAPI.
+            path (str, optional): Caminho da requisição, usado quando o corpo não informa o evento. Defaults to "".
+
+        Returns:
+            tuple[int, bytes]: Status HTTP e corpo da resposta.
+        """
+        if len(body) > self.max_body_bytes:
+            return 413, b'{"error":"body too large"}'
+        try:
+            payload = loads(body)
+        except ValueError:
+            return 400, b'{"error":"invalid json"}'
+
+        event = parse_event_name(payload.get("event") if isinstance(payload, dict) else None) or parse_event_name(path)
+        if event is None:
+            return 400, b'{"error":"unknown event"}'
+
+        self.stats["received"] += 1
+        if event not in self._handlers:
+            self.stats["unhandled"] += 1
+            return 200, b'{"status":"ignored"}'
+
+        if self._queue is None:
+            await self.start()
+
+        if self.ack_fast:
+            try:
+                self._queue.put_nowait((event, payload, None))
+            except asyncio.QueueFull:
+                self.stats["rejected"] += 1
+                return 503, b'{"error":"queue full"}'
+            return 200, b'{"status":"queued"}'
+
+        done = asyncio.get_running_loop().create_future()
+        await self._queue.put((event, payload, done))
+        try:
+            await done
+        except ReceiverStopped:
+            return 503, b'{"error":"receiver stopped"}'
+        except Exception:
+            return 500, b'{"error":"handler failed"}'
+        return 200, b'{"status":"processed"}'
+
+    async def __call__(self, scope: dict, receive, send):
+        """Interface ASGI."""
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await self.start()
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await self.stop()
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        if scope["type"] != "http":
+            return
+
+        if scope["method"] != "POST":
+            status, body = (200, b'{"status":"ok"}') if scope["method"] == "GET" else (405, b"")
+        else:
+            chunks = []
+            size = 0
+            more = True
+            while more:
+                message = await receive()
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                if size > self.max_body_bytes:
+                    break
+                chunks.append(chunk)
+                more = message.get("more_body", False)
+            if size > self.max_body_bytes:
+                status, body = 413, b'{"error":"body too large"}'
+            else:
+                status, body = await self.receive(b"".join(chunks), scope.get("path", ""))
+
+        headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+        if status == 503:
+            headers.append((b"retry-after", b"1"))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    if "chunked" in headers.get("transfer-encoding", "").lower():
+                        body = await read_chunked(reader, self.max_body_bytes)
+                    else:
+                        length = int(headers.get("content-length", 0))
+                        if length > self.max_body_bytes:
+                            raise BodyTooLarge()
+                        body = await reader.readexactly(length)
+                except BodyTooLarge:
+                    # O restante do corpo não é lido, então a conexão não pode ser reaproveitada.
+                    status, response, keep_alive = 413, b'{"error":"body too large"}', False
+                else:
+                    if method == "POST":
+                        status, response = await self.receive(body, path)
+                    else:
+                        status, response = (200, b'{"status":"ok"}') if method == "GET" else (405, b"")
+
+                extra = "Retry-After: 1\r\n" if status == 503 else ""
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(response)}\r\n{extra}"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + response
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "0.0.0.0", port: int = 8080):
+        """
+        Inicia o servidor HTTP embutido e atende webhooks até ser cancelado.
+
+        Args:
+            host (str): Endereço de escuta. Defaults to "0.0.0.0".
+            port (int): Porta de escuta. Defaults to 8080.
+        """
+        await self.start()
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.stop()
+
+_REASONS = {
+    200: "OK", 400: "Bad Request", 405: "Method Not Allowed", 413: "Payload Too Large",
+    500: "Internal Server Error", 503: "Service Unavailable"
+}
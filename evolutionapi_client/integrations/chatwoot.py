@@ -1,14 +1,13 @@
 from evolutionapi_client.instance.manager import InstanceManager
-import requests
+from evolutionapi_client.serialization import response_json
 
 class ChatwootIntegration(InstanceManager):
-    def __init__(self, url, api_global_key, instance_name=None):
-        super().__init__(url, api_global_key, instance_name)
+    def __init__(self, url, api_global_key, instance_name=None, transport=None, registry=None):
+        super().__init__(url, api_global_key, instance_name, transport, registry)
 
-    def create_chatwoot_integration(self, account_id:int, chatwoot_token:str, chatwoot_url:str, sign_msg:bool = True, reopen_conversation:bool = True, conversation_pending:bool = False, import_contacts:bool = True, import_messages:bool = True, days_limit_import_messages:int = 1, auto_create:bool = True):
+    def _chatwoot_payload(self, account_id:int, chatwoot_token:str, chatwoot_url:str, sign_msg:bool = True, reopen_conversation:bool = True, conversation_pending:bool = False, import_contacts:bool = True, import_messages:bool = True, days_limit_import_messages:int = 1, auto_create:bool = True, name_inbox:str = None) -> dict:
         chatwoot_url = chatwoot_url.rstrip('/')
-        url = f"{self.base_url}/chatwoot/set/{self.instance_name}"
-        payload = {
+        return {
             "enabled": True,
             "accountId": str(account_id),
             "token": chatwoot_token,
@@ -16,7 +15,7 @@ class ChatwootIntegration(InstanceManager):
             "signMsg": sign_msg,
             "reopenConversation": reopen_conversation, 
             "conversationPending": False,
-            "nameInbox": self.instance_name,
+            "nameInbox": name_inbox or self.instance_name,
             "mergeBrazilContacts": conversation_pending,
             "importContacts": import_contacts,
             "importMessages": import_messages,
@@ -26,10 +25,22 @@ class ChatwootIntegration(InstanceManager):
             "organization": "Ital Leste",
             "logo": ""
         }
-        r = requests.post(url, json=payload, headers=self.headers)
-        status_code = r.status_code
-        print(r.status_code)
 
+    def create_chatwoot_integration(self, account_id:int, chatwoot_token:str, chatwoot_url:str, sign_msg:bool = True, reopen_conversation:bool = True, conversation_pending:bool = False, import_contacts:bool = True, import_messages:bool = True, days_limit_import_messages:int = 1, auto_create:bool = True, instance_name:str = None):
+        name = instance_name or self.instance_name
+        url = f"{self.base_url}/chatwoot/set/{name}"
+        payload = self._chatwoot_payload(
+            account_id, chatwoot_token, chatwoot_url, sign_msg, reopen_conversation, conversation_pending,
+            import_contacts, import_messages, days_limit_import_messages, auto_create, name
+        )
+        r = self.transport.post(url, instance=name, json=payload, headers=self.headers)
+        return r
+
+    def find_chatwoot_integration(self, instance_name:str = None) -> dict | None:
+        """Retorna a integração Chatwoot da instância (None se não houver ou em caso de erro)."""
+        name = instance_name or self.instance_name
+        response = self._request("get", f"/chatwoot/find/{name}", name)
+        return response_json(response) if response is not None else None
 
 if __name__ == '__main__':
     from dotenv import load_dotenv
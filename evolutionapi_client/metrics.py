@@ -0,0 +1,227 @@
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable
+from urllib.parse import urlsplit
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+MetricsHook = Callable[[dict], None]
+
+def endpoint_label(url: str, instance: str = None) -> str:
+    """
+    Converte a URL da requisição no rótulo do endpoint, trocando o nome da instância por "{instance}".
+
+    Ex: "https://api/message/sendText/minha-instancia" -> "/message/sendText/{instance}".
+    """
+    path = urlsplit(url).path or "/"
+    if instance:
+        path = "/".join("{instance}" if segment == instance else segment for segment in path.split("/"))
+    return path
+
+def _body_size(headers) -> int:
+    try:
+        return int(headers.get("Content-Length") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+class Histogram:
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        """Histograma cumulativo no formato do Prometheus (buckets "le", soma e contagem)."""
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + ("+Inf",), self.counts):
+            total += count
+            result.append((str(bound), total))
+        return result
+
+class Metrics:
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS, namespace: str = "evolutionapi"):
+        """
+        Coleta métricas das requisições feitas pelos transportes HTTP.
+
+        Registra, por método e endpoint (com o nome da instância normalizado), histogramas de latência,
+        contadores por status, bytes enviados e recebidos, além do tempo em sleeps dos envios e em fases
+        locais (ex: codificação base64 da mídia). Cada observação também é repassada aos hooks registrados.
+
+        Quando o transporte é criado sem `metrics`, nada é medido.
+
+        Args:
+            buckets (tuple): Limites, em segundos, dos buckets dos histogramas. Defaults to DEFAULT_BUCKETS.
+            namespace (str): Prefixo dos nomes das métricas exportadas. Defaults to "evolutionapi".
+        """
+        self.buckets = buckets
+        self.namespace = namespace
+        self.latency = {}
+        self.requests = {}
+        self.request_bytes = {}
+        self.response_bytes = {}
+        self.sleep_seconds = {}
+        self.phases = {}
+        self._hooks = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: MetricsHook):
+        """
+        Registra uma função chamada com um dicionário a cada observação, por exemplo para repassar a um
+        cliente StatsD ou OpenTelemetry. O campo "type" vale "request", "sleep" ou "phase".
+        """
+        self._hooks.append(hook)
+
+    def _emit(self, event: dict):
+        for hook in self._hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                print(f"[ERRO] Hook de métricas: {e}")
+
+    def _histogram(self, table: dict, key: tuple) -> Histogram:
+        histogram = table.get(key)
+        if histogram is None:
+            histogram = table[key] = Histogram(self.buckets)
+        return histogram
+
+    def observe_request(self, method: str, endpoint: str, status: int | str, seconds: float, request_bytes: int = 0, response_bytes: int = 0):
+        key = (method.upper(), endpoint)
+        with self._lock:
+            self._histogram(self.latency, key).observe(seconds)
+            self.requests[key + (str(status),)] = self.requests.get(key + (str(status),), 0) + 1
+            self.request_bytes[key] = self.request_bytes.get(key, 0) + request_bytes
+            self.response_bytes[key] = self.response_bytes.get(key, 0) + response_bytes
+        if self._hooks:
+            self._emit({
+                "type": "request", "method": key[0], "endpoint": endpoint, "status": status, "seconds": seconds,
+                "request_bytes": request_bytes, "response_bytes": response_bytes
+            })
+
+    def observe_sleep(self, seconds: float, reason: str = "delay"):
+        with self._lock:
+            self.sleep_seconds[reason] = self.sleep_seconds.get(reason, 0.0) + seconds
+        if self._hooks:
+            self._emit({"type": "sleep", "reason": reason, "seconds": seconds})
+
+    def observe_phase(self, phase: str, seconds: float):
+        with self._lock:
+            self._histogram(self.phases, (phase,)).observe(seconds)
+        if self._hooks:
+            self._emit({"type": "phase", "phase": phase, "seconds": seconds})
+
+    @contextmanager
+    def phase(self, name: str):
+        """Mede o bloco como uma fase local (ex: "encode")."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_phase(name, perf_counter() - start)
+
+    def _record(self, method: str, endpoint: str, start: float, response=None, error: Exception = None):
+        seconds = perf_counter() - start
+        if response is None:
+            self.observe_request(method, endpoint, type(error).__name__, seconds)
+            return
+        response_bytes = _body_size(response.headers) or len(response.content)
+        self.observe_request(method, endpoint, response.status_code, seconds, _body_size(response.request.headers), response_bytes)
+
+    def instrument(self, send: Callable, method: str, endpoint: str) -> Callable:
+        """Envolve uma tentativa de requisição síncrona para medi-la."""
+        def measured():
+            start = perf_counter()
+            try:
+                response = send()
+            except Exception as e:
+                self._record(method, endpoint, start, error=e)
+                raise
+            self._record(method, endpoint, start, response)
+            return response
+        return measured
+
+    def ainstrument(self, send: Callable, method: str, endpoint: str) -> Callable:
+        """Versão assíncrona de `instrument`."""
+        async def measured():
+            start = perf_counter()
+            try:
+                response = await send()
+            except Exception as e:
+                self._record(method, endpoint, start, error=e)
+                raise
+            self._record(method, endpoint, start, response)
+            return response
+        return measured
+
+    def render_prometheus(self) -> str:
+        """Exporta as métricas no formato de texto do Prometheus."""
+        ns = self.namespace
+        lines = []
+
+        def labels(**values) -> str:
+            return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in values.items()) + "}"
+
+        def histogram(name: str, help_text: str, table: dict, label_names: tuple):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for key, hist in sorted(table.items()):
+                base = dict(zip(label_names, key))
+                for bound, count in hist.cumulative():
+                    lines.append(f"{name}_bucket{labels(**base, le=bound)} {count}")
+                lines.append(f"{name}_sum{labels(**base)} {hist.sum}")
+                lines.append(f"{name}_count{labels(**base)} {hist.count}")
+
+        def counter(name: str, help_text: str, table: dict, label_names: tuple):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for key, value in sorted(table.items()):
+                key = key if isinstance(key, tuple) else (key,)
+                lines.append(f"{name}{labels(**dict(zip(label_names, key)))} {value}")
+
+        with self._lock:
+            histogram(f"{ns}_request_duration_seconds", "Duração de cada tentativa de requisição.", self.latency, ("method", "endpoint"))
+            counter(f"{ns}_requests_total", "Requisições por status (ou nome da exceção).", self.requests, ("method", "endpoint", "status"))
+            counter(f"{ns}_request_bytes_total", "Bytes enviados no corpo das requisições.", self.request_bytes, ("method", "endpoint"))
+            counter(f"{ns}_response_bytes_total", "Bytes recebidos no corpo das respostas.", self.response_bytes, ("method", "endpoint"))
+            counter(f"{ns}_sleep_seconds_total", "Tempo em sleeps forçados dos envios.", self.sleep_seconds, ("reason",))
+            histogram(f"{ns}_phase_duration_seconds", "Duração de fases locais (ex: codificação da mídia).", self.phases, ("phase",))
+        return "\n".join(lines) + "\n"
+
+    def serve(self, host: str = "0.0.0.0", port: int = 9464):
+        """
+        Inicia, em uma thread, um servidor HTTP que responde o texto do Prometheus em qualquer caminho.
+
+        Returns:
+            ThreadingHTTPServer: O servidor iniciado (use `shutdown()` para encerrar).
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.render_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics-exporter", daemon=True).start()
+        return server
@@ -0,0 +1,311 @@
+import asyncio
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from time import monotonic, sleep, time
+from typing import Awaitable, Callable, Hashable
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "PUT", "DELETE", "OPTIONS")
+
+class CircuitOpenError(Exception):
+    """Requisição recusada localmente porque o circuito da instância está aberto."""
+
+    def __init__(self, key: Hashable, retry_in: float):
+        super().__init__(f"Circuito aberto para '{key}'. Nova tentativa em {retry_in:.1f}s.")
+        self.key = key
+        self.retry_in = retry_in
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30,
+        jitter: bool = True,
+        safe_statuses: tuple = (429, 503),
+        retry_statuses: tuple = (500, 502, 504),
+        budget_ratio: float = 0.2,
+        budget_max: int = 10
+    ):
+        """
+        Define quando e quanto esperar antes de repetir uma requisição.
+
+        Status em `safe_statuses` indicam que o servidor não processou a requisição e são repetidos para
+        qualquer método. Status em `retry_statuses` e erros após a conexão estabelecida só são repetidos para
+        métodos idempotentes, evitando mensagens duplicadas em POSTs. Falhas ao conectar são sempre repetidas.
+
+        Args:
+            max_retries (int): Tentativas extras por requisição. Defaults to 3.
+            backoff_base (float): Espera base, em segundos, dobrada a cada tentativa. Defaults to 0.5.
+            backoff_max (float): Espera máxima, inclusive para o header Retry-After. Defaults to 30.
+            jitter (bool): Sorteia a espera entre 0 e o backoff calculado ("full jitter"). Defaults to True.
+            safe_statuses (tuple): Status repetidos para qualquer método. Defaults to (429, 503).
+            retry_statuses (tuple): Status repetidos apenas para métodos idempotentes. Defaults to (500, 502, 504).
+            budget_ratio (float): Retentativas permitidas por requisição realizada, limitando tempestades de retry. Defaults to 0.2.
+            budget_max (int): Saldo inicial e máximo do orçamento de retentativas. Defaults to 10.
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.safe_statuses = safe_statuses
+        self.retry_statuses = retry_statuses
+        self.budget_ratio = budget_ratio
+        self.budget_max = budget_max
+
+    def should_retry(self, method: str, status: int = None, connect_failed: bool = False, error: bool = False) -> bool:
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        if connect_failed:
+            return True
+        if error:
+            return idempotent
+        if status in self.safe_statuses:
+            return True
+        return status in self.retry_statuses and idempotent
+
+    def backoff(self, attempt: int, retry_after: str = None) -> float:
+        """
+        Calcula a espera antes da tentativa `attempt` (1 = primeira retentativa).
+
+        O header Retry-After, em segundos ou data HTTP, tem prioridade sobre o backoff exponencial.
+        """
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(max(delay, 0.0), self.backoff_max)
+
+        delay = min(self.backoff_base * 2 ** (attempt - 1), self.backoff_max)
+        return random.uniform(0, delay) if self.jitter else delay
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30, on_transition: Callable[[str], None] = None):
+        """
+        Circuito que falha rápido após falhas consecutivas e volta a testar o servidor após `recovery_timeout`.
+
+        Args:
+            failure_threshold (int): Falhas consecutivas (5xx, 429 ou erro de conexão) para abrir o circuito. Defaults to 5.
+            recovery_timeout (float): Segundos com o circuito aberto antes de liberar uma requisição de teste. Defaults to 30.
+            on_transition (Callable[[str], None], optional): Chamado com o novo estado a cada mudança. Defaults to None.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.on_transition = on_transition
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def _set_state(self, state: str):
+        if state != self.state:
+            self.state = state
+            if self.on_transition:
+                self.on_transition(state)
+
+    def allow(self) -> float:
+        """
+        Verifica se uma requisição pode ser feita.
+
+        Returns:
+            float: 0 se liberada; caso contrário, segundos até a próxima tentativa de teste.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return 0.0
+            remaining = self.opened_at + self.recovery_timeout - monotonic()
+            if self.state == self.OPEN and remaining <= 0:
+                self._set_state(self.HALF_OPEN)
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return 0.0
+            return max(remaining, 0.01)
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._probing = False
+            self._set_state(self.CLOSED)
+
+    def release_probe(self):
+        """Libera o teste do estado meio-aberto sem registrar resultado (tentativa cancelada ou interrompida)."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.opened_at = monotonic()
+                self._set_state(self.OPEN)
+
+class Resilience:
+    def __init__(self, retry: RetryPolicy = None, failure_threshold: int = 5, recovery_timeout: float = 30):
+        """
+        Camada central de resiliência usada pelos transportes HTTP: retentativas com backoff e jitter,
+        respeito ao Retry-After, orçamento global de retentativas e um circuit breaker por instância.
+
+        Args:
+            retry (RetryPolicy, optional): Política de retentativas. Defaults to RetryPolicy().
+            failure_threshold (int): Falhas consecutivas para abrir o circuito de uma instância. Defaults to 5.
+            recovery_timeout (float): Segundos até testar novamente uma instância com circuito aberto. Defaults to 30.
+        """
+        self.retry = retry or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.counters = {
+            "requests": 0,
+            "retries": 0,
+            "retries_exhausted": 0,
+            "budget_exhausted": 0,
+            "short_circuited": 0,
+            "breaker_open": 0,
+            "breaker_half_open": 0,
+            "breaker_closed": 0
+        }
+        self._budget = float(self.retry.budget_max)
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def _count(self, name: str):
+        with self._lock:
+            self.counters[name] += 1
+
+    def breaker(self, key: Hashable) -> CircuitBreaker:
+        """Retorna o circuit breaker da instância `key`, criando-o se necessário."""
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    self.failure_threshold,
+                    self.recovery_timeout,
+                    lambda state: self._count(f"breaker_{state}")
+                )
+                self._breakers[key] = breaker
+            return breaker
+
+    def breaker_states(self) -> dict:
+        """Estado atual ("closed", "open", "half_open") do circuito de cada instância."""
+        with self._lock:
+            return {key: breaker.state for key, breaker in self._breakers.items()}
+
+    def _spend_retry(self) -> bool:
+        with self._lock:
+            if self._budget < 1:
+                self.counters["budget_exhausted"] += 1
+                return False
+            self._budget -= 1
+            self.counters["retries"] += 1
+            return True
+
+    def _before_attempt(self, key: Hashable) -> CircuitBreaker:
+        breaker = self.breaker(key)
+        retry_in = breaker.allow()
+        if retry_in:
+            self._count("short_circuited")
+            raise CircuitOpenError(key, retry_in)
+        with self._lock:
+            self.counters["requests"] += 1
+            self._budget = min(self._budget + self.retry.budget_ratio, self.retry.budget_max)
+        return breaker
+
+    def _after_attempt(self, breaker: CircuitBreaker, method: str, attempt: int, response=None, error: Exception = None, connect_failed: bool = False) -> float | None:
+        """Atualiza o circuito e retorna a espera antes da próxima tentativa, ou None se não deve repetir."""
+        status = getattr(response, "status_code", None)
+        failed = error is not None or status == 429 or (status is not None and status >= 500)
+        if failed:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+            return None
+        if breaker.state == CircuitBreaker.OPEN:
+            # O circuito abriu nesta tentativa: devolve a última resposta em vez de insistir.
+            return None
+
+        if not self.retry.should_retry(method, status, connect_failed, error is not None and not connect_failed):
+            return None
+        if attempt > self.retry.max_retries:
+            self._count("retries_exhausted")
+            return None
+        if not self._spend_retry():
+            return None
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        return self.retry.backoff(attempt, retry_after)
+
+    def call(self, method: str, key: Hashable, send: Callable[[], object], connect_error: Callable[[Exception], bool], before_retry: Callable[[], None] = None):
+        """
+        Executa `send()` com retentativas e circuit breaker (versão síncrona).
+
+        Args:
+            method (str): Método HTTP, usado para decidir se a requisição é idempotente.
+            key (Hashable): Chave do circuito, normalmente o nome da instância.
+            send (Callable[[], object]): Realiza uma tentativa e retorna a resposta.
+            connect_error (Callable[[Exception], bool]): Indica se a exceção ocorreu antes de a requisição ser enviada.
+            before_retry (Callable[[], None], optional): Chamado antes de cada retentativa (ex: rebobinar o corpo). Defaults to None.
+
+        Returns:
+            object: A última resposta obtida.
+
+        Raises:
+            CircuitOpenError: Se o circuito da instância estiver aberto.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            breaker = self._before_attempt(key)
+            try:
+                response = send()
+            except Exception as e:
+                wait = self._after_attempt(breaker, method, attempt, error=e, connect_failed=connect_error(e))
+                if wait is None:
+                    raise
+            except BaseException:
+                # CancelledError ou KeyboardInterrupt: sem isso o teste meio-aberto ficaria preso para sempre.
+                breaker.release_probe()
+                raise
+            else:
+                wait = self._after_attempt(breaker, method, attempt, response=response)
+                if wait is None:
+                    return response
+            sleep(wait)
+            if before_retry:
+                before_retry()
+
+    async def acall(self, method: str, key: Hashable, send: Callable[[], Awaitable], connect_error: Callable[[Exception], bool], before_retry: Callable[[], None] = None):
+        """Versão assíncrona de `call`; as esperas usam asyncio.sleep."""
+        attempt = 0
+        while True:
+            attempt += 1
+            breaker = self._before_attempt(key)
+            try:
+                response = await send()
+            except Exception as e:
+                wait = self._after_attempt(breaker, method, attempt, error=e, connect_failed=connect_error(e))
+                if wait is None:
+                    raise
+            except BaseException:
+                # CancelledError ou KeyboardInterrupt: sem isso o teste meio-aberto ficaria preso para sempre.
+                breaker.release_probe()
+                raise
+            else:
+                wait = self._after_attempt(breaker, method, attempt, response=response)
+                if wait is None:
+                    return response
+            await asyncio.sleep(wait)
+            if before_retry:
+                before_retry()
+
+    def stats(self) -> dict:
+        """Contadores de requisições, retentativas e mudanças de estado dos circuitos."""
+        with self._lock:
+            return dict(self.counters)
@@ -0,0 +1,273 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from time import time
+from typing import Callable, Iterable
+from evolutionapi_client.tools.func_chat import validate_number, calculate_send_delay
+from evolutionapi_client.send.scheduler import SendScheduler
+from evolutionapi_client.send.existence import not_on_whatsapp
+
+class TextSpec:
+    def __init__(self, message: str, link_preview: bool = False):
+        """
+        Mensagem de texto de uma campanha.
+
+        Args:
+            message (str): Texto a ser enviado.
+            link_preview (bool, optional): Define se a mensagem deve conter prévia de link. Defaults to False.
+        """
+        self.message = message
+        self.link_preview = link_preview
+
+    def sender(self, client) -> Callable[[str], dict]:
+        # O payload é serializado uma vez; cada envio só insere o número (já normalizado por Campaign.run).
+        template = client.message.prepare_text_message(self.message, self.link_preview)
+        return lambda number: client.message.send_prepared(template, number, delay=0)
+
+class MediaSpec:
+    def __init__(self, file_path: str, file_name: str = "", caption: str = "", max_size_mb: float = None):
+        """
+        Mídia de uma campanha.
+
+        Args:
+            file_path (str): Caminho do arquivo a ser enviado.
+            file_name (str, optional): Nome do arquivo exibido ao destinatário. Defaults to "".
+            caption (str, optional): Legenda da mídia. Defaults to "".
+            max_size_mb (float, optional): Limite de tamanho repassado a send_media. Defaults to None.
+        """
+        self.file_path = file_path
+        self.file_name = file_name
+        self.caption = caption
+        self.max_size_mb = max_size_mb
+
+    def sender(self, client) -> Callable[[str], dict]:
+        pipeline = getattr(client.media, "image_pipeline", None)
+        if pipeline is not None and os.path.isfile(self.file_path):
+            # Pré-processa antes do primeiro envio; os envios seguintes encontram o resultado em cache.
+            pipeline.process(self.file_path)
+        return lambda number: client.media.send_media(
+            number, self.file_path, self.file_name, self.caption, delay=0, max_size_mb=self.max_size_mb
+        )
+
+def parse_send_result(response) -> dict:
+    """
+    Extrai status, ID da mensagem e erro da resposta de um método de envio.
+
+    Aceita tanto o JSON cru retornado por send_text_message quanto o dicionário padronizado de get_api_response.
+
+    Returns:
+        dict: Contendo `ok` (bool), `status` (int | None), `message_id` (str | None) e `error` (str | None).
+    """
+    if not isinstance(response, dict):
+        return {"ok": False, "status": None, "message_id": None, "error": f"Resposta inesperada: {response!r}"}
+
+    if "success" in response:
+        ok = bool(response["success"])
+        status = response.get("status_code")
+        body = response.get("response")
+        error = None if ok else response.get("message")
+    else:
+        body = response
+        ok = "key" in response
+        status = response.get("status")
+        error = None if ok else (response.get("error") or json.dumps(response.get("response"), ensure_ascii=False))
+
+    message_id = None
+    if isinstance(body, dict) and isinstance(body.get("key"), dict):
+        message_id = body["key"].get("id")
+    return {"ok": ok, "status": status, "message_id": message_id, "error": error}
+
+class Campaign:
+    # Estados finais registrados no journal; destinatários nesses estados nunca são reenviados.
+    FINAL_STATES = ("sent", "failed", "invalid")
+
+    def __init__(
+        self,
+        client,
+        spec: TextSpec | MediaSpec,
+        journal_path: str,
+        max_workers: int = 4,
+        max_in_flight: int = None,
+        delay_policy: Callable[[int], float] = calculate_send_delay,
+        retry_unknown: bool = False,
+        fsync: bool = False
+    ):
+        """
+        Envio em massa com journal append-only e retomada após falhas.
+
+        Cada destinatário gera uma linha "sending" antes do envio e uma linha com o resultado depois.
+        Ao reiniciar, destinatários com resultado registrado são pulados. Os que ficaram apenas como
+        "sending" (processo caiu durante o envio) têm status desconhecido e, por padrão, não são
+        reenviados para evitar mensagens duplicadas.
+
+        Args:
+            client (EvolutionAPIClient): Cliente com a instância já setada.
+            spec (TextSpec | MediaSpec): Conteúdo a ser enviado.
+            journal_path (str): Caminho do arquivo JSONL de journal.
+            max_workers (int): Requisições simultâneas. Defaults to 4.
+            max_in_flight (int, optional): Destinatários lidos do iterável e ainda não concluídos. Defaults to max_workers * 4.
+            delay_policy (Callable[[int], float]): Espaçamento entre envios da instância. Defaults to calculate_send_delay.
+            retry_unknown (bool): Reenvia destinatários com status desconhecido. Defaults to False.
+            fsync (bool): Força gravação em disco a cada linha do journal. Defaults to False.
+        """
+        self.client = client
+        self.spec = spec
+        self.journal_path = journal_path
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight or max_workers * 4
+        self.delay_policy = delay_policy
+        self.retry_unknown = retry_unknown
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._journal = None
+
+    def prefetch(self, recipients: Iterable[str | int], batch_size: int = 200) -> dict:
+        """
+        Verifica em lote quais destinatários estão no WhatsApp antes de iniciar a campanha.
+
+        Os números ausentes ficam no cache de existência do cliente e são registrados como "invalid" por `run`
+        sem requisição nem intervalo de envio.
+
+        Returns:
+            dict: {número normalizado: está no WhatsApp}.
+
+        Raises:
+            ValueError: Se o cliente não tiver um cache de existência (`existence_cache`).
+        """
+        if self.client.existence_cache is None:
+            raise ValueError("prefetch exige um cliente criado com `existence_cache` (ex: ExistenceCache()).")
+        return self.client.existence_cache.prefetch(self.client.instance, recipients, batch_size)
+
+    def _iter_journal(self):
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, "r", encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Última linha truncada por uma queda do processo.
+                    continue
+                yield entry["recipient"], entry["state"]
+
+    def load_journal(self) -> dict:
+        """
+        Lê o journal e retorna o último estado registrado de cada destinatário.
+
+        Returns:
+            dict: Mapeia o número normalizado para o estado ("sending", "sent", "failed", "invalid").
+        """
+        return dict(self._iter_journal())
+
+    def _open_index(self) -> tuple[sqlite3.Connection, str]:
+        """
+        Carrega o último estado de cada destinatário do journal em um índice SQLite temporário em disco.
+
+        `run` consulta e atualiza o índice em vez de um dicionário, então a memória não cresce com a quantidade
+        de destinatários já registrados ou processados.
+        """
+        fd, path = tempfile.mkstemp(suffix=".sqlite", prefix="campaign-")
+        os.close(fd)
+        index = sqlite3.connect(path)
+        index.execute("PRAGMA journal_mode=OFF")
+        index.execute("PRAGMA synchronous=OFF")
+        index.execute("CREATE TABLE states (recipient TEXT PRIMARY KEY, state TEXT NOT NULL) WITHOUT ROWID")
+        index.executemany("INSERT OR REPLACE INTO states VALUES (?, ?)", self._iter_journal())
+        return index, path
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.journal_path, "rb") as journal:
+            journal.seek(-1, os.SEEK_END)
+            return journal.read(1) == b"\n"
+
+    def _write(self, entry: dict):
+        entry["ts"] = time()
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._journal.write(line)
+            self._journal.flush()
+            if self.fsync:
+                os.fsync(self._journal.fileno())
+
+    def _send(self, send: Callable[[str], dict], recipient: str):
+        self._write({"recipient": recipient, "state": "sending"})
+        missing = False
+        try:
+            response = send(recipient)
+            result = parse_send_result(response)
+            missing = bool(not_on_whatsapp(response))
+        except Exception as e:
+            result = {"ok": False, "status": None, "message_id": None, "error": str(e)}
+        state = "sent" if result.pop("ok") else "invalid" if missing else "failed"
+        self._write({"recipient": recipient, "state": state, **result})
+        return state
+
+    def run(self, recipients: Iterable[str | int]) -> dict:
+        """
+        Executa (ou retoma) a campanha.
+
+        Args:
+            recipients (Iterable[str | int]): Destinatários, consumidos de forma preguiçosa.
+
+        Returns:
+            dict: Contagem de destinatários por resultado nesta execução:
+                sent, failed, invalid, skipped (já concluídos ou repetidos) e unknown (status desconhecido não reenviado).
+        """
+        summary = {"sent": 0, "failed": 0, "invalid": 0, "skipped": 0, "unknown": 0}
+        send = self.spec.sender(self.client)
+        existence = getattr(self.client, "existence_cache", None)
+        in_flight = threading.BoundedSemaphore(self.max_in_flight)
+
+        def done(future):
+            in_flight.release()
+            try:
+                state = future.result()
+            except Exception:
+                state = "failed"
+            with self._lock:
+                summary[state] += 1
+
+        self._journal = open(self.journal_path, "a", encoding="utf-8")
+        if self._journal.tell() and not self._ends_with_newline():
+            # Isola a linha truncada deixada por uma queda para não corromper a próxima.
+            self._journal.write("\n")
+        index, index_path = self._open_index()
+        scheduler = SendScheduler(self.delay_policy, max_workers=self.max_workers)
+        try:
+            for raw in recipients:
+                number = validate_number(raw)
+                recipient = number or str(raw)
+                row = index.execute("SELECT state FROM states WHERE recipient = ?", (recipient,)).fetchone()
+                previous = row[0] if row else None
+
+                if previous in self.FINAL_STATES or previous == "queued":
+                    summary["skipped"] += 1
+                    continue
+                if previous == "sending" and not self.retry_unknown:
+                    summary["unknown"] += 1
+                    index.execute("INSERT OR REPLACE INTO states VALUES (?, 'queued')", (recipient,))
+                    continue
+
+                index.execute("INSERT OR REPLACE INTO states VALUES (?, 'queued')", (recipient,))
+                if number is None:
+                    self._write({"recipient": recipient, "state": "invalid", "status": None, "message_id": None, "error": "Número inválido."})
+                    summary["invalid"] += 1
+                    continue
+                if existence is not None and existence.is_known_missing(number):
+                    # Pulado antes do agendador para não consumir um intervalo de envio da instância.
+                    self._write({"recipient": recipient, "state": "invalid", "status": None, "message_id": None, "error": "Número não está no WhatsApp (cache)."})
+                    summary["invalid"] += 1
+                    continue
+
+                in_flight.acquire()
+                future = scheduler.submit(self._send, send, recipient, key=self.client.instance.instance_name)
+                future.add_done_callback(done)
+        finally:
+            scheduler.shutdown(wait=True)
+            self._journal.close()
+            self._journal = None
+            index.close()
+            os.remove(index_path)
+        return summary
@@ -0,0 +1,159 @@
+import sqlite3
+import threading
+from time import time
+from typing import Iterable
+from evolutionapi_client.tools.func_chat import validate_number
+from evolutionapi_client.serialization import response_json
+
+DAY = 24 * 60 * 60
+
+def not_on_whatsapp(response) -> list[str]:
+    """
+    Extrai da resposta de erro de um envio os números que não estão no WhatsApp.
+
+    Aceita o JSON cru de send_text_message e o dicionário padronizado de get_api_response, cujo erro traz
+    `response.message[]` com `exists == False`.
+
+    Returns:
+        list[str]: Números informados com `exists == False` (lista vazia se a resposta não indicar isso).
+    """
+    if not isinstance(response, dict):
+        return []
+    body = response.get("response")
+    if "success" in response and isinstance(body, dict):
+        body = body.get("response")
+    messages = body.get("message") if isinstance(body, dict) else None
+    if not isinstance(messages, list):
+        return []
+    return [str(item.get("number")) for item in messages if isinstance(item, dict) and item.get("exists") is False]
+
+def missing_response(number: str) -> dict:
+    """Resposta no formato de erro da API para um envio pulado porque o número não está no WhatsApp."""
+    return {
+        "status": 400,
+        "error": "Bad Request",
+        "response": {"message": [{"exists": False, "jid": f"{number}@s.whatsapp.net", "number": number}]},
+        "cached": True
+    }
+
+class ExistenceCache:
+    def __init__(self, db_path: str = ":memory:", negative_ttl: float = 7 * DAY, positive_ttl: float = DAY):
+        """
+        Cache persistente, com TTL, de quais números estão ou não no WhatsApp.
+
+        As chaves são os números normalizados por validate_number. Os senders consultam o cache antes de enviar
+        e pulam, sem requisição nem delay, os números que sabidamente não estão no WhatsApp.
+
+        Args:
+            db_path (str): Arquivo SQLite do cache. Defaults to ":memory:" (apenas durante a execução).
+            negative_ttl (float): Validade, em segundos, de um "não está no WhatsApp". Defaults to 7 dias.
+            positive_ttl (float): Validade, em segundos, de um "está no WhatsApp". Defaults to 1 dia.
+        """
+        self.negative_ttl = negative_ttl
+        self.positive_ttl = positive_ttl
+        self.skipped = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS numbers (number TEXT PRIMARY KEY, exists_ INTEGER NOT NULL, checked_at REAL NOT NULL)")
+
+    def get(self, number: str) -> bool | None:
+        """
+        Consulta um número normalizado.
+
+        Returns:
+            bool | None: True/False se houver resultado válido em cache, None se desconhecido ou expirado.
+        """
+        with self._lock:
+            row = self._db.execute("SELECT exists_, checked_at FROM numbers WHERE number = ?", (number,)).fetchone()
+        if row is None:
+            return None
+        exists, checked_at = bool(row[0]), row[1]
+        return exists if time() - checked_at < (self.positive_ttl if exists else self.negative_ttl) else None
+
+    def set_many(self, results: dict[str, bool]):
+        """Registra o resultado de vários números normalizados ({número: está no WhatsApp})."""
+        now = time()
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO numbers VALUES (?, ?, ?)",
+                [(number, int(exists), now) for number, exists in results.items()]
+            )
+
+    def set(self, number: str, exists: bool):
+        self.set_many({number: exists})
+
+    def is_known_missing(self, number: str) -> bool:
+        """Indica se o número sabidamente não está no WhatsApp; conta o envio evitado."""
+        if self.get(number) is False:
+            with self._lock:
+                self.skipped += 1
+            return True
+        return False
+
+    def record_response(self, number: str, response) -> bool:
+        """
+        Registra o número como ausente do WhatsApp se a resposta do envio indicar `exists == False` para ele.
+
+        Apenas o próprio número é comparado (normalizado por validate_number); respostas de erro que citam
+        outros números não alteram o cache.
+
+        Returns:
+            bool: True se o número foi registrado como ausente.
+        """
+        number = validate_number(number)
+        if number is None:
+            return False
+        missing = {validate_number(item) for item in not_on_whatsapp(response)}
+        if number in missing:
+            self.set(number, False)
+            return True
+        return False
+
+    def prefetch(self, manager, numbers: Iterable[str | int], batch_size: int = 200) -> dict[str, bool]:
+        """
+        Verifica em lote, por /chat/whatsappNumbers, os números ainda desconhecidos (ou expirados) do cache.
+
+        Args:
+            manager (InstanceManager): Gerenciador com a instância setada (usa seu transporte e headers).
+            numbers (Iterable[str | int]): Destinatários da campanha; números inválidos são ignorados.
+            batch_size (int): Números por requisição. Defaults to 200.
+
+        Returns:
+            dict[str, bool]: Resultado de todos os números válidos informados, vindos do cache ou da API.
+        """
+        results = {}
+        unknown = []
+        for raw in numbers:
+            number = validate_number(raw)
+            if number is None or number in results:
+                continue
+            cached = self.get(number)
+            if cached is None:
+                unknown.append(number)
+                results[number] = None
+            else:
+                results[number] = cached
+
+        url = f"{manager.base_url}/chat/whatsappNumbers/{manager.instance_name}"
+        for start in range(0, len(unknown), batch_size):
+            batch = unknown[start:start + batch_size]
+            try:
+                response = manager.transport.post(url, instance=manager.instance_name, json={"numbers": batch}, headers=manager.headers)
+                response.raise_for_status()
+                checked = {str(item.get("number")): bool(item.get("exists")) for item in response_json(response) if isinstance(item, dict)}
+            except Exception as e:
+                print(f"[ERRO] Falha ao verificar números no WhatsApp: {e}")
+                continue
+            found = {number: checked[number] for number in batch if number in checked}
+            self.set_many(found)
+            results.update(found)
+        return {number: exists for number, exists in results.items() if exists is not None}
+
+    def stats(self) -> dict:
+        """Quantidade de números em cache por resultado e de envios evitados."""
+        with self._lock:
+            rows = dict(self._db.execute("SELECT exists_, COUNT(*) FROM numbers GROUP BY exists_").fetchall())
+        return {"exists": rows.get(1, 0), "missing": rows.get(0, 0), "skipped_sends": self.skipped}
+
+    def close(self):
+        self._db.close()
@@ -1,5 +1,6 @@
 from evolutionapi_client.instance.manager import InstanceManager
 from evolutionapi_client.tools.func_chat import validate_number
+from evolutionapi_client.serialization import PayloadTemplate, response_json
 import requests
 from typing import Optional, List, Dict, Any
 
@@ -8,6 +9,7 @@ class SendLocation:
         self.base_url = instance.base_url
         self.headers = instance.headers
         self.instance_name = instance.instance_name
+        self.transport = instance.transport
 
     def _location_payload(
         self,
@@ -55,20 +57,46 @@ class SendLocation:
         quoted: Optional[Dict[str, Any]] = None
     ) -> dict:
         number = validate_number(number)
-        url = f"{self.base_url}/message/sendLocation/{self.instance_name}"
         payload = self._location_payload(
             number, name, address, latitude, longitude,
             delay, link_preview, mentionsEveryOne, mentioned, quoted
         )
+        return self._post_location({"json": payload})
 
+    def _post_location(self, body: dict) -> dict:
+        url = f"{self.base_url}/message/sendLocation/{self.instance_name}"
+        response = None
         try:
-            response = requests.post(url, json=payload, headers=self.headers)
+            response = self.transport.post(url, instance=self.instance_name, headers=self.headers, **body)
             response.raise_for_status()
-            return response.json()
+            return response_json(response)
         except requests.RequestException as e:
             return {
                 "success": False,
-                "status_code": response.status_code if response else None,
+                "status_code": response.status_code if response is not None else None,
                 "message": str(e),
                 "response": getattr(response, "text", None)
             }
+
+    def prepare_location(
+        self,
+        name: str,
+        address: str,
+        latitude: float,
+        longitude: float,
+        delay: int = 1000,
+        link_preview: bool = True,
+        mentionsEveryOne: Optional[List[str]] = None,
+        mentioned: Optional[List[str]] = None,
+        quoted: Optional[Dict[str, Any]] = None
+    ) -> PayloadTemplate:
+        """Pré-serializa uma localização para envio em massa com `send_prepared`."""
+        payload = self._location_payload(
+            "", name, address, latitude, longitude,
+            delay, link_preview, mentionsEveryOne, mentioned, quoted
+        )
+        return PayloadTemplate(payload, "number")
+
+    def send_prepared(self, template: PayloadTemplate, number: str) -> dict:
+        """Envia uma localização preparada por `prepare_location` para um número já normalizado."""
+        return self._post_location({"data": template.render(number)})
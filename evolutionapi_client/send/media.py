@@ -1,89 +1,177 @@
 from evolutionapi_client.instance.manager import InstanceManager
 from evolutionapi_client.tools.func_chat import validate_number
-from evolutionapi_client.tools.func_tools import get_file_size_mb, get_api_response, convert_to_base64
-import requests
+from evolutionapi_client.tools.func_tools import get_file_size_mb, get_api_response, get_media_info, media_body_kwargs, compress_to_target
+from evolutionapi_client.tools.media_cache import MediaCache
+from evolutionapi_client.tools.file_server import FileServer
+from evolutionapi_client.tools.image_pipeline import ImagePipeline
+from evolutionapi_client.send.existence import ExistenceCache, missing_response
 import os
-import mimetypes
-from time import sleep
+import threading
 
 class SendMedia():
-    def __init__(self, instance: InstanceManager):
+    # Arquivos maiores que este limite (em MB) são codificados em streaming durante o upload.
+    stream_threshold_mb = 5
+    # Com servidor de arquivos, arquivos maiores que este limite (em MB) são enviados por URL, sem upload.
+    url_threshold_mb = 1
+    # Diretório onde _fit_to_size guarda e reaproveita as versões comprimidas (exige cache de mídia).
+    # None (padrão) usa arquivos temporários, apagados após cada envio.
+    compressed_dir = None
+
+    def __init__(self, instance: InstanceManager, media_cache: MediaCache = None, existence_cache: ExistenceCache = None, file_server: FileServer = None, image_pipeline: ImagePipeline = None):
         self.base_url = instance.base_url
         self.headers = instance.headers
         self.api_global_key = instance.api_global_key
         self.instance_name = instance.instance_name
+        self.transport = instance.transport
+        self.media_cache = media_cache
+        self.existence_cache = existence_cache
+        self.file_server = file_server
+        self.image_pipeline = image_pipeline
         # print(self.instance_name)
         # print(self.instance_key)
     
-    def send_media(self, number:str, file_path:list, file_name:str="", caption:str="", delay:int=10) -> dict:
+    def _media_payload(self, number:str, file_path:str, file_name:str="", caption:str="") -> dict:
         """
-            [WARNING] Alto indice de banimentos ao enviar mensagem para grupos.
-           
-            Envia uma mensagem contendo mídia para o numero especificado.
-            Aceita immagems, videos e documentos.
+            Valida o arquivo e monta o payload de envio de mídia.
+            O campo "media" é preenchido com o base64 do arquivo por media_body_kwargs no momento do envio.
 
             Args:
                 number (str): Numero de telefone para enviar a mensagem.
                 file_path (str): Caminho do arquivo a ser enviado.
                 file_name (str, optional): Nome do arquivo a ser enviado. Defaults to "".
                 caption (str, optional): Texto a ser enviado junto com a média. Defaults to "".
-                delay (int, optional): Delay entre o envio de cada mensagem. Defaults to 10.
 
             Returns:
-                dict: Dicionário com a resposta da API.
+                dict: Payload pronto para o endpoint /message/sendMedia/{instance_name}.
         """
 
-        # Validate file path
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Arquivo '{file_path}' não encontrado.")
-        if not os.path.isfile(file_path):
-            raise ValueError(f"O caminho '{file_path}'  não aponta para um arquivo.")
-        
-        # Get mimetype file.
-        mime_type, _ = mimetypes.guess_type(file_path)
-        if not mime_type:
-            raise ValueError("Não foi possível determinar o MIME type do arquivo.")
-        
-        # get media_type.
-        if mime_type.startswith("image/"):
-            media_type = "image"
-        elif mime_type.startswith("video/"):
-            media_type = "video"
-        elif mime_type.startswith("audio/"):
-            media_type = "audio"
+        if self.media_cache is not None:
+            info = self.media_cache.media_info(file_path)
         else:
-            media_type = "document"
-
-        # Convert file to base64
-        base64_string = convert_to_base64(file_path)
+            info = get_media_info(file_path)
 
         # Prepare to send midia
         number = validate_number(number)
-        url = f"{self.base_url}/message/sendMedia/{self.instance_name}"
-        payload = {
+        return {
             "number": number,
-            "mediatype": media_type,
-            "mimetype": mime_type,
+            "mediatype": info["media_type"],
+            "mimetype": info["mime_type"],
             "caption": caption,
-            "media": base64_string,
+            "media": None,
             "fileName": file_name,
             "delay": 1000,
         }
 
+    def _known_missing(self, number: str) -> dict | None:
+        """Retorna a resposta de erro padronizada se o número sabidamente não está no WhatsApp."""
+        if self.existence_cache is None or not number or not self.existence_cache.is_known_missing(number):
+            return None
+        return {
+            "success": False,
+            "status_code": 400,
+            "message": "Número não está no WhatsApp (cache).",
+            "response": missing_response(number)
+        }
+
+    def _preprocess(self, file_path: str) -> str:
+        """Passa imagens pelo ImagePipeline, se configurado (redução, remoção de EXIF e cache por conteúdo)."""
+        if self.image_pipeline is None:
+            return file_path
+        with self.transport.phase("preprocess"):
+            return self.image_pipeline.path(file_path)
+
+    def _fit_to_size(self, file_path: str, max_size_mb: float = None) -> str:
+        """
+            Comprime imagens e PDFs maiores que `max_size_mb` antes do upload, evitando o erro 413 da API.
+
+            Outros tipos (vídeo, áudio, documentos) não são comprimidos e seguem sem alteração.
+
+            Por padrão o arquivo comprimido é temporário e apagado após o envio. Com `compressed_dir` definido e
+            cache de mídia, ele fica nesse diretório com o hash do conteúdo original e o limite no nome e é
+            reaproveitado nos envios seguintes (inclusive entre execuções); a limpeza do diretório fica a cargo
+            da aplicação. Se o diretório for limpo, o arquivo é gerado de novo.
+
+            Returns:
+                str: O próprio `file_path`, se já couber no limite ou não puder ser comprimido, ou o caminho do
+                    arquivo comprimido (veja `_is_temporary`).
+        """
+        if max_size_mb is None or get_file_size_mb(file_path) <= max_size_mb:
+            return file_path
+        info = self.media_cache.media_info(file_path) if self.media_cache is not None else get_media_info(file_path)
+        if info["mime_type"] != "application/pdf" and not info["mime_type"].startswith("image/"):
+            print(f"[WARN] {os.path.basename(file_path)} ({info['mime_type']}) excede {max_size_mb:g} MB e será enviado sem compressão.")
+            return file_path
+        if not self._persists_compressed():
+            return compress_to_target(file_path, max_size_mb)
+
+        os.makedirs(self.compressed_dir, exist_ok=True)
+        extension = ".pdf" if info["mime_type"] == "application/pdf" else ".jpg"
+        output_path = os.path.join(self.compressed_dir, f"{self.media_cache.fingerprint(file_path)[:32]}-{max_size_mb:g}mb{extension}")
+        if not os.path.exists(output_path):
+            # Gera em um arquivo temporário (mantendo a extensão) e renomeia: envios simultâneos nunca veem um arquivo pela metade.
+            temp_path = f"{output_path}.{os.getpid()}.{threading.get_ident()}.tmp{extension}"
+            compress_to_target(file_path, max_size_mb, output_path=temp_path)
+            os.replace(temp_path, output_path)
+        return output_path
+
+    def _persists_compressed(self) -> bool:
+        return self.compressed_dir is not None and self.media_cache is not None
+
+    def _is_temporary(self, file_path: str, source_path: str) -> bool:
+        """Indica se `file_path` é um arquivo comprimido temporário, que deve ser apagado após o envio."""
+        return file_path != source_path and not self._persists_compressed()
+
+    def send_media(self, number:str, file_path:list, file_name:str="", caption:str="", delay:int=10, max_size_mb:float=None) -> dict:
+        """
+            [WARNING] Alto indice de banimentos ao enviar mensagem para grupos.
+           
+            Envia uma mensagem contendo mídia para o numero especificado.
+            Aceita immagems, videos e documentos.
+
+            Args:
+                number (str): Numero de telefone para enviar a mensagem.
+                file_path (str): Caminho do arquivo a ser enviado.
+                file_name (str, optional): Nome do arquivo a ser enviado. Defaults to "".
+                caption (str, optional): Texto a ser enviado junto com a média. Defaults to "".
+                delay (int, optional): Delay entre o envio de cada mensagem. Defaults to 10.
+                max_size_mb (float, optional): Se informado, imagens e PDFs maiores que o limite são comprimidos
+                    com compress_to_target() antes do upload; outros tipos são enviados sem alteração. Defaults to None.
+
+            Returns:
+                dict: Dicionário com a resposta da API.
+        """
+        skipped = self._known_missing(validate_number(number))
+        if skipped is not None:
+            return skipped
+
+        source_path = self._preprocess(file_path)
+        file_path = self._fit_to_size(source_path, max_size_mb)
         try:
-            r = requests.post(url, json=payload, headers=self.headers)
-            # print(r.text)
-            # print(r.json())
-            sleep(delay)
-            result = get_api_response(r)
-        except Exception as e:
-            print(f"Erro ao enviar mensagem de mídia: {e}")
-            return {
-                "success": False,
-                "status_code": None,
-                "message": str(e),
-                "response": None
-            }
+            # Erros do arquivo (payload e codificação) são relançados; só a requisição vira resposta de erro.
+            payload = self._media_payload(number, file_path, file_name, caption)
+            with self.transport.phase("encode"):
+                body = media_body_kwargs(payload, "media", file_path, self.stream_threshold_mb, self.media_cache, self.file_server, self.url_threshold_mb)
+            url = f"{self.base_url}/message/sendMedia/{self.instance_name}"
+
+            try:
+                r = self.transport.post(url, instance=self.instance_name, headers=self.headers, **body)
+                # print(r.text)
+                # print(r.json())
+                self.transport.sleep(delay)
+                result = get_api_response(r)
+                if self.existence_cache is not None:
+                    self.existence_cache.record_response(payload["number"], result)
+            except Exception as e:
+                print(f"Erro ao enviar mensagem de mídia: {e}")
+                return {
+                    "success": False,
+                    "status_code": None,
+                    "message": str(e),
+                    "response": None
+                }
+        finally:
+            if self._is_temporary(file_path, source_path):
+                os.remove(file_path)
         # print(result["message"])
         return result
     
@@ -1,14 +1,16 @@
 from evolutionapi_client.instance.manager import InstanceManager
 from evolutionapi_client.tools.func_chat import validate_number
-import requests
-from time import sleep
+from evolutionapi_client.send.existence import ExistenceCache, missing_response
+from evolutionapi_client.serialization import PayloadTemplate, response_json
 
 class SendMessage():
-    def __init__(self, instance: InstanceManager):
+    def __init__(self, instance: InstanceManager, existence_cache: ExistenceCache = None):
         self.base_url = instance.base_url
         self.headers = instance.headers
         self.api_global_key = instance.api_global_key
         self.instance_name = instance.instance_name
+        self.transport = instance.transport
+        self.existence_cache = existence_cache
 
     def _message_payload(self, number:str, message: str, link_preview=False):
         """
@@ -45,18 +47,20 @@ class SendMessage():
         Returns:
             dict: Um dicionário contendo a resposta da API.
         """
+        return self._post_message(payload["number"], {"json": payload}, delay)
+
+    def _post_message(self, number: str, body: dict, delay: int = 5) -> dict:
+        if self.existence_cache is not None and number and self.existence_cache.is_known_missing(number):
+            # Número sabidamente fora do WhatsApp: evita a requisição e o delay.
+            return missing_response(number)
+
         url = f"{self.base_url}/message/sendText/{self.instance_name}"
-        response = requests.post(url, json=payload, headers=self.headers)
-        sleep(delay)
-        # try:
-        #     return response.json()
-        # except ValueError:
-        #     # Caso não seja JSON (ex: vazio ou HTML), retorna status e texto
-        #     return {
-        #         "status_code": response.status_code,
-        #         "text": response.text
-        #     }
-        return response.json()
+        response = self.transport.post(url, instance=self.instance_name, headers=self.headers, **body)
+        self.transport.sleep(delay)
+        result = response_json(response)
+        if self.existence_cache is not None and number:
+            self.existence_cache.record_response(number, result)
+        return result
 
     def send_text_message(self, number:str, message:str, delay:int=5) -> dict:
         """
@@ -122,3 +126,33 @@ class SendMessage():
         payload = self._message_payload(number, message, link_preview)
         response = self._send_message(payload, delay)
         return response
+
+    def prepare_text_message(self, message: str, link_preview: bool = False) -> PayloadTemplate:
+        """
+            Pré-serializa uma mensagem de texto para envio em massa com `send_prepared`.
+
+            Args:
+                message (str): O texto da mensagem.
+                link_preview (bool, optional): Define se a mensagem deve conter uma prévia de link externo. Defaults to False.
+
+            Returns:
+                PayloadTemplate: Payload com a parte constante já serializada.
+        """
+        return PayloadTemplate(self._message_payload("", message, link_preview), "number")
+
+    def send_prepared(self, template: PayloadTemplate, number: str, delay: int = 5) -> dict:
+        """
+            Envia uma mensagem pré-serializada por `prepare_text_message` para um número.
+
+            O número deve estar normalizado (validate_number ou iter_validate_numbers); a validação não é repetida
+            a cada envio.
+
+            Args:
+                template (PayloadTemplate): Mensagem preparada.
+                number (str): Número normalizado do destinatário.
+                delay (int): Delay entre o envio de cada mensagem. Defaults to 5.
+
+            Returns:
+                dict: Um dicionário contendo a resposta da API (mesmo formato de send_text_message).
+        """
+        return self._post_message(number, {"data": template.render(number)}, delay)
@@ -0,0 +1,484 @@
+import os
+import signal
+import sqlite3
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from time import time, monotonic, sleep
+from typing import Callable, NamedTuple
+from evolutionapi_client.serialization import dumps, loads
+from evolutionapi_client.send.campaign import parse_send_result
+from evolutionapi_client.send.scheduler import SendPacer
+from evolutionapi_client.send.existence import not_on_whatsapp
+from evolutionapi_client.tools.func_tools import get_api_response
+from evolutionapi_client.tools.func_chat import validate_number, calculate_send_delay
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    instance TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_until REAL,
+    result TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS outbox_ready ON outbox (instance, state, available_at);
+"""
+
+class OutboxJob(NamedTuple):
+    id: int
+    key: str
+    kind: str
+    payload: dict
+    attempts: int
+
+class Outbox:
+    # Tipos de envio aceitos e o sender do cliente que os executa.
+    KINDS = ("text", "media", "status", "location")
+
+    def __init__(
+        self,
+        client,
+        db_path: str,
+        visibility_timeout: float = 300,
+        max_attempts: int = 5,
+        retry_backoff: float = 30,
+        batch_size: int = 200,
+        flush_interval: float = 0.05
+    ):
+        """
+        Fila de saída persistente (SQLite) para envios feitos fora do fluxo da aplicação.
+
+        `enqueue_*` apenas monta o payload e o coloca em um buffer em memória; uma thread grava o buffer em
+        lotes, a cada `flush_interval` segundos ou `batch_size` itens, em uma única transação. Use `flush()`
+        quando o envio precisar estar em disco antes de continuar (ex: antes de responder ao usuário).
+
+        Os envios são executados por um ou mais OutboxWorker, no mesmo processo ou em outros (ver
+        `run_outbox_worker`). Cada worker reivindica um lote de itens com um lease de `visibility_timeout`
+        segundos: enquanto o lease vale, nenhum outro worker pega o item, e só o dono do lease registra o
+        resultado. Se o worker morrer, o item volta para a fila quando o lease expira (entrega pelo menos uma vez).
+
+        Args:
+            client (EvolutionAPIClient): Cliente com a instância setada; define a instância dos itens enfileirados.
+            db_path (str): Arquivo SQLite da fila, compartilhado entre os processos.
+            visibility_timeout (float): Duração, em segundos, do lease de um item reivindicado. Defaults to 300.
+            max_attempts (int): Tentativas antes de marcar o item como "failed". Defaults to 5.
+            retry_backoff (float): Espera base, em segundos, antes de uma nova tentativa (dobra a cada falha). Defaults to 30.
+            batch_size (int): Itens por transação na gravação do buffer. Defaults to 200.
+            flush_interval (float): Intervalo máximo, em segundos, entre gravações do buffer. Defaults to 0.05.
+
+        Raises:
+            ValueError: Se o cliente não tiver uma instância setada.
+        """
+        if not client.instance.instance_name:
+            raise ValueError("O Outbox precisa de um cliente com instância setada.")
+        self.client = client
+        self.db_path = db_path
+        self.instance_name = client.instance.instance_name
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._db = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        self._db_lock = threading.Lock()
+        self._buffer = []
+        self._pending = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self._writer = None
+
+    def _transaction(self, func: Callable, *args):
+        with self._db_lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                result = func(*args)
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+            return result
+
+    def enqueue(self, kind: str, payload: dict, key: str = None, delay: float = 0) -> str:
+        """
+        Enfileira um envio já montado.
+
+        Args:
+            kind (str): "text", "media", "status" ou "location".
+            payload (dict): Payload do envio (ver os métodos `enqueue_*`).
+            key (str, optional): Chave única do envio. Um envio com chave repetida é ignorado, o que torna
+                seguro repetir o enfileiramento após um erro. Defaults to None (gera uma chave).
+            delay (float): Segundos até o envio ficar disponível para os workers. Defaults to 0.
+
+        Returns:
+            str: Chave do envio, usada em `status`.
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"Tipo de envio inválido: {kind}")
+        key = key or uuid.uuid4().hex
+        now = time()
+        row = (key, kind, self.instance_name, dumps(payload), now + delay, now)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Outbox fechado")
+            self._buffer.append(row)
+            self._pending += 1
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="outbox-writer", daemon=True)
+                self._writer.start()
+            if len(self._buffer) >= self.batch_size:
+                self._cond.notify_all()
+        return key
+
+    def _number(self, number: str | int) -> str:
+        normalized = validate_number(number)
+        if normalized is None:
+            raise ValueError(f"Número inválido: {number}")
+        return normalized
+
+    def enqueue_text(self, number: str, message: str, link_preview: bool = False, **kwargs) -> str:
+        """
+        Enfileira uma mensagem de texto (payload de `_message_payload`).
+
+        Raises:
+            ValueError: Se o número for inválido.
+        """
+        return self.enqueue("text", self.client.message._message_payload(self._number(number), message, link_preview), **kwargs)
+
+    def enqueue_media(self, number: str, file_path: str, file_name: str = "", caption: str = "", max_size_mb: float = None, **kwargs) -> str:
+        """
+        Enfileira uma mídia. O arquivo é lido pelo worker no momento do envio, então deve continuar existindo.
+
+        Raises:
+            ValueError: Se o número for inválido.
+            FileNotFoundError: Se o arquivo não for encontrado.
+        """
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
+        spec = {"number": self._number(number), "file_path": os.path.abspath(file_path), "file_name": file_name, "caption": caption, "max_size_mb": max_size_mb}
+        return self.enqueue("media", spec, **kwargs)
+
+    def enqueue_status(self, type: str, content: str = None, caption: str = "", file_path: str = None, **kwargs) -> str:
+        """
+        Enfileira um status. Para imagem, vídeo e áudio informe `file_path`; o base64 é gerado pelo worker.
+
+        Demais argumentos nomeados de `_status_payload` (background_color, font, all_contacts...) podem ser
+        passados em `kwargs`, junto com `key` e `delay`.
+        """
+        options = {option: kwargs.pop(option) for option in list(kwargs) if option not in ("key", "delay")}
+        payload = self.client.status._status_payload(type, content, caption, **options)
+        return self.enqueue("status", {"payload": payload, "file_path": os.path.abspath(file_path) if file_path else None}, **kwargs)
+
+    def enqueue_location(self, number: str, name: str, address: str, latitude: float, longitude: float, **kwargs) -> str:
+        """Enfileira uma localização. Demais argumentos de `_location_payload` podem ser passados em `kwargs`."""
+        options = {option: kwargs.pop(option) for option in list(kwargs) if option not in ("key", "delay")}
+        payload = self.client.location._location_payload(self._number(number), name, address, latitude, longitude, **options)
+        return self.enqueue("location", payload, **kwargs)
+
+    def _insert(self, rows: list):
+        self._db.executemany(
+            "INSERT OR IGNORE INTO outbox (key, kind, instance, payload, available_at, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            rows
+        )
+
+    def _write_loop(self):
+        while True:
+            with self._cond:
+                if not self._buffer and not self._closed:
+                    self._cond.wait(self.flush_interval)
+                if not self._buffer:
+                    if self._closed:
+                        return
+                    continue
+                rows, self._buffer = self._buffer, []
+            try:
+                for start in range(0, len(rows), self.batch_size):
+                    self._transaction(self._insert, rows[start:start + self.batch_size])
+            except Exception as e:
+                print(f"[ERRO] Falha ao gravar a fila de saída: {e}")
+                with self._cond:
+                    self._buffer[:0] = rows
+                    self._cond.wait(self.flush_interval)
+                continue
+            with self._cond:
+                self._pending -= len(rows)
+                self._cond.notify_all()
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Aguarda a gravação em disco de tudo que foi enfileirado até agora.
+
+        Returns:
+            bool: False se o tempo de espera acabou antes da gravação.
+        """
+        with self._cond:
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._pending == 0, timeout)
+
+    def claim(self, owner: str, limit: int = 10) -> list[OutboxJob]:
+        """
+        Reivindica até `limit` itens disponíveis da instância, com lease de `visibility_timeout` segundos.
+
+        Itens com lease expirado (worker que morreu ou travou) também são reivindicados.
+        """
+        def claim_rows():
+            now = time()
+            rows = self._db.execute(
+                "SELECT id, key, kind, payload, attempts FROM outbox "
+                "WHERE instance = ? AND state = 'pending' AND available_at <= ? AND (lease_until IS NULL OR lease_until <= ?) "
+                "ORDER BY available_at, id LIMIT ?",
+                (self.instance_name, now, now, limit)
+            ).fetchall()
+            self._db.executemany(
+                "UPDATE outbox SET lease_owner = ?, lease_until = ?, attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                [(owner, now + self.visibility_timeout, now, row[0]) for row in rows]
+            )
+            return rows
+
+        return [OutboxJob(id, key, kind, loads(payload), attempts + 1) for id, key, kind, payload, attempts in self._transaction(claim_rows)]
+
+    def complete(self, owner: str, results: list[tuple[OutboxJob, str, dict]]):
+        """
+        Registra, em uma única transação, o resultado de itens reivindicados por `owner`.
+
+        Args:
+            owner (str): Dono do lease. Itens cujo lease passou para outro worker não são alterados.
+            results (list[tuple[OutboxJob, str, dict]]): (item, estado, resultado), com estado "done", "failed" ou "retry".
+        """
+        def update():
+            now = time()
+            for job, state, result in results:
+                if state == "retry":
+                    state, available_at = "pending", now + self.retry_backoff * 2 ** (job.attempts - 1)
+                else:
+                    available_at = None
+                self._db.execute(
+                    "UPDATE outbox SET state = ?, result = ?, lease_owner = NULL, lease_until = NULL, updated_at = ?, "
+                    "available_at = COALESCE(?, available_at) WHERE id = ? AND lease_owner = ?",
+                    (state, dumps(result).decode("utf-8"), now, available_at, job.id, owner)
+                )
+
+        self._transaction(update)
+
+    def status(self, key: str) -> dict | None:
+        """Estado, tentativas e resultado do envio com a chave informada (None se ainda não foi gravado)."""
+        with self._db_lock:
+            row = self._db.execute("SELECT state, attempts, result FROM outbox WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return {"state": row[0], "attempts": row[1], "result": loads(row[2]) if row[2] else None}
+
+    def stats(self) -> dict:
+        """Quantidade de itens da instância por estado ("pending", "done", "failed") e itens ainda no buffer."""
+        with self._db_lock:
+            rows = dict(self._db.execute("SELECT state, COUNT(*) FROM outbox WHERE instance = ? GROUP BY state", (self.instance_name,)).fetchall())
+        return {"pending": rows.get("pending", 0), "done": rows.get("done", 0), "failed": rows.get("failed", 0), "buffered": self._pending}
+
+    def purge(self, older_than: float = 7 * 24 * 60 * 60) -> int:
+        """
+        Remove itens concluídos ("done") há mais de `older_than` segundos.
+
+        Returns:
+            int: Quantidade de itens removidos.
+        """
+        return self._transaction(lambda: self._db.execute(
+            "DELETE FROM outbox WHERE state = 'done' AND updated_at < ?", (time() - older_than,)
+        ).rowcount)
+
+    def worker(self, threads: int = 4, **kwargs) -> "OutboxWorker":
+        return OutboxWorker(self, threads, **kwargs)
+
+    def close(self):
+        """Grava o buffer pendente e fecha a conexão com o banco."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._writer is not None:
+            self._writer.join()
+        with self._db_lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# Campos obrigatórios do payload de cada tipo de envio, conferidos antes do envio.
+REQUIRED_FIELDS = {
+    "text": ("number",),
+    "media": ("number", "file_path", "file_name", "caption", "max_size_mb"),
+    "status": ("payload", "file_path"),
+    "location": ("number",)
+}
+
+def check_job(kind: str, payload) -> str | None:
+    """
+    Confere, antes do envio, se um item da fila pode ser enviado.
+
+    Returns:
+        str | None: Motivo pelo qual o envio nunca daria certo (tipo inválido, campo ausente ou arquivo
+            inexistente), ou None se o item puder ser enviado.
+    """
+    if kind not in REQUIRED_FIELDS:
+        return f"Tipo de envio inválido: {kind}"
+    if not isinstance(payload, dict):
+        return "Payload inválido."
+    missing = [field for field in REQUIRED_FIELDS[kind] if field not in payload]
+    if missing:
+        return f"Payload sem os campos: {', '.join(missing)}"
+    file_path = payload.get("file_path") if kind in ("media", "status") else None
+    if (kind == "media" or file_path) and not os.path.isfile(file_path or ""):
+        return f"Arquivo não encontrado: {file_path}"
+    return None
+
+class OutboxWorker:
+    def __init__(self, outbox: Outbox, threads: int = 4, poll_interval: float = 0.5, delay_policy: Callable[[int], float] = calculate_send_delay, pacer: SendPacer = None):
+        """
+        Consome a fila de saída da instância do cliente, executando os envios em um pool de threads.
+
+        A cada ciclo, reivindica até `threads * 2` itens, executa-os em paralelo e registra todos os
+        resultados em uma única transação. Vários workers (threads ou processos) podem consumir a mesma fila.
+
+        Os envios passam por um SendPacer: cada thread aguarda o horário reservado para a instância antes de
+        enviar, então `threads` controla apenas quantos envios podem estar em andamento, não o ritmo. Workers
+        do mesmo processo podem compartilhar o `pacer` para manter um único ritmo por instância. O
+        `visibility_timeout` da fila deve cobrir a espera de um lote inteiro.
+
+        Args:
+            outbox (Outbox): Fila a consumir.
+            threads (int): Envios simultâneos deste worker. Defaults to 4.
+            poll_interval (float): Espera, em segundos, quando a fila está vazia. Defaults to 0.5.
+            delay_policy (Callable[[int], float]): Espaçamento entre envios da instância, usado se `pacer` não
+                for informado. Defaults to calculate_send_delay.
+            pacer (SendPacer, optional): Pacer compartilhado com outros workers ou agendadores. Defaults to None.
+        """
+        self.outbox = outbox
+        self.client = outbox.client
+        self.threads = threads
+        self.poll_interval = poll_interval
+        self.pacer = pacer or SendPacer(delay_policy)
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.processed = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _dispatch(self, kind: str, payload: dict):
+        client = self.client
+        if kind == "text":
+            return client.message._send_message(payload, delay=0)
+        if kind == "media":
+            return client.media.send_media(
+                payload["number"], payload["file_path"], payload["file_name"], payload["caption"], delay=0, max_size_mb=payload["max_size_mb"]
+            )
+        if kind == "status":
+            return get_api_response(client.status._send_status(payload["payload"], 0, payload["file_path"]))
+        if kind == "location":
+            return client.location._post_location({"json": payload})
+        raise ValueError(f"Tipo de envio inválido: {kind}")
+
+    def _process(self, job: OutboxJob) -> tuple[OutboxJob, str, dict]:
+        # Arquivo removido ou payload inválido: repetir o envio daria o mesmo erro.
+        error = check_job(job.kind, job.payload)
+        if error is not None:
+            return job, "failed", {"ok": False, "status": None, "message_id": None, "error": error}
+
+        wait = self.pacer.reserve(self.outbox.instance_name) - monotonic()
+        if wait > 0:
+            sleep(wait)
+        try:
+            response = self._dispatch(job.kind, job.payload)
+        except Exception as e:
+            result = {"ok": False, "status": None, "message_id": None, "error": str(e)}
+            return job, "retry" if job.attempts < self.outbox.max_attempts else "failed", result
+
+        result = parse_send_result(response)
+        if result["ok"]:
+            return job, "done", result
+        status = result["status"]
+        permanent = bool(not_on_whatsapp(response)) or (isinstance(status, int) and 400 <= status < 500 and status != 429)
+        if permanent or job.attempts >= self.outbox.max_attempts:
+            return job, "failed", result
+        return job, "retry", result
+
+    def run_once(self, executor: ThreadPoolExecutor) -> int:
+        """Processa um lote da fila. Retorna a quantidade de itens processados."""
+        jobs = self.outbox.claim(self.owner, self.threads * 2)
+        if not jobs:
+            return 0
+        self.outbox.complete(self.owner, list(executor.map(self._process, jobs)))
+        self.processed += len(jobs)
+        return len(jobs)
+
+    def run(self, until_empty: bool = False):
+        """
+        Consome a fila até `stop()` (ou até esvaziá-la, se `until_empty`).
+
+        Args:
+            until_empty (bool): Retorna quando não houver itens disponíveis. Defaults to False.
+        """
+        with ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="outbox-worker") as executor:
+            while not self._stop.is_set():
+                try:
+                    processed = self.run_once(executor)
+                except sqlite3.Error as e:
+                    print(f"[ERRO] Falha ao ler a fila de saída: {e}")
+                    processed = 0
+                if not processed:
+                    if until_empty:
+                        return
+                    self._stop.wait(self.poll_interval)
+
+    def start(self):
+        """Inicia o worker em uma thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="outbox-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None):
+        """Para de reivindicar itens e aguarda o lote em andamento terminar."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+def run_outbox_worker(url: str, api_global_key: str, instance_name: str, db_path: str, threads: int = 4, delay_policy: Callable[[int], float] = calculate_send_delay, **outbox_kwargs):
+    """
+    Ponto de entrada de um processo worker: cria o próprio cliente e consome a fila até receber SIGTERM/SIGINT.
+
+    Cada processo tem o próprio SendPacer: com N processos na mesma instância, o ritmo de envio é N vezes
+    o de `delay_policy`. `delay_policy` precisa ser uma função de módulo (serializável) para o multiprocessing.
+
+    Exemplo:
+        from multiprocessing import Process
+        workers = [Process(target=run_outbox_worker, args=(url, key, "minha-instancia", "outbox.db")) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+    """
+    from evolutionapi_client.client import EvolutionAPIClient
+
+    with EvolutionAPIClient(url, api_global_key, instance_name) as client, Outbox(client, db_path, **outbox_kwargs) as outbox:
+        worker = outbox.worker(threads, delay_policy=delay_policy)
+        stop = lambda *args: worker.stop()
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+        worker.run()
@@ -0,0 +1,165 @@
+import heapq
+import itertools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import monotonic
+from typing import Callable, Hashable
+from evolutionapi_client.tools.func_chat import calculate_send_delay
+from evolutionapi_client.send.message import SendMessage
+from evolutionapi_client.send.media import SendMedia
+from evolutionapi_client.send.status import SendStatus
+
+# Classes cujos métodos de envio fazem sleep(delay) internamente.
+SLEEPING_SENDERS = (SendMessage, SendMedia, SendStatus)
+
+class SendPacer:
+    def __init__(self, delay_policy: Callable[[int], float] = calculate_send_delay):
+        """
+        Reserva horários de envio respeitando o espaçamento mínimo entre envios de uma mesma instância.
+
+        Args:
+            delay_policy (Callable[[int], float]): Recebe o índice do envio na instância (zero-based) e
+                retorna o espaçamento, em segundos, até o próximo envio. Defaults to calculate_send_delay.
+        """
+        self.delay_policy = delay_policy
+        self._lanes = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: Hashable, now: float = None) -> float:
+        """
+        Reserva o próximo horário livre da instância informada.
+
+        Args:
+            key (Hashable): Identificador da fila de envio, normalmente o nome da instância.
+            now (float, optional): Horário atual no relógio monotônico. Defaults to time.monotonic().
+
+        Returns:
+            float: Horário (relógio monotônico) em que o envio pode ser realizado.
+        """
+        now = monotonic() if now is None else now
+        with self._lock:
+            next_slot, count = self._lanes.get(key, (now, 0))
+            slot = max(now, next_slot)
+            self._lanes[key] = (slot + self.delay_policy(count), count + 1)
+            return slot
+
+    def reset(self, key: Hashable = None):
+        """Reinicia o índice de envios de uma instância, ou de todas se `key` for None."""
+        with self._lock:
+            if key is None:
+                self._lanes.clear()
+            else:
+                self._lanes.pop(key, None)
+
+def sender_key(func: Callable) -> Hashable:
+    """Retorna o nome da instância do sender ao qual o método `func` pertence, se houver."""
+    return getattr(getattr(func, "__self__", None), "instance_name", None)
+
+class SendScheduler:
+    def __init__(self, delay_policy: Callable[[int], float] = calculate_send_delay, max_workers: int = 8):
+        """
+        Agendador de envios que substitui o sleep(delay) bloqueante dos métodos de envio.
+
+        Uma única thread controla o ritmo de todas as instâncias; as requisições em si rodam em um
+        pool de threads. `submit` retorna imediatamente um Future com o resultado do envio.
+
+        Args:
+            delay_policy (Callable[[int], float]): Política de espaçamento por instância. Defaults to calculate_send_delay.
+            max_workers (int): Quantidade de threads que executam as requisições. Defaults to 8.
+        """
+        self.pacer = SendPacer(delay_policy)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="send-scheduler")
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._dispatch, name="send-scheduler-pacer", daemon=True)
+        self._thread.start()
+
+    def submit(self, func: Callable, *args, key: Hashable = None, **kwargs) -> Future:
+        """
+        Agenda um envio e retorna sem bloquear.
+
+        Args:
+            func (Callable): Método de envio, ex: client.message.send_text_message.
+            *args: Argumentos posicionais repassados a `func`.
+            key (Hashable, optional): Fila de ritmo. Por padrão, o nome da instância do sender.
+            **kwargs: Argumentos nomeados repassados a `func`. Para SendMessage, SendMedia e SendStatus
+                o `delay` é fixado em 0, pois o espaçamento passa a ser feito pelo agendador.
+
+        Returns:
+            Future: Resolve com o retorno de `func`.
+        """
+        if isinstance(getattr(func, "__self__", None), SLEEPING_SENDERS):
+            kwargs.setdefault("delay", 0)
+        if key is None:
+            key = sender_key(func)
+
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("SendScheduler encerrado.")
+            slot = self.pacer.reserve(key)
+            heapq.heappush(self._heap, (slot, next(self._seq), future, func, args, kwargs))
+            self._cond.notify()
+        return future
+
+    def _dispatch(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._heap:
+                        wait = self._heap[0][0] - monotonic()
+                        if wait <= 0:
+                            break
+                        self._cond.wait(wait)
+                    elif self._closed:
+                        # Com shutdown(wait=False), o executor só é encerrado depois do último envio agendado.
+                        self._executor.shutdown(wait=False)
+                        return
+                    else:
+                        self._cond.wait()
+                _, _, future, func, args, kwargs = heapq.heappop(self._heap)
+            if future.set_running_or_notify_cancel():
+                try:
+                    self._executor.submit(self._execute, future, func, args, kwargs)
+                except RuntimeError as e:
+                    future.set_exception(e)
+
+    @staticmethod
+    def _execute(future: Future, func: Callable, args: tuple, kwargs: dict):
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    def pending(self) -> int:
+        """Quantidade de envios aguardando o horário agendado."""
+        with self._cond:
+            return len(self._heap)
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False):
+        """
+        Encerra o agendador.
+
+        Args:
+            wait (bool): Aguarda os envios agendados e em andamento terminarem. Sem aguardar, os envios já
+                agendados continuam sendo feitos nos seus horários. Defaults to True.
+            cancel_pending (bool): Cancela os envios que ainda não começaram. Defaults to False.
+        """
+        with self._cond:
+            self._closed = True
+            if cancel_pending:
+                for item in self._heap:
+                    item[2].cancel()
+                self._heap.clear()
+            self._cond.notify()
+        if wait:
+            self._thread.join()
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
@@ -1,14 +1,105 @@
+import os
+import functools
+import itertools
+import threading
 import requests
-from time import sleep
+from typing import Iterable, Iterator
 from evolutionapi_client.instance.manager import InstanceManager
-from evolutionapi_client.tools.func_tools import convert_to_base64
+from evolutionapi_client.tools.func_tools import media_body_kwargs, get_api_response
+from evolutionapi_client.tools.func_chat import iter_validate_numbers, REJECT_DUPLICATE
+from evolutionapi_client.tools.media_cache import MediaCache
+from evolutionapi_client.tools.file_server import FileServer
+from evolutionapi_client.tools.image_pipeline import ImagePipeline
+from evolutionapi_client.serialization import PayloadTemplate, response_json
+
+def iter_chunks(items: Iterable, chunk_size: int) -> Iterator[list]:
+    """Divide um iterável em listas de até `chunk_size` itens, sem carregá-lo inteiro na memória."""
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
+
+def chunk_result(index: int, chunk: list[str], response=None, error: Exception = None) -> dict:
+    """
+    Resume o envio de um lote do broadcast de status.
+
+    Returns:
+        dict: Contendo `index`, `size`, `success`, `status_code`, `message`, `message_id` e `jids`
+            (apenas para lotes com falha, para reenvio).
+    """
+    if error is not None:
+        result = {"success": False, "status_code": None, "message": str(error), "response": None}
+    else:
+        result = get_api_response(response)
+    body = result["response"]
+    message_id = body["key"].get("id") if isinstance(body, dict) and isinstance(body.get("key"), dict) else None
+    return {
+        "index": index,
+        "size": len(chunk),
+        "success": result["success"],
+        "status_code": result["status_code"],
+        "message": result["message"],
+        "message_id": message_id,
+        "jids": [] if result["success"] else chunk
+    }
+
+def broadcast_summary(chunks: list[dict], rejected: dict) -> dict:
+    """
+    Agrega os resultados por lote de um broadcast de status.
+
+    Args:
+        chunks (list[dict]): Resultados de `chunk_result`, em qualquer ordem.
+        rejected (dict): Contagem de descartes por motivo, preenchida por iter_validate_numbers.
+    """
+    chunks = sorted(chunks, key=lambda chunk: chunk["index"])
+    sent = sum(chunk["size"] for chunk in chunks if chunk["success"])
+    total = sum(chunk["size"] for chunk in chunks)
+    duplicates = rejected.get(REJECT_DUPLICATE, 0)
+    return {
+        "total": total,
+        "sent": sent,
+        "failed": total - sent,
+        "invalid": sum(rejected.values()) - duplicates,
+        "duplicates": duplicates,
+        "chunks": chunks,
+        "failed_jids": [jid for chunk in chunks for jid in chunk["jids"]]
+    }
+
+def warn_repeated_upload(template: PayloadTemplate, threshold_mb: float):
+    """
+    Avisa quando um broadcast reenvia, em cada lote, uma mídia embutida (base64) maior que `threshold_mb`.
+
+    Sem servidor de arquivos a mídia fica na parte constante do template, e o upload se repete por lote: 50 lotes
+    de um vídeo de 16 MB enviam cerca de 800 MB.
+    """
+    size_mb = (len(template.prefix) + len(template.suffix)) / (1024 * 1024)
+    if size_mb > threshold_mb:
+        print(
+            f"[WARN] broadcast_status sem FileServer: a mídia ({size_mb:.1f} MB em base64) é reenviada em cada lote. "
+            "Configure um FileServer no cliente para enviá-la por URL."
+        )
 
 class SendStatus():
-    def __init__(self, instance: InstanceManager):
+    # Arquivos maiores que este limite (em MB) são codificados em streaming durante o upload.
+    stream_threshold_mb = 5
+    # Com servidor de arquivos, arquivos maiores que este limite (em MB) são enviados por URL, sem upload.
+    url_threshold_mb = 1
+
+    def __init__(self, instance: InstanceManager, media_cache: MediaCache = None, file_server: FileServer = None, image_pipeline: ImagePipeline = None):
         self.base_url = instance.base_url
         self.headers = instance.headers
         self.api_global_key = instance.api_global_key
         self.instance_name = instance.instance_name
+        self.transport = instance.transport
+        self.media_cache = media_cache
+        self.file_server = file_server
+        self.image_pipeline = image_pipeline
+
+    def _preprocess(self, file_path: str) -> str:
+        """Passa imagens pelo ImagePipeline, se configurado (redução, remoção de EXIF e cache por conteúdo)."""
+        if self.image_pipeline is None:
+            return file_path
+        with self.transport.phase("preprocess"):
+            return self.image_pipeline.path(file_path)
 
     def _status_payload(self, type: str, content: str, caption: str = "", background_color="#D3D3D3", font=5, all_contacts=True, status_Jid_List=["551125611600@c.us"]) -> dict:
         """
@@ -59,13 +150,14 @@ class SendStatus():
 
         return payload
 
-    def _send_status(self, payload: dict, delay: int = 2) -> requests.Response:
+    def _send_status(self, payload: dict, delay: int = 2, file_path: str = None) -> requests.Response:
         """
             Realiza o envio de um status (texto, imagem, vídeo ou áudio) utilizando a instância da API Evolution.
 
             Args:
                 payload (dict): Dicionário contendo os dados do status a ser enviado. Deve seguir o formato esperado pela API Evolution incluindo campos como "type", "content", "caption", etc.
                 delay (int, optional): Tempo de espera (em segundos) após o envio da requisição. Pode ser usado para evitar sobrecarga ou respeitar limites de envio. Padrão: 2 segundos.
+                file_path (str, optional): Arquivo cujo base64 preenche o campo "content" do payload. Arquivos grandes são codificados em streaming. Padrão: None.
 
             Returns:
                 requests.Response: Objeto de resposta HTTP da biblioteca `requests`, contendo status code, 
@@ -75,11 +167,15 @@ class SendStatus():
                 Exception: Qualquer exceção levantada durante o processo de envio será capturada, exibida no terminal 
                     e relançada para permitir tratamento posterior.
             """
-        url = f"{self.base_url}/message/sendStatus/{self.instance_name}"
+        with self.transport.phase("encode"):
+            body = media_body_kwargs(payload, "content", file_path, self.stream_threshold_mb, self.media_cache, self.file_server, self.url_threshold_mb) if file_path else {"json": payload}
+        return self._post_status(body, delay)
 
+    def _post_status(self, body: dict, delay: int = 2) -> requests.Response:
+        url = f"{self.base_url}/message/sendStatus/{self.instance_name}"
         try:
-            r = requests.post(url, json=payload, headers=self.headers)
-            sleep(delay)
+            r = self.transport.post(url, instance=self.instance_name, headers=self.headers, **body)
+            self.transport.sleep(delay)
             return r
         except Exception as e:
             print(f"[ERRO] Falha ao enviar status: {e}")
@@ -90,22 +186,128 @@ class SendStatus():
         return self._send_status(payload, delay)
 
     def send_status_image(self, image_path: str, caption="", delay=2) -> dict:
-        # image_base64 = convert_to_base64(image_path)
-        payload = self._status_payload("image", image_path, caption=caption)
-        return self._send_status(payload, delay).json()
+        # Arquivos locais vão por URL (com servidor de arquivos) ou em base64; outros valores seguem como URL.
+        file_path = self._preprocess(image_path) if os.path.isfile(image_path) else None
+        payload = self._status_payload("image", None if file_path else image_path, caption=caption)
+        return response_json(self._send_status(payload, delay, file_path))
 
     # def send_status_video(self, video_path: str, caption="", delay=2):
     #     return self.send_status_image(video_path, caption=caption, delay=delay)
     
     def send_status_video(self, video_path: str, caption="", delay=2):
-        video_base64 = convert_to_base64(video_path)
-        payload = self._status_payload("video", video_base64, caption=caption)
-        return self._send_status(payload, delay=delay)
+        payload = self._status_payload("video", None, caption=caption)
+        return self._send_status(payload, delay=delay, file_path=video_path)
 
     def send_status_audio(self, audio_path: str, caption="", delay=2):
-        audio_base64 = convert_to_base64(audio_path)
-        payload = self._status_payload("audio", audio_base64, caption=caption)
-        return self._send_status(payload, delay)
+        payload = self._status_payload("audio", None, caption=caption)
+        return self._send_status(payload, delay, file_path=audio_path)
+
+    def prepare_status_text(self, content: str, background_color="#D3D3D3", font=5, all_contacts=False) -> PayloadTemplate:
+        """
+            Pré-serializa um status de texto para envio a várias listas de contatos com `send_prepared`.
+
+            Args:
+                content (str): O texto do status.
+                background_color (str, optional): Cor de fundo em hexadecimal. Padrão: "#D3D3D3".
+                font (int, optional): Fonte do texto (ver `_status_payload`). Padrão: 5.
+                all_contacts (bool, optional): Envia para todos os contatos. Padrão: False.
+
+            Returns:
+                PayloadTemplate: Payload com a parte constante já serializada; o campo variável é "statusJidList".
+        """
+        payload = self._status_payload("text", content, background_color=background_color, font=font, all_contacts=all_contacts)
+        return PayloadTemplate(payload, "statusJidList")
+
+    def send_prepared(self, template: PayloadTemplate, status_jid_list: list[str], delay=2) -> requests.Response:
+        """
+            Envia um status pré-serializado por `prepare_status_text` para a lista de contatos informada.
+
+            Args:
+                template (PayloadTemplate): Status preparado.
+                status_jid_list (list[str]): JIDs dos contatos (ex: "5511999999999@s.whatsapp.net").
+                delay (int, optional): Tempo de espera (em segundos) após o envio. Padrão: 2.
+
+            Returns:
+                requests.Response: Resposta HTTP do envio.
+        """
+        return self._post_status({"data": template.render(status_jid_list)}, delay)
+
+    def prepare_status(self, type: str, content: str, caption="", background_color="#D3D3D3", font=5) -> PayloadTemplate:
+        """
+            Pré-serializa um status de qualquer tipo para envio a várias listas de contatos (ver `broadcast_status`).
+
+            A mídia local é processada e codificada uma única vez: com servidor de arquivos, o payload leva uma URL
+            assinada (a API baixa o arquivo); sem ele, o base64 do arquivo fica na parte constante do template e
+            é reenviado em cada lote de `broadcast_status`. Para mídias grandes, configure um FileServer.
+
+            Args:
+                type (str): "text", "image", "video" ou "audio".
+                content (str): Texto do status, caminho de um arquivo local ou URL da mídia.
+                caption (str, optional): Legenda da mídia. Padrão: "".
+                background_color (str, optional): Cor de fundo do status de texto. Padrão: "#D3D3D3".
+                font (int, optional): Fonte do status de texto (ver `_status_payload`). Padrão: 5.
+
+            Returns:
+                PayloadTemplate: Payload com a parte constante já serializada; o campo variável é "statusJidList".
+        """
+        file_path = content if type != "text" and os.path.isfile(content) else None
+        if file_path and type == "image":
+            file_path = self._preprocess(file_path)
+        payload = self._status_payload(type, None if file_path else content, caption=caption, background_color=background_color, font=font, all_contacts=False)
+        if file_path:
+            with self.transport.phase("encode"):
+                # stream_threshold infinito: o conteúdo vai para o template em vez de um corpo em streaming.
+                payload = media_body_kwargs(payload, "content", file_path, float("inf"), self.media_cache, self.file_server, self.url_threshold_mb)["json"]
+        return PayloadTemplate(payload, "statusJidList")
+
+    def broadcast_status(self, template: PayloadTemplate, numbers: Iterable[str | int], chunk_size: int = 1000, max_workers: int = 4, interval: float = 1) -> dict:
+        """
+            Publica um status para um público grande, dividido em lotes enviados em paralelo.
+
+            Uma única requisição com dezenas de milhares de contatos costuma estourar o tempo limite (504). Aqui a
+            lista é normalizada e dividida em lotes de `chunk_size` contatos; cada lote é uma requisição com o mesmo
+            template (a mídia não é codificada de novo), disparada pelo SendScheduler com no mínimo `interval`
+            segundos entre lotes e até `max_workers` lotes em andamento. Os lotes são gerados conforme o envio avança
+            e os contatos dos lotes enviados com sucesso são descartados, então a memória não cresce com o público.
+
+            A mídia só é enviada uma vez quando o template leva uma URL (cliente com FileServer). Com a mídia em
+            base64 no template, ela é reenviada em cada lote; se passar de `url_threshold_mb`, um aviso é exibido.
+
+            Args:
+                template (PayloadTemplate): Status preparado por `prepare_status` ou `prepare_status_text`.
+                numbers (Iterable[str | int]): Números ou JIDs dos contatos; inválidos e repetidos são descartados.
+                chunk_size (int, optional): Contatos por requisição. Padrão: 1000.
+                max_workers (int, optional): Lotes enviados ao mesmo tempo. Padrão: 4.
+                interval (float, optional): Intervalo mínimo, em segundos, entre o início de dois lotes. Padrão: 1.
+
+            Returns:
+                dict: Contendo `total`, `sent`, `failed`, `invalid` e `duplicates` (contagens de contatos; `invalid`
+                    não inclui os repetidos), `chunks` (resultado de cada lote, ver `chunk_result`) e `failed_jids`
+                    (contatos dos lotes com falha, para reenvio).
+        """
+        from evolutionapi_client.send.scheduler import SendScheduler
+
+        rejected = {}
+        chunks = []
+        # Limita os lotes agendados e ainda não concluídos; o restante da entrada só é lido quando houver vaga.
+        window = threading.BoundedSemaphore(max_workers * 2)
+
+        def collect(index: int, chunk: list[str], future):
+            try:
+                chunks.append(chunk_result(index, chunk, future.result()))
+            except Exception as e:
+                chunks.append(chunk_result(index, chunk, error=e))
+            finally:
+                window.release()
+
+        with SendScheduler(lambda _: interval, max_workers=max_workers) as scheduler:
+            for index, chunk in enumerate(iter_chunks(iter_validate_numbers(numbers, jid=True, counts=rejected), chunk_size)):
+                if index == 1:
+                    warn_repeated_upload(template, self.url_threshold_mb)
+                window.acquire()
+                future = scheduler.submit(self.send_prepared, template, chunk, key=self.instance_name)
+                future.add_done_callback(functools.partial(collect, index, chunk))
+        return broadcast_summary(chunks, rejected)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Backend usado nos corpos das requisições e na leitura das respostas: "orjson" quando instalado
+# (extra "fast"), senão o json da biblioteca padrão.
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+if orjson is not None:
+    def dumps(obj: Any) -> bytes:
+        """
+        Serializa `obj` em JSON compacto (UTF-8).
+
+        Chaves não-str (ex: int) são aceitas como no json padrão. O que o orjson não serializa (ex: inteiros
+        acima de 64 bits) cai no json da biblioteca padrão.
+        """
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return _encoder.encode(obj).encode("utf-8")
+
+    def loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+else:
+    def dumps(obj: Any) -> bytes:
+        """Serializa `obj` em JSON compacto (UTF-8)."""
+        return _encoder.encode(obj).encode("utf-8")
+
+    def loads(data: bytes | str) -> Any:
+        return json.loads(data)
+
+def response_json(response) -> Any:
+    """
+    Lê o corpo JSON de uma resposta do requests ou do httpx com o backend configurado.
+
+    Raises:
+        ValueError: Se o corpo não for um JSON válido.
+    """
+    return loads(response.content)
+
+class PayloadTemplate:
+    # Marcador substituído pelo valor de cada destinatário; serializado igual por qualquer backend.
+    _PLACEHOLDER = "\x00recipient\x00"
+
+    def __init__(self, payload: dict, field: str = "number"):
+        """
+        Payload pré-serializado para envios em massa, em que só um campo muda entre os destinatários.
+
+        A parte constante é serializada uma única vez; `render` gera os bytes do corpo de cada envio
+        concatenando o prefixo, o valor serializado e o sufixo, sem recriar o dicionário.
+
+        Exemplo:
+            template = PayloadTemplate({"number": None, "text": "Olá"}, "number")
+            template.render("5511999999999")  # b'{"number":"5511999999999","text":"Olá"}'
+
+        Args:
+            payload (dict): Payload completo. O valor de `field` é ignorado.
+            field (str): Campo preenchido a cada envio (ex: "number", "statusJidList"). Defaults to "number".
+        """
+        self.payload = payload
+        self.field = field
+        marker = dumps(self._PLACEHOLDER)
+        self.prefix, self.suffix = dumps({**payload, field: self._PLACEHOLDER}).split(marker)
+
+    def render(self, value: Any) -> bytes:
+        """Gera o corpo JSON com `value` no campo do destinatário."""
+        return self.prefix + dumps(value) + self.suffix
+
+    def to_dict(self, value: Any) -> dict:
+        return {**self.payload, self.field: value}
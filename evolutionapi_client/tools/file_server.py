@@ -0,0 +1,231 @@
+import hashlib
+import hmac
+import mimetypes
+import os
+import re
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import time
+from urllib.parse import parse_qs, quote, urlsplit
+
+_RANGE = re.compile(r"bytes=(\d*)-(\d*)$")
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """
+    Interpreta um header Range de intervalo único ("bytes=0-99", "bytes=100-", "bytes=-100").
+
+    Returns:
+        tuple[int, int] | None: (início, fim inclusivo), ou None se o intervalo for inválido ou não satisfazível.
+    """
+    match = _RANGE.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    start, end = match.groups()
+    if start == "":
+        length = int(end)
+        if length == 0:
+            return None
+        return max(size - length, 0), size - 1
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        return None
+    return start, end
+
+class FileServer:
+    def __init__(self, host: str = "0.0.0.0", port: int = 0, public_url: str = None, secret: bytes = None, ttl: float = 3600):
+        """
+        Servidor HTTP embutido que expõe arquivos locais por URLs assinadas e com validade.
+
+        Permite enviar mídia por URL: a API Evolution baixa o arquivo diretamente deste servidor, então o cliente
+        não codifica nem envia o base64 (33% maior que o arquivo). Os arquivos são servidos com sendfile (cópia
+        zero, quando o sistema operacional suporta) e aceitam o header Range.
+
+        Apenas arquivos registrados por `url_for` são servidos, e cada URL leva uma assinatura HMAC da
+        identificação do arquivo e do horário de expiração.
+
+        Args:
+            host (str): Endereço de escuta. Defaults to "0.0.0.0".
+            port (int): Porta de escuta; 0 escolhe uma porta livre. Defaults to 0.
+            public_url (str, optional): URL base pela qual o servidor da API Evolution alcança esta máquina
+                (ex: "http://10.0.0.5:8765"). Defaults to None (usa host e porta de escuta; com host "0.0.0.0",
+                127.0.0.1).
+            secret (bytes, optional): Chave das assinaturas. Defaults to None (gera uma chave aleatória).
+            ttl (float): Validade padrão das URLs, em segundos. Defaults to 3600.
+        """
+        self.host = host
+        self.port = port
+        self.public_url = public_url.rstrip("/") if public_url else None
+        self.secret = secret or secrets.token_bytes(32)
+        self.ttl = ttl
+        self.served = 0
+        self.bytes_sent = 0
+        self._files = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    def _sign(self, file_id: str, expires: int) -> str:
+        return hmac.new(self.secret, f"{file_id}:{expires}".encode(), hashlib.sha256).hexdigest()
+
+    def url_for(self, file_path: str, ttl: float = None) -> str:
+        """
+        Registra o arquivo e retorna uma URL assinada para baixá-lo.
+
+        Args:
+            file_path (str): Caminho do arquivo. Deve continuar existindo até ser baixado.
+            ttl (float, optional): Validade da URL, em segundos. Defaults to None (usa o `ttl` do servidor).
+
+        Returns:
+            str: URL do arquivo, válida por `ttl` segundos.
+
+        Raises:
+            FileNotFoundError: Se o arquivo não for encontrado.
+        """
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
+        if self._server is None:
+            self.start()
+        path = os.path.abspath(file_path)
+        expires = int(time() + (ttl or self.ttl))
+        file_id = hashlib.sha256(path.encode()).hexdigest()[:32]
+        with self._lock:
+            self._purge()
+            _, previous = self._files.get(file_id, (None, 0))
+            self._files[file_id] = (path, max(previous, expires))
+        name = quote(os.path.basename(path))
+        return f"{self.base_url}/files/{file_id}/{name}?expires={expires}&sig={self._sign(file_id, expires)}"
+
+    def revoke(self, file_path: str):
+        """Remove o arquivo do servidor antes da expiração das URLs."""
+        file_id = hashlib.sha256(os.path.abspath(file_path).encode()).hexdigest()[:32]
+        with self._lock:
+            self._files.pop(file_id, None)
+
+    def _purge(self):
+        now = time()
+        for file_id in [file_id for file_id, (_, expires) in self._files.items() if expires < now]:
+            del self._files[file_id]
+
+    def resolve(self, url_path: str) -> tuple[int, str | None]:
+        """
+        Valida o caminho de uma requisição.
+
+        Returns:
+            tuple[int, str | None]: (200, caminho do arquivo) ou (código de erro HTTP, None).
+        """
+        parts = urlsplit(url_path)
+        segments = parts.path.strip("/").split("/")
+        query = parse_qs(parts.query)
+        if len(segments) < 2 or segments[0] != "files":
+            return 404, None
+        file_id = segments[1]
+        try:
+            expires = int(query["expires"][0])
+            signature = query["sig"][0]
+        except (KeyError, ValueError):
+            return 403, None
+        if not hmac.compare_digest(signature, self._sign(file_id, expires)):
+            return 403, None
+        if expires < time():
+            return 410, None
+        with self._lock:
+            entry = self._files.get(file_id)
+        if entry is None or not os.path.isfile(entry[0]):
+            return 404, None
+        return 200, entry[0]
+
+    @property
+    def base_url(self) -> str:
+        if self.public_url:
+            return self.public_url
+        host = "127.0.0.1" if self.host in ("0.0.0.0", "") else self.host
+        return f"http://{host}:{self.port}"
+
+    def _handler(self):
+        file_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _error(self, status: int):
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def _serve(self, head: bool):
+                status, path = file_server.resolve(self.path)
+                if path is None:
+                    return self._error(status)
+                with open(path, "rb") as file:
+                    size = os.fstat(file.fileno()).st_size
+                    start, end = 0, size - 1
+                    range_header = self.headers.get("Range")
+                    if range_header:
+                        byte_range = parse_range(range_header, size)
+                        if byte_range is None:
+                            self.send_response(416)
+                            self.send_header("Content-Range", f"bytes */{size}")
+                            self.send_header("Content-Length", "0")
+                            self.end_headers()
+                            return
+                        start, end = byte_range
+                        self.send_response(206)
+                        self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+                    else:
+                        self.send_response(200)
+                    length = end - start + 1 if size else 0
+                    self.send_header("Content-Type", mimetypes.guess_type(path)[0] or "application/octet-stream")
+                    self.send_header("Content-Length", str(length))
+                    self.send_header("Accept-Ranges", "bytes")
+                    self.end_headers()
+                    if head or not length:
+                        return
+                    # socket.sendfile usa os.sendfile (cópia zero) quando disponível e cai para send() nos demais sistemas.
+                    sent = self.connection.sendfile(file, start, length)
+                with file_server._lock:
+                    file_server.served += 1
+                    file_server.bytes_sent += sent
+
+            def do_GET(self):
+                self._serve(head=False)
+
+            def do_HEAD(self):
+                self._serve(head=True)
+
+        return Handler
+
+    def start(self):
+        """
+        Inicia o servidor em uma thread (chamado automaticamente pelo primeiro `url_for`).
+
+        Sem `public_url`, escutar em todas as interfaces gera URLs com 127.0.0.1, que só funcionam se a API
+        Evolution rodar na mesma máquina; nesse caso um aviso é exibido.
+        """
+        with self._lock:
+            if self._server is not None:
+                return
+            if self.public_url is None and self.host in ("0.0.0.0", ""):
+                print("[WARN] FileServer sem public_url: as URLs usarão 127.0.0.1 e só serão acessíveis por uma API Evolution local.")
+            server = ThreadingHTTPServer((self.host, self.port), self._handler())
+            server.daemon_threads = True
+            self.port = server.server_address[1]
+            threading.Thread(target=server.serve_forever, name="file-server", daemon=True).start()
+            self._server = server
+
+    def stop(self):
+        with self._lock:
+            server, self._server = self._server, None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -1,32 +1,113 @@
 import re
+from typing import Iterable, Iterator
 
-def validate_number(number: str | int) -> str | None: # <--- Ajuste na tipagem
+_GROUP_JID = re.compile(r'^\d+@g\.us$')
+_NON_DIGITS = re.compile(r'\D')
+
+# Motivos de rejeição retornados por validate_numbers.
+REJECT_INVALID_GROUP = "invalid_group"
+REJECT_INVALID_LENGTH = "invalid_length"
+REJECT_INVALID_DDD = "invalid_ddd"
+REJECT_INVALID_MOBILE = "invalid_mobile"
+REJECT_DUPLICATE = "duplicate"
+
+def _normalize_number(number: str | int) -> tuple[str | None, str | None]:
     """
-    Valida e normaliza um número de telefone para o formato internacional brasileiro
-    ou um ID de grupo do WhatsApp.
-    ... (docstring) ...
+    Núcleo de validate_number. Retorna o número normalizado e, se inválido, o motivo da rejeição.
     """
-    
-    number_str = str(number) # <--- CONVERSÃO FEITA AQUI, NO INÍCIO
+    number_str = str(number)
 
     # Validação para grupos.
     # Retorna o JID do grupo caso seja um formato válido.
     if number_str.endswith('@g.us'):
-        return number_str if re.match(r'^\d+@g\.us$', number_str) else None
+        if _GROUP_JID.match(number_str):
+            return number_str, None
+        return None, REJECT_INVALID_GROUP
 
     # Validação para contatos.
-    number = re.sub(r'\D', '', number_str)
-    
+    # Caminho rápido: inteiros e strings só com dígitos dispensam a regex.
+    number = number_str if number_str.isdecimal() else _NON_DIGITS.sub('', number_str)
+
     if not number.startswith('55'):
         number = '55' + number
-    if len(number) not in [12, 13]:
-        return None
-    ddd = number[2:4]
-    if not (1 <= int(ddd) <= 99):
-        return None
+    if len(number) not in (12, 13):
+        return None, REJECT_INVALID_LENGTH
+    if int(number[2:4]) < 1:
+        return None, REJECT_INVALID_DDD
     if len(number) == 13 and not number[4] == '9':
-        return None
-    return number
+        return None, REJECT_INVALID_MOBILE
+    return number, None
+
+def validate_number(number: str | int) -> str | None: # <--- Ajuste na tipagem
+    """
+    Valida e normaliza um número de telefone para o formato internacional brasileiro
+    ou um ID de grupo do WhatsApp.
+    ... (docstring) ...
+    """
+    return _normalize_number(number)[0]
+
+def to_jid(number: str) -> str:
+    """Converte um número normalizado em JID de contato. JIDs de grupo são mantidos."""
+    return number if number.endswith('@g.us') else f"{number}@s.whatsapp.net"
+
+def _classify_numbers(numbers: Iterable[str | int], dedupe: bool) -> Iterator[tuple[str | None, str | None]]:
+    seen = set()
+    for value in numbers:
+        number, reason = _normalize_number(value)
+        if number is not None and dedupe:
+            if number in seen:
+                number, reason = None, REJECT_DUPLICATE
+            else:
+                seen.add(number)
+        yield number, reason
+
+def iter_validate_numbers(numbers: Iterable[str | int], dedupe: bool = True, jid: bool = False, counts: dict = None) -> Iterator[str]:
+    """
+    Normaliza números em streaming, sem carregar a entrada na memória.
+
+    Args:
+        numbers (Iterable[str | int]): Números ou JIDs de grupo (lista, gerador, coluna de DataFrame, linhas de arquivo...).
+        dedupe (bool): Descarta números repetidos após a normalização. Mantém em memória apenas os números únicos. Defaults to True.
+        jid (bool): Retorna JIDs ("5511...@s.whatsapp.net") em vez de números. Defaults to False.
+        counts (dict, optional): Dicionário atualizado com a contagem de rejeições por motivo. Defaults to None.
+
+    Yields:
+        str: Números (ou JIDs) válidos, na ordem da entrada.
+    """
+    for number, reason in _classify_numbers(numbers, dedupe):
+        if reason:
+            if counts is not None:
+                counts[reason] = counts.get(reason, 0) + 1
+            continue
+        yield to_jid(number) if jid else number
+
+def validate_numbers(numbers: Iterable[str | int], dedupe: bool = True, jid: bool = False) -> dict:
+    """
+    Valida e normaliza uma lista de números de uma só vez.
+
+    Args:
+        numbers (Iterable[str | int]): Números ou JIDs de grupo.
+        dedupe (bool): Descarta números repetidos após a normalização. Defaults to True.
+        jid (bool): Retorna JIDs em vez de números. Defaults to False.
+
+    Returns:
+        dict: Contendo:
+            - numbers (list[str]): Números (ou JIDs) válidos, na ordem da entrada.
+            - valid (list[bool]): Máscara alinhada à entrada; False para inválidos e repetidos.
+            - rejected (dict): Contagem de rejeições por motivo (invalid_group, invalid_length, invalid_ddd, invalid_mobile, duplicate).
+            - total (int): Quantidade de itens lidos.
+    """
+    counts = {}
+    valid = []
+    result = []
+    for number, reason in _classify_numbers(numbers, dedupe):
+        if reason:
+            counts[reason] = counts.get(reason, 0) + 1
+            valid.append(False)
+            continue
+        valid.append(True)
+        result.append(to_jid(number) if jid else number)
+    return {"numbers": result, "valid": valid, "rejected": counts, "total": len(valid)}
 
 
 def calculate_send_delay(loop_index: int, delay_min: int = 5, delay_max: int = 30, delay_const: int = 10) -> int:
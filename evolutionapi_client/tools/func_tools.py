@@ -1,10 +1,11 @@
 import os
+import itertools
 import requests
-import fitz # PyMuPDF
-from PIL import Image
 import io
 import base64
 import json
+import mimetypes
+from evolutionapi_client.serialization import response_json
 
 def get_file_size_mb(caminho_arquivo: str):
     """
@@ -13,24 +14,335 @@ def get_file_size_mb(caminho_arquivo: str):
 
     return os.path.getsize(caminho_arquivo) / (1024 * 1024)
 
-def compress_pdf_file(input_path: str, output_path: str, quality: int = 50) -> str:
-    doc = fitz.open(input_path)
-    images = []
+def get_media_info(file_path: str) -> dict:
+    """
+    Valida o arquivo e detecta seu MIME type e o tipo de mídia aceito pela API.
+
+    Args:
+        file_path (str): Caminho do arquivo.
 
-    for page in doc:
-        pix = page.get_pixmap(dpi=150)  # você pode ajustar o DPI
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        compressed_io = io.BytesIO()
-        img.save(compressed_io, format="JPEG", quality=quality)
-        images.append(Image.open(io.BytesIO(compressed_io.getvalue())))
-    doc.close()
+    Returns:
+        dict: Contendo `mime_type` (ex: "image/jpeg") e `media_type` ("image", "video", "audio" ou "document").
+
+    Raises:
+        FileNotFoundError: Se o arquivo não existir.
+        ValueError: Se o caminho não for um arquivo ou o MIME type não puder ser determinado.
+    """
+    # Validate file path
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"Arquivo '{file_path}' não encontrado.")
+    if not os.path.isfile(file_path):
+        raise ValueError(f"O caminho '{file_path}'  não aponta para um arquivo.")
+
+    # Get mimetype file.
+    mime_type, _ = mimetypes.guess_type(file_path)
+    if not mime_type:
+        raise ValueError("Não foi possível determinar o MIME type do arquivo.")
+
+    # get media_type.
+    if mime_type.startswith("image/"):
+        media_type = "image"
+    elif mime_type.startswith("video/"):
+        media_type = "video"
+    elif mime_type.startswith("audio/"):
+        media_type = "audio"
+    else:
+        media_type = "document"
+
+    return {"mime_type": mime_type, "media_type": media_type}
+
+def _render_pdf_pages(input_path: str, start: int, stop: int, dpi: int, quality: int) -> list[tuple]:
+    """
+    Renderiza as páginas [start, stop) do PDF e as codifica em JPEG. Executado nos processos do pool.
+
+    Returns:
+        list[tuple]: (jpeg, largura_px, altura_px, largura_pt, altura_pt) de cada página.
+    """
+    import fitz # PyMuPDF
+    from PIL import Image
+
+    pages = []
+    with fitz.open(input_path) as doc:
+        for number in range(start, stop):
+            page = doc[number]
+            pix = page.get_pixmap(dpi=dpi)
+            # O encoder JPEG do Pillow é bem mais rápido que Pixmap.tobytes("jpeg").
+            buffer = io.BytesIO()
+            Image.frombytes("RGB", (pix.width, pix.height), pix.samples).save(buffer, format="JPEG", quality=quality)
+            pages.append((buffer.getvalue(), pix.width, pix.height, page.rect.width, page.rect.height))
+            del pix
+            # Descarta o cache de recursos decodificados do MuPDF para a memória não crescer com o documento.
+            fitz.TOOLS.store_shrink(100)
+    return pages
+
+class _JPEGPDFWriter:
+    def __init__(self, output_path: str):
+        """
+        Escreve um PDF com uma imagem JPEG por página diretamente no disco, sem manter as páginas em memória.
+        """
+        self.file = open(output_path, "wb")
+        self.offsets = {}
+        self.kids = []
+        self.next_id = 3 # 1 = Catalog, 2 = Pages
+        self.file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def _object(self, obj_id: int, body: bytes, stream: bytes = None):
+        self.offsets[obj_id] = self.file.tell()
+        self.file.write(f"{obj_id} 0 obj\n".encode() + body)
+        if stream is not None:
+            self.file.write(b"\nstream\n" + stream + b"\nendstream")
+        self.file.write(b"\nendobj\n")
+
+    def add_page(self, jpeg: bytes, width_px: int, height_px: int, width_pt: float, height_pt: float):
+        image_id, content_id, page_id = self.next_id, self.next_id + 1, self.next_id + 2
+        self.next_id += 3
+        self._object(image_id, (
+            f"<< /Type /XObject /Subtype /Image /Width {width_px} /Height {height_px} /ColorSpace /DeviceRGB "
+            f"/BitsPerComponent 8 /Filter /DCTDecode /Length {len(jpeg)} >>"
+        ).encode(), jpeg)
+        content = f"q {width_pt:.2f} 0 0 {height_pt:.2f} 0 0 cm /Im0 Do Q".encode()
+        self._object(content_id, f"<< /Length {len(content)} >>".encode(), content)
+        self._object(page_id, (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width_pt:.2f} {height_pt:.2f}] "
+            f"/Resources << /XObject << /Im0 {image_id} 0 R >> >> /Contents {content_id} 0 R >>"
+        ).encode())
+        self.kids.append(page_id)
+
+    def close(self):
+        kids = " ".join(f"{kid} 0 R" for kid in self.kids)
+        self._object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        self._object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(self.kids)} >>".encode())
+        xref = self.file.tell()
+        lines = [f"xref\n0 {self.next_id}\n", "0000000000 65535 f \n"]
+        lines += [f"{self.offsets[obj_id]:010d} 00000 n \n" for obj_id in range(1, self.next_id)]
+        lines.append(f"trailer\n<< /Size {self.next_id} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n")
+        self.file.write("".join(lines).encode())
+        self.file.close()
+
+def compress_pdf_file(
+    input_path: str,
+    output_path: str,
+    quality: int = 50,
+    dpi: int = 150,
+    workers: int = None,
+    chunk_pages: int = 4
+) -> str:
+    """
+    Comprime um PDF rasterizando cada página como JPEG.
 
-    # Salvar imagens como um novo PDF
-    if images:
-        images[0].save(output_path, save_all=True, append_images=images[1:], format="PDF")
+    As páginas são renderizadas e codificadas em paralelo por um pool de processos, em blocos de
+    `chunk_pages` páginas, e gravadas no arquivo de saída na ordem em que ficam prontas. Apenas alguns
+    blocos ficam em memória ao mesmo tempo, independentemente do tamanho do documento.
+
+    Args:
+        input_path (str): Caminho do PDF original.
+        output_path (str): Caminho do PDF comprimido.
+        quality (int): Qualidade JPEG (1-100). Defaults to 50.
+        dpi (int): Resolução de renderização das páginas. Defaults to 150.
+        workers (int, optional): Processos do pool. Defaults to os.cpu_count(); 1 processa no próprio processo.
+        chunk_pages (int): Páginas por tarefa enviada ao pool. Defaults to 4.
+
+    Returns:
+        str: O caminho do PDF comprimido.
+    """
+    # PyMuPDF e Pillow são importados apenas quando usados, para não pesar no import do cliente.
+    import fitz # PyMuPDF
+
+    with fitz.open(input_path) as doc:
+        page_count = doc.page_count
+    ranges = [(start, min(start + chunk_pages, page_count)) for start in range(0, page_count, chunk_pages)]
+    workers = min(workers or os.cpu_count() or 1, len(ranges) or 1)
+
+    writer = _JPEGPDFWriter(output_path)
+    try:
+        if workers == 1:
+            for start, stop in ranges:
+                for page in _render_pdf_pages(input_path, start, stop, dpi, quality):
+                    writer.add_page(*page)
+        else:
+            from collections import deque
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(workers) as executor:
+                pending = deque()
+                ranges = iter(ranges)
+                # Mantém no máximo 2 blocos por processo em andamento para limitar a memória.
+                for start, stop in itertools.islice(ranges, workers * 2):
+                    pending.append(executor.submit(_render_pdf_pages, input_path, start, stop, dpi, quality))
+                while pending:
+                    pages = pending.popleft().result()
+                    for start, stop in itertools.islice(ranges, 1):
+                        pending.append(executor.submit(_render_pdf_pages, input_path, start, stop, dpi, quality))
+                    for page in pages:
+                        writer.add_page(*page)
+                    del pages
+    except BaseException:
+        writer.file.close()
+        os.remove(output_path)
+        raise
+    writer.close()
 
     return output_path
 
+def _encode_image(image, output_path: str, quality: int, scale: float):
+    if scale < 1:
+        image = image.resize((max(1, round(image.width * scale)), max(1, round(image.height * scale))))
+    image.save(output_path, format="JPEG", quality=quality, optimize=True)
+
+def compress_to_target(
+    file_path: str,
+    max_mb: float,
+    output_path: str = None,
+    min_quality: int = 20,
+    max_quality: int = 90,
+    dpi: int = 150,
+    min_scale: float = 0.25
+) -> str:
+    """
+    Comprime uma imagem ou PDF para que o arquivo final caiba em `max_mb`, com a maior qualidade possível.
+
+    Para cada resolução, testa primeiro a qualidade mínima: se não couber, reduz a resolução (DPI no PDF,
+    dimensões na imagem) na proporção estimada pelo tamanho obtido; se couber, faz busca binária pela maior
+    qualidade JPEG que ainda cabe no limite. Cada tentativa é uma codificação completa, por isso a busca usa
+    degraus de 5 pontos de qualidade (no máximo ~4 tentativas por resolução).
+
+    Args:
+        file_path (str): Caminho da imagem ou do PDF.
+        max_mb (float): Tamanho máximo do arquivo final, em MB.
+        output_path (str, optional): Caminho do arquivo comprimido. Defaults to um arquivo temporário.
+        min_quality (int): Menor qualidade JPEG aceita antes de reduzir a resolução; limitada a `max_quality`. Defaults to 20.
+        max_quality (int): Maior qualidade JPEG testada. Defaults to 90.
+        dpi (int): Resolução inicial de renderização dos PDFs. Defaults to 150.
+        min_scale (float): Menor fração da resolução inicial aceita. Defaults to 0.25.
+
+    Returns:
+        str: `file_path`, se o arquivo já couber no limite, ou o caminho do arquivo comprimido.
+
+    Raises:
+        ValueError: Se o arquivo não for imagem nem PDF ou não couber no limite nem na menor resolução.
+    """
+    if get_file_size_mb(file_path) <= max_mb:
+        return file_path
+
+    import tempfile
+
+    mime_type = get_media_info(file_path)["mime_type"]
+    if mime_type == "application/pdf":
+        suffix = ".pdf"
+        encode = lambda path, quality, scale: compress_pdf_file(file_path, path, quality, dpi=max(1, round(dpi * scale)))
+    elif mime_type.startswith("image/"):
+        from PIL import Image
+
+        suffix = ".jpg"
+        with Image.open(file_path) as source:
+            image = source.convert("RGB")
+        encode = lambda path, quality, scale: _encode_image(image, path, quality, scale)
+    else:
+        raise ValueError(f"Compressão disponível apenas para imagens e PDFs (recebido {mime_type}).")
+
+    target = max_mb * 1024 * 1024
+    fd, best_path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    trial_path = best_path + ".trial"
+    # Com max_quality abaixo de min_quality (ex: preprocess_image com quality=10), só essa qualidade é testada.
+    levels = list(range(min(min_quality, max_quality), max_quality + 1, 5))
+    scale = 1.0
+    try:
+        while True:
+            encode(best_path, levels[0], scale)
+            size = os.path.getsize(best_path)
+            if size <= target:
+                break
+            if scale <= min_scale:
+                raise ValueError(f"Não foi possível comprimir '{file_path}' para {max_mb} MB.")
+            # O tamanho do JPEG é aproximadamente proporcional à quantidade de pixels (escala ao quadrado).
+            scale = max(min_scale, min(scale * 0.9, scale * (target / size) ** 0.5 * 0.95))
+
+        low, high = 1, len(levels) - 1
+        while low <= high:
+            middle = (low + high) // 2
+            encode(trial_path, levels[middle], scale)
+            if os.path.getsize(trial_path) <= target:
+                os.replace(trial_path, best_path)
+                low = middle + 1
+            else:
+                high = middle - 1
+    except BaseException:
+        os.remove(best_path)
+        raise
+    finally:
+        if os.path.exists(trial_path):
+            os.remove(trial_path)
+
+    if output_path is None:
+        return best_path
+    import shutil
+    shutil.move(best_path, output_path)
+    return output_path
+
+def _save_jpeg(image, output_path: str, quality: int, icc_profile: bytes = None):
+    # Sem o argumento exif, o Pillow não grava os metadados EXIF (GPS, modelo da câmera etc.).
+    image.save(output_path, format="JPEG", quality=quality, optimize=True, progressive=True, icc_profile=icc_profile)
+
+def preprocess_image(
+    file_path: str,
+    output_path: str,
+    max_edge: int = 1600,
+    quality: int = 80,
+    max_kb: float = None,
+    thumbnail_path: str = None,
+    thumbnail_edge: int = 320
+) -> dict:
+    """
+    Prepara uma foto para envio: aplica a orientação do EXIF, reduz o maior lado para `max_edge`, remove os
+    metadados EXIF e recodifica em JPEG. Opcionalmente gera uma miniatura.
+
+    Fotos JPEG grandes são decodificadas já em escala reduzida (Image.draft), o que evita decodificar os
+    12 megapixels inteiros quando o destino tem 1600 px.
+
+    Args:
+        file_path (str): Caminho da imagem original.
+        output_path (str): Caminho do JPEG gerado.
+        max_edge (int): Tamanho máximo, em pixels, do maior lado. Defaults to 1600.
+        quality (int): Qualidade JPEG. Defaults to 80.
+        max_kb (float, optional): Se o resultado passar deste tamanho, é comprimido com compress_to_target. Defaults to None.
+        thumbnail_path (str, optional): Caminho da miniatura JPEG. Defaults to None (sem miniatura).
+        thumbnail_edge (int): Maior lado da miniatura, em pixels. Defaults to 320.
+
+    Returns:
+        dict: Contendo `path`, `thumbnail` (ou None), `width`, `height` e `bytes` do JPEG gerado.
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(file_path) as source:
+        icc_profile = source.info.get("icc_profile")
+        # draft só reduz por potências de 2 e nunca abaixo do tamanho pedido; o ajuste fino é feito em thumbnail().
+        source.draft("RGB", (max_edge, max_edge))
+        image = ImageOps.exif_transpose(source)
+        if image.mode in ("RGBA", "LA", "P"):
+            image = image.convert("RGBA")
+            background = Image.new("RGB", image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel("A"))
+            image = background
+        elif image.mode != "RGB":
+            image = image.convert("RGB")
+    image.thumbnail((max_edge, max_edge), Image.LANCZOS, reducing_gap=3.0)
+    _save_jpeg(image, output_path, quality, icc_profile)
+
+    if max_kb is not None and os.path.getsize(output_path) > max_kb * 1024:
+        compress_to_target(output_path, max_kb / 1024, output_path=output_path, max_quality=quality)
+
+    thumbnail = None
+    if thumbnail_path:
+        preview = image.copy()
+        preview.thumbnail((thumbnail_edge, thumbnail_edge), Image.LANCZOS)
+        _save_jpeg(preview, thumbnail_path, 70, icc_profile)
+        thumbnail = thumbnail_path
+
+    with Image.open(output_path) as result:
+        width, height = result.size
+    return {"path": output_path, "thumbnail": thumbnail, "width": width, "height": height, "bytes": os.path.getsize(output_path)}
+
 # def get_media_data(file_path:str) -> dict:
 #     """
 #     A partir do caminho de arquivo local, retorna uma dicionário com:
@@ -114,7 +426,7 @@ def get_api_response(response: requests.Response) -> dict:
         success = 200 <= status_code < 300
 
         try:
-            content = response.json()
+            content = response_json(response)
         except (ValueError, json.JSONDecodeError):
             content = response.text
 
@@ -176,6 +488,102 @@ def convert_to_base64(file_path: str) -> str:
         return encoded_bytes.decode("utf-8")
 
 
+class Base64JSONBody:
+    # Marcador substituído pelo conteúdo base64 do arquivo durante a serialização.
+    _PLACEHOLDER = "\x00base64\x00"
+
+    def __init__(self, payload: dict, field: str, file_path: str, chunk_size: int = 3 * 256 * 1024):
+        """
+        Corpo JSON que codifica o arquivo em base64 sob demanda, bloco a bloco, durante o envio.
+
+        O payload é serializado uma única vez com um marcador no campo `field`; o base64 do arquivo é
+        gerado em blocos entre o prefixo e o sufixo, mantendo o uso de memória constante. O tamanho final
+        é conhecido de antemão, então a requisição é enviada com Content-Length.
+
+        Args:
+            payload (dict): Payload da requisição. O valor de `field` é ignorado.
+            field (str): Campo que recebe o conteúdo base64 (ex: "media", "content").
+            file_path (str): Caminho do arquivo a ser codificado.
+            chunk_size (int): Bytes do arquivo lidos por bloco; ajustado para múltiplo de 3. Defaults to 768 KiB.
+        """
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
+
+        prefix, suffix = json.dumps({**payload, field: self._PLACEHOLDER}).split(json.dumps(self._PLACEHOLDER))
+        self.prefix = (prefix + '"').encode("utf-8")
+        self.suffix = ('"' + suffix).encode("utf-8")
+        self.file_path = file_path
+        self.chunk_size = max(3, chunk_size - chunk_size % 3)
+        self.file_size = os.path.getsize(file_path)
+        self._buffer = b""
+        self._chunks = self._iter_chunks()
+
+    def __len__(self) -> int:
+        return len(self.prefix) + 4 * ((self.file_size + 2) // 3) + len(self.suffix)
+
+    def _iter_chunks(self):
+        yield self.prefix
+        with open(self.file_path, "rb") as file:
+            while chunk := file.read(self.chunk_size):
+                yield base64.b64encode(chunk)
+        yield self.suffix
+
+    def __iter__(self):
+        return self._iter_chunks()
+
+    async def aiter(self):
+        """Iterador assíncrono do corpo, para clientes como o httpx.AsyncClient."""
+        for chunk in self._iter_chunks():
+            yield chunk
+
+    def read(self, size: int = -1) -> bytes:
+        """Lê até `size` bytes do corpo, como um arquivo. Usado por http.client durante o envio."""
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def rewind(self):
+        """Reinicia a leitura do corpo, permitindo reenviar a mesma requisição."""
+        self._buffer = b""
+        self._chunks = self._iter_chunks()
+
+def media_body_kwargs(payload: dict, field: str, file_path: str, stream_threshold_mb: float = 5, media_cache=None, file_server=None, url_threshold_mb: float = 0) -> dict:
+    """
+    Monta os argumentos de corpo da requisição de envio de mídia.
+
+    Com `file_server`, arquivos maiores que `url_threshold_mb` são enviados por URL: o campo `field` recebe uma
+    URL assinada e a API baixa o arquivo, sem upload nem base64 pelo cliente. Nos demais casos, arquivos até
+    `stream_threshold_mb` são codificados em memória e enviados via `json=`; arquivos maiores são enviados via
+    `data=` com um Base64JSONBody, sem carregar o arquivo inteiro na memória.
+
+    Args:
+        payload (dict): Payload da requisição. O campo `field` é preenchido com o base64 do arquivo.
+        field (str): Campo que recebe o conteúdo base64 (ex: "media", "content").
+        file_path (str): Caminho do arquivo.
+        stream_threshold_mb (float): Tamanho a partir do qual o corpo é gerado em streaming. Defaults to 5.
+        media_cache (MediaCache, optional): Cache do base64 de arquivos pequenos. Defaults to None.
+        file_server (FileServer, optional): Servidor de arquivos que gera as URLs. Defaults to None.
+        url_threshold_mb (float): Tamanho a partir do qual o arquivo é enviado por URL. Defaults to 0.
+
+    Returns:
+        dict: {"json": payload} ou {"data": Base64JSONBody}.
+    """
+    size_mb = get_file_size_mb(file_path)
+    if file_server is not None and size_mb > url_threshold_mb:
+        return {"json": {**payload, field: file_server.url_for(file_path)}}
+    if size_mb > stream_threshold_mb:
+        return {"data": Base64JSONBody(payload, field, file_path)}
+    if media_cache is not None:
+        return {"json": {**payload, field: media_cache.get_variant(file_path, "base64", convert_to_base64)}}
+    return {"json": {**payload, field: convert_to_base64(file_path)}}
+
 if __name__ == "__main__":
     i_file = 'laudo.pdf'
     o_file = 'c.pdf'
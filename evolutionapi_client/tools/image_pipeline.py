@@ -0,0 +1,129 @@
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable
+from evolutionapi_client.tools.func_tools import preprocess_image
+from evolutionapi_client.tools.media_cache import MediaCache
+
+# Formatos reprocessados. GIFs (animação) e WebP (figurinhas) seguem como estão.
+PROCESSED_TYPES = ("image/jpeg", "image/png", "image/bmp", "image/tiff")
+
+# Quantidade fixa de locks por imagem (escolhidos pelo hash), para não guardar um lock por imagem já vista.
+LOCK_STRIPES = 64
+
+class ImagePipeline:
+    def __init__(
+        self,
+        media_cache: MediaCache = None,
+        output_dir: str = None,
+        max_edge: int = 1600,
+        quality: int = 80,
+        max_kb: float = None,
+        thumbnail_edge: int = 320,
+        workers: int = None,
+        processes: bool = False
+    ):
+        """
+        Pré-processamento de imagens antes do envio (redução, remoção de EXIF, recodificação e miniatura).
+
+        O WhatsApp recomprime as fotos de qualquer forma; enviar a foto de 12 MP original só gasta banda e CPU do
+        servidor. Os resultados são gravados em `output_dir` com o hash SHA-256 do conteúdo original no nome, então
+        cada imagem é processada uma única vez, mesmo entre execuções, e o mesmo arquivo em caminhos diferentes
+        reaproveita o resultado. Pedidos simultâneos da mesma imagem aguardam um único processamento.
+
+        Args:
+            media_cache (MediaCache, optional): Cache usado para o hash dos arquivos e o resultado em memória. Defaults to None (cria um).
+            output_dir (str, optional): Diretório dos arquivos gerados. Defaults to None (diretório temporário do sistema).
+            max_edge (int): Tamanho máximo, em pixels, do maior lado. Defaults to 1600.
+            quality (int): Qualidade JPEG. Defaults to 80.
+            max_kb (float, optional): Tamanho máximo do JPEG gerado, em KB. Defaults to None.
+            thumbnail_edge (int): Maior lado da miniatura; 0 desativa a miniatura. Defaults to 320.
+            workers (int, optional): Imagens processadas em paralelo. Defaults to os.cpu_count().
+            processes (bool): Usa um pool de processos em vez de threads (o Pillow libera o GIL na maior
+                parte do trabalho, então threads costumam bastar). Defaults to False.
+        """
+        self.media_cache = media_cache or MediaCache()
+        self.output_dir = output_dir or os.path.join(tempfile.gettempdir(), "evolutionapi_images")
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.max_edge = max_edge
+        self.quality = quality
+        self.max_kb = max_kb
+        self.thumbnail_edge = thumbnail_edge
+        self.variant = f"image-{max_edge}-q{quality}-{max_kb or 0:g}kb-t{thumbnail_edge}"
+        self.workers = workers or os.cpu_count() or 1
+        executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        self._executor = executor(max_workers=self.workers)
+        self._asset_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        self._lock = threading.Lock()
+        self.processed = 0
+
+    def is_processed_type(self, file_path: str) -> bool:
+        return self.media_cache.media_info(file_path)["mime_type"] in PROCESSED_TYPES
+
+    def _paths(self, digest: str) -> tuple[str, str | None]:
+        base = os.path.join(self.output_dir, f"{digest[:32]}-{self.variant}")
+        return base + ".jpg", (base + "-thumb.jpg" if self.thumbnail_edge else None)
+
+    def _build(self, file_path: str, digest: str) -> dict:
+        output_path, thumbnail_path = self._paths(digest)
+        if os.path.exists(output_path) and (thumbnail_path is None or os.path.exists(thumbnail_path)):
+            return {"path": output_path, "thumbnail": thumbnail_path, "bytes": os.path.getsize(output_path)}
+        # Grava em arquivos temporários e renomeia: outro processo nunca vê um JPEG pela metade.
+        # A extensão .jpg é mantida para que o MIME type continue detectável (compress_to_target).
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp.jpg"
+        temp_output = output_path + suffix
+        temp_thumbnail = thumbnail_path + suffix if thumbnail_path else None
+        result = self._executor.submit(
+            preprocess_image, file_path, temp_output, self.max_edge, self.quality, self.max_kb,
+            temp_thumbnail, self.thumbnail_edge
+        ).result()
+        if temp_thumbnail:
+            os.replace(temp_thumbnail, thumbnail_path)
+        os.replace(temp_output, output_path)
+        with self._lock:
+            self.processed += 1
+        return {**result, "path": output_path, "thumbnail": thumbnail_path}
+
+    def process(self, file_path: str) -> dict:
+        """
+        Retorna a versão pré-processada da imagem, processando-a apenas se ainda não estiver em cache.
+
+        Returns:
+            dict: Contendo `path` (JPEG gerado, ou o próprio arquivo se não for uma imagem reprocessável),
+                `thumbnail` (ou None) e `bytes`.
+        """
+        if not self.is_processed_type(file_path):
+            return {"path": file_path, "thumbnail": None, "bytes": os.path.getsize(file_path)}
+        digest = self.media_cache.fingerprint(file_path)
+        # Pedidos simultâneos da mesma imagem esperam o primeiro e depois encontram o resultado em cache.
+        with self._asset_locks[int(digest[:8], 16) % LOCK_STRIPES]:
+            result = self.media_cache.get_variant(file_path, self.variant, lambda path: self._build(path, digest), lambda _: 0)
+            if not os.path.exists(result["path"]) or (result["thumbnail"] and not os.path.exists(result["thumbnail"])):
+                # `output_dir` foi limpo depois que o resultado entrou em cache: gera os arquivos de novo.
+                result = self._build(file_path, digest)
+                self.media_cache.put((digest, self.variant), result, 0)
+            return result
+
+    def path(self, file_path: str) -> str:
+        """Atalho para `process(file_path)["path"]`, usado pelos senders."""
+        return self.process(file_path)["path"]
+
+    def prepare(self, file_paths: Iterable[str]) -> list[dict]:
+        """
+        Processa várias imagens em paralelo (ex: os anexos de uma campanha antes do primeiro envio).
+
+        Returns:
+            list[dict]: Resultados de `process`, na ordem de `file_paths`.
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(self.process, file_paths))
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,136 @@
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+from evolutionapi_client.tools.func_tools import get_media_info
+
+def _size_of(value: Any) -> int:
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    return sys.getsizeof(value)
+
+class MediaCache:
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_paths: int = 10000):
+        """
+        Cache LRU, limitado em bytes, de dados derivados de arquivos de mídia (base64, MIME, versões pré-processadas).
+
+        As entradas são indexadas pelo hash SHA-256 do conteúdo do arquivo, então o mesmo arquivo em caminhos
+        diferentes compartilha o cache. O hash de cada caminho é memorizado por (tamanho, mtime), de modo que
+        um envio repetido custa apenas um os.stat.
+
+        Args:
+            max_bytes (int): Tamanho máximo somado das entradas em cache. Defaults to 64 MiB.
+            max_paths (int): Quantidade máxima de caminhos com hash memorizado (LRU). Defaults to 10000.
+        """
+        self.max_bytes = max_bytes
+        self.max_paths = max_paths
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._fingerprints = OrderedDict()
+        self._lock = threading.RLock()
+
+    def fingerprint(self, file_path: str) -> str:
+        """
+        Retorna o hash SHA-256 do conteúdo do arquivo, recalculando apenas se o arquivo mudou.
+
+        Raises:
+            FileNotFoundError: Se o arquivo não for encontrado.
+        """
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
+        st = os.stat(file_path)
+        path = os.path.abspath(file_path)
+        stat_key = (st.st_size, st.st_mtime_ns)
+
+        with self._lock:
+            memo = self._fingerprints.get(path)
+            if memo is not None and memo[0] == stat_key:
+                self._fingerprints.move_to_end(path)
+                return memo[1]
+
+        sha = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            while chunk := file.read(1024 * 1024):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        with self._lock:
+            # Indexado pelo caminho: um arquivo alterado substitui o hash antigo em vez de acumular entradas.
+            self._fingerprints[path] = (stat_key, digest)
+            self._fingerprints.move_to_end(path)
+            while len(self._fingerprints) > self.max_paths:
+                self._fingerprints.popitem(last=False)
+        return digest
+
+    def media_info(self, file_path: str) -> dict:
+        """
+        Retorna o get_media_info do arquivo a partir do cache.
+
+        O MIME type vem da extensão, não do conteúdo, então a extensão faz parte da chave: o mesmo conteúdo salvo
+        como .jpg e .pdf gera entradas diferentes.
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        return self.get_variant(file_path, f"info{extension}", get_media_info, lambda _: 0)
+
+    def get_variant(self, file_path: str, variant: str, builder: Callable[[str], Any], size_of: Callable[[Any], int] = _size_of) -> Any:
+        """
+        Retorna uma variante do arquivo em cache ou a constrói com `builder(file_path)` e armazena.
+
+        Args:
+            file_path (str): Caminho do arquivo.
+            variant (str): Nome da variante (ex: "base64", "info.jpg", "jpeg-1600").
+            builder (Callable[[str], Any]): Função que gera a variante a partir do caminho do arquivo.
+            size_of (Callable[[Any], int], optional): Mede o tamanho da variante em bytes. Defaults to len() para bytes/str.
+
+        Returns:
+            Any: Valor da variante.
+        """
+        key = (self.fingerprint(file_path), variant)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+
+        value = builder(file_path)
+        self.put(key, value, size_of(value))
+        return value
+
+    def put(self, key: tuple, value: Any, nbytes: int):
+        """Armazena um valor já construído, descartando as entradas menos usadas se necessário."""
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, nbytes)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._fingerprints.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: hits, misses, evictions, entries e bytes atualmente em cache.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes
+            }
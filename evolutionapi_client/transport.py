@@ -0,0 +1,113 @@
+import requests
+from contextlib import nullcontext
+from time import sleep
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from .resilience import Resilience
+from .metrics import Metrics, endpoint_label
+from .serialization import dumps
+
+def is_connect_error(error: Exception) -> bool:
+    """Indica se a exceção do requests ocorreu antes de a requisição chegar ao servidor."""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if isinstance(error, requests.ConnectionError) and error.args else None
+    return isinstance(reason, NewConnectionError)
+
+class HTTPTransport:
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        timeout: float | tuple | None = (10, 120),
+        resilience: Resilience | bool = True,
+        metrics: Metrics = None
+    ):
+        """
+        Transporte HTTP compartilhado com pool de conexões keep-alive.
+
+        Uma única instância é criada pelo EvolutionAPIClient e repassada a todos os gerenciadores
+        e classes de envio, evitando um novo handshake TCP/TLS a cada requisição.
+
+        Args:
+            pool_connections (int): Quantidade de hosts distintos mantidos em cache no pool. Defaults to 10.
+            pool_maxsize (int): Limite de conexões simultâneas mantidas por host. Defaults to 10.
+            pool_block (bool): Se True, bloqueia quando o limite por host é atingido em vez de abrir conexões extras. Defaults to False.
+            timeout (float | tuple | None): Timeout padrão das requisições, no formato (connect, read). Defaults to (10, 120).
+            resilience (Resilience | bool): Camada de retentativas e circuit breaker. True usa a configuração padrão
+                e False desativa. Defaults to True.
+            metrics (Metrics, optional): Coletor de métricas das requisições e sleeps. Defaults to None (desativado).
+        """
+        self.timeout = timeout
+        self.metrics = metrics
+        self.resilience = Resilience() if resilience is True else (resilience or None)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, method: str, url: str, instance: str = None, **kwargs) -> requests.Response:
+        """
+        Realiza uma requisição HTTP reaproveitando as conexões do pool.
+
+        Args:
+            method (str): Método HTTP (get, post, put, delete).
+            url (str): URL completa do endpoint.
+            instance (str, optional): Instância alvo, usada como chave do circuit breaker. Defaults to None.
+
+        Returns:
+            requests.Response: Resposta da requisição.
+
+        Raises:
+            CircuitOpenError: Se o circuito da instância estiver aberto.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        if kwargs.get("json") is not None:
+            # Serializa com o backend rápido (orjson, se instalado) em vez do json do requests.
+            kwargs["data"] = dumps(kwargs.pop("json"))
+            kwargs["headers"] = {"Content-Type": "application/json", **(kwargs.get("headers") or {})}
+        send = lambda: self.session.request(method.upper(), url, **kwargs)
+        if self.metrics is not None:
+            send = self.metrics.instrument(send, method, endpoint_label(url, instance))
+        if self.resilience is None:
+            return send()
+        rewind = getattr(kwargs.get("data"), "rewind", None)
+        return self.resilience.call(method, instance or "*", send, is_connect_error, rewind)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("get", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("post", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        return self.request("put", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        return self.request("delete", url, **kwargs)
+
+    def sleep(self, seconds: float, reason: str = "delay"):
+        """Sleep dos envios (delay entre mensagens), contabilizado nas métricas."""
+        if seconds > 0:
+            sleep(seconds)
+        if self.metrics is not None:
+            self.metrics.observe_sleep(seconds, reason)
+
+    def phase(self, name: str):
+        """Context manager que mede uma fase local (ex: "encode") quando as métricas estão ativas."""
+        return nullcontext() if self.metrics is None else self.metrics.phase(name)
+
+    def close(self):
+        """Fecha todas as conexões abertas do pool."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
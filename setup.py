@@ -9,4 +9,8 @@ setup(
         "Pillow",    # O nome do pacote é Pillow (o import é PIL)
         "PyMuPDF",   # O nome do pacote é PyMuPDF (o import é fitz)
     ],
+    extras_require={
+        "async": ["httpx"],
+        "fast": ["orjson"],
+    },
 )
\ No newline at end of file
@@ -0,0 +1,59 @@
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from mock_server import MockConfig, start_mock_server
+
+@pytest.fixture
+def mock_api():
+    """Servidor mock da EvolutionAPI (benchmarks/mock_server.py). Retorna (url, config)."""
+    config = MockConfig()
+    server, url = start_mock_server(config)
+    yield url, config
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def stub_api():
+    """
+    Fábrica de servidores HTTP com respostas fixas.
+
+    `stub_api(handler)` inicia um servidor em que `handler(method, path)` retorna (status, content_type, corpo
+    em bytes) e retorna a URL base.
+    """
+    servers = []
+
+    def start(handler) -> str:
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length", 0))
+                if length:
+                    self.rfile.read(length)
+                status, content_type, body = handler(self.command, self.path)
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
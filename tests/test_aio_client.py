@@ -0,0 +1,33 @@
+import asyncio
+import time
+from evolutionapi_client.aio.client import AsyncEvolutionAPIClient
+from mock_server import MockConfig, start_mock_server
+
+def test_set_instance_binds_every_manager(mock_api):
+    url, config = mock_api
+
+    async def scenario():
+        async with AsyncEvolutionAPIClient(url, "key", "instance-1") as client:
+            names = {client.instance.instance_name, client.group.instance_name, client.chatwoot.instance_name, client.message.instance_name}
+            groups = await client.group.fetch_all_groups(get_participants=False)
+            return names, len(groups)
+
+    assert asyncio.run(scenario()) == ({"instance-1"}, config.groups)
+
+def test_concurrent_sends_overlap():
+    config = MockConfig(latency_ms=100)
+    server, url = start_mock_server(config)
+
+    async def scenario():
+        async with AsyncEvolutionAPIClient(url, "key", "instance-0") as client:
+            start = time.monotonic()
+            results = await asyncio.gather(*(client.message.send_text_message(f"55119999{index:05d}1", "oi", delay=0) for index in range(10)))
+            return results, time.monotonic() - start
+
+    try:
+        results, elapsed = asyncio.run(scenario())
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert all("key" in result for result in results)
+    assert elapsed < 0.5
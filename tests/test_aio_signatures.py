@@ -0,0 +1,34 @@
+import inspect
+import pytest
+from evolutionapi_client.aio.chatwoot import AsyncChatwootIntegration
+from evolutionapi_client.aio.group import AsyncGroupManager
+from evolutionapi_client.aio.instance import AsyncInstanceManager
+from evolutionapi_client.aio.send import AsyncSendLocation, AsyncSendMedia, AsyncSendMessage, AsyncSendStatus
+from evolutionapi_client.group.manager import GroupManager
+from evolutionapi_client.instance.manager import InstanceManager
+from evolutionapi_client.integrations.chatwoot import ChatwootIntegration
+from evolutionapi_client.send.location import SendLocation
+from evolutionapi_client.send.media import SendMedia
+from evolutionapi_client.send.message import SendMessage
+from evolutionapi_client.send.status import SendStatus
+
+PAIRS = [
+    (AsyncInstanceManager, InstanceManager),
+    (AsyncGroupManager, GroupManager),
+    (AsyncChatwootIntegration, ChatwootIntegration),
+    (AsyncSendMessage, SendMessage),
+    (AsyncSendMedia, SendMedia),
+    (AsyncSendStatus, SendStatus),
+    (AsyncSendLocation, SendLocation)
+]
+
+def parameters(function) -> list[tuple]:
+    return [(parameter.name, parameter.kind, parameter.default) for parameter in inspect.signature(function).parameters.values()]
+
+@pytest.mark.parametrize("async_class, sync_class", PAIRS)
+def test_async_methods_mirror_sync_signatures(async_class, sync_class):
+    """Trocar para o cliente assíncrono deve exigir apenas o `await`."""
+    for name, function in vars(async_class).items():
+        if name.startswith("_") or not inspect.iscoroutinefunction(function) or not hasattr(sync_class, name):
+            continue
+        assert parameters(function) == parameters(getattr(sync_class, name)), f"{async_class.__name__}.{name}"
@@ -0,0 +1,41 @@
+import base64
+import json
+import os
+from evolutionapi_client import EvolutionAPIClient
+from evolutionapi_client.tools.func_tools import Base64JSONBody, media_body_kwargs
+
+def make_file(tmp_path, size: int) -> str:
+    path = tmp_path / "arquivo.bin"
+    path.write_bytes(os.urandom(size))
+    return str(path)
+
+def test_body_matches_in_memory_encoding(tmp_path):
+    path = make_file(tmp_path, 100_001)
+    payload = {"number": "5511999991111", "caption": "ação \"aspas\"", "media": None}
+    body = Base64JSONBody(payload, "media", path, chunk_size=1000)
+    data = b"".join(body)
+    assert len(data) == len(body)
+    with open(path, "rb") as file:
+        assert json.loads(data) == {**payload, "media": base64.b64encode(file.read()).decode()}
+
+def test_read_and_rewind(tmp_path):
+    body = Base64JSONBody({"media": None}, "media", make_file(tmp_path, 5000), chunk_size=300)
+    pieces = []
+    while piece := body.read(777):
+        pieces.append(piece)
+    assert all(len(piece) == 777 for piece in pieces[:-1])
+    body.rewind()
+    assert body.read() == b"".join(pieces)
+
+def test_media_body_kwargs_streams_large_files(tmp_path):
+    path = make_file(tmp_path, 64 * 1024)
+    assert "json" in media_body_kwargs({}, "media", path, stream_threshold_mb=1)
+    assert isinstance(media_body_kwargs({}, "media", path, stream_threshold_mb=0.01)["data"], Base64JSONBody)
+
+def test_streamed_send_media(mock_api, tmp_path):
+    url, config = mock_api
+    path = make_file(tmp_path, 256 * 1024)
+    with EvolutionAPIClient(url, "key", "instance-0") as client:
+        client.media.stream_threshold_mb = 0.1
+        assert client.media.send_media("5511999991111", path, delay=0)["success"]
+    assert config.stats["bytes_in"] > 4 * 256 * 1024 // 3
@@ -0,0 +1,51 @@
+import json
+from evolutionapi_client import EvolutionAPIClient
+from evolutionapi_client.send.campaign import Campaign, TextSpec, parse_send_result
+from evolutionapi_client.tools.func_chat import validate_number
+
+NUMBERS = [f"5511{900000001 + index:09d}" for index in range(8)]
+
+def no_delay(index):
+    return 0
+
+def test_parse_send_result():
+    assert parse_send_result({"key": {"id": "ABC"}}) == {"ok": True, "status": None, "message_id": "ABC", "error": None}
+    assert parse_send_result({"success": False, "status_code": 500, "message": "erro"})["error"] == "erro"
+    assert parse_send_result(None)["ok"] is False
+
+def test_run_and_resume(mock_api, tmp_path):
+    url, config = mock_api
+    journal = str(tmp_path / "campaign.jsonl")
+    recipients = NUMBERS + ["123", "5511900000000", NUMBERS[0]]
+    with EvolutionAPIClient(url, "key", "instance-0") as client:
+        first = Campaign(client, TextSpec("oi"), journal, delay_policy=no_delay).run(recipients)
+        requests = config.stats["requests"]
+        second = Campaign(client, TextSpec("oi"), journal, delay_policy=no_delay).run(recipients)
+    assert first == {"sent": 8, "failed": 0, "invalid": 2, "skipped": 1, "unknown": 0}
+    assert second == {"sent": 0, "failed": 0, "invalid": 0, "skipped": 11, "unknown": 0}
+    assert config.stats["requests"] == requests
+
+def test_interrupted_send_is_not_repeated(mock_api, tmp_path):
+    url, config = mock_api
+    journal = tmp_path / "campaign.jsonl"
+    interrupted = validate_number(NUMBERS[1])
+    journal.write_text(
+        json.dumps({"recipient": validate_number(NUMBERS[0]), "state": "sent"}) + "\n"
+        + json.dumps({"recipient": interrupted, "state": "sending"}) + "\n"
+        + '{"recipient": "55119', encoding="utf-8"
+    )
+    with EvolutionAPIClient(url, "key", "instance-0") as client:
+        campaign = Campaign(client, TextSpec("oi"), str(journal), delay_policy=no_delay)
+        summary = campaign.run(NUMBERS[:3])
+        states = campaign.load_journal()
+    assert summary == {"sent": 1, "failed": 0, "invalid": 0, "skipped": 1, "unknown": 1}
+    assert states[interrupted] == "sending"
+    assert states[validate_number(NUMBERS[2])] == "sent"
+
+def test_retry_unknown_resends(mock_api, tmp_path):
+    url, _ = mock_api
+    journal = tmp_path / "campaign.jsonl"
+    journal.write_text(json.dumps({"recipient": validate_number(NUMBERS[0]), "state": "sending"}) + "\n", encoding="utf-8")
+    with EvolutionAPIClient(url, "key", "instance-0") as client:
+        summary = Campaign(client, TextSpec("oi"), str(journal), delay_policy=no_delay, retry_unknown=True).run(NUMBERS[:1])
+    assert summary["sent"] == 1
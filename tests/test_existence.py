@@ -0,0 +1,38 @@
+from evolutionapi_client import EvolutionAPIClient
+from evolutionapi_client.send.existence import ExistenceCache, missing_response
+
+MISSING = "5511900000000"
+
+def test_record_response_only_caches_the_sent_number():
+    cache = ExistenceCache()
+    assert not cache.record_response("5511999991111", missing_response(MISSING))
+    assert cache.record_response(MISSING, missing_response(MISSING))
+    assert cache.get(MISSING) is False
+    assert cache.get("5511999991111") is None
+
+def test_entries_expire():
+    cache = ExistenceCache(negative_ttl=0)
+    cache.set(MISSING, False)
+    assert cache.get(MISSING) is None
+    assert not cache.is_known_missing(MISSING)
+
+def test_known_missing_number_is_skipped(mock_api):
+    url, config = mock_api
+    cache = ExistenceCache()
+    with EvolutionAPIClient(url, "key", "instance-0", existence_cache=cache) as client:
+        first = client.message.send_text_message(MISSING, "oi", delay=0)
+        requests = config.stats["requests"]
+        second = client.message.send_text_message(MISSING, "oi", delay=0)
+    assert first["status"] == 400 and "cached" not in first
+    assert second["cached"] and config.stats["requests"] == requests
+    assert cache.stats() == {"exists": 0, "missing": 1, "skipped_sends": 1}
+
+def test_prefetch_checks_unknown_numbers_in_batches(mock_api):
+    url, config = mock_api
+    cache = ExistenceCache()
+    cache.set("5511999991111", True)
+    with EvolutionAPIClient(url, "key", "instance-0") as client:
+        requests = config.stats["requests"]
+        result = cache.prefetch(client.instance, ["5511999991111", MISSING, "5511999992222", "123"], batch_size=1)
+    assert result == {"5511999991111": True, MISSING: False, "5511999992222": True}
+    assert config.stats["requests"] == requests + 2
@@ -0,0 +1,54 @@
+import os
+from urllib.parse import urlsplit
+import pytest
+import requests
+from evolutionapi_client.tools.file_server import FileServer, parse_range
+
+@pytest.fixture
+def media(tmp_path):
+    path = tmp_path / "foto final.jpg"
+    path.write_bytes(os.urandom(10_000))
+    return str(path)
+
+def test_parse_range():
+    assert parse_range("bytes=0-99", 1000) == (0, 99)
+    assert parse_range("bytes=900-", 1000) == (900, 999)
+    assert parse_range("bytes=-100", 1000) == (900, 999)
+    assert parse_range("bytes=-5000", 1000) == (0, 999)
+    assert parse_range("bytes=990-5000", 1000) == (990, 999)
+    for invalid in ("bytes=1000-", "bytes=5-1", "bytes=-0", "bytes=-", "bytes=0-1,5-9", "items=0-1"):
+        assert parse_range(invalid, 1000) is None
+
+def test_signed_url_serves_the_file_and_ranges(media):
+    with FileServer(host="127.0.0.1") as server:
+        url = server.url_for(media)
+        full = requests.get(url, timeout=5)
+        partial = requests.get(url, headers={"Range": "bytes=100-199"}, timeout=5)
+        unsatisfiable = requests.get(url, headers={"Range": "bytes=20000-"}, timeout=5)
+    with open(media, "rb") as file:
+        data = file.read()
+    assert full.status_code == 200 and full.content == data
+    assert full.headers["Content-Type"] == "image/jpeg"
+    assert partial.status_code == 206 and partial.content == data[100:200]
+    assert partial.headers["Content-Range"] == "bytes 100-199/10000"
+    assert unsatisfiable.status_code == 416
+
+def test_tampered_expired_and_revoked_urls(media):
+    server = FileServer(host="127.0.0.1")
+    url = urlsplit(server.url_for(media))
+    path, query = url.path, url.query
+    assert server.resolve(f"{path}?{query}") == (200, os.path.abspath(media))
+    assert server.resolve(f"{path}?{query.replace('expires=', 'expires=1')}")[0] == 403
+    assert server.resolve(path)[0] == 403
+    expired = urlsplit(server.url_for(media, ttl=-10))
+    assert server.resolve(f"{expired.path}?{expired.query}")[0] == 410
+    server.revoke(media)
+    assert server.resolve(f"{path}?{query}")[0] == 404
+    server.stop()
+
+def test_urls_are_not_valid_with_another_secret(media):
+    first, second = FileServer(secret=b"a"), FileServer(secret=b"b")
+    url = urlsplit(first.url_for(media))
+    assert second.resolve(f"{url.path}?{url.query}")[0] == 403
+    first.stop()
+    second.stop()
@@ -0,0 +1,29 @@
+from evolutionapi_client.tools.func_chat import calculate_send_delay, iter_validate_numbers, validate_number, validate_numbers
+
+def test_validate_number():
+    assert validate_number("(11) 99999-1111") == "5511999991111"
+    assert validate_number(1133334444) == "551133334444"
+    assert validate_number("120363000000000000@g.us") == "120363000000000000@g.us"
+    assert validate_number("abc@g.us") is None
+    assert validate_number("123") is None
+
+def test_validate_numbers_counts_each_reject_reason():
+    result = validate_numbers(["11999991111", "+55 11 99999-1111", "123", "00999991111", "11899991111", "x@g.us"], jid=True)
+    assert result["numbers"] == ["5511999991111@s.whatsapp.net"]
+    assert result["valid"] == [True, False, False, False, False, False]
+    assert result["rejected"] == {"duplicate": 1, "invalid_length": 1, "invalid_ddd": 1, "invalid_mobile": 1, "invalid_group": 1}
+    assert result["total"] == 6
+
+def test_validate_numbers_without_dedupe():
+    assert validate_numbers(["11999991111"] * 2, dedupe=False)["numbers"] == ["5511999991111"] * 2
+
+def test_iter_validate_numbers_streams():
+    counts = {}
+    source = (f"11 9{index:08d}" for index in range(1000))
+    numbers = iter_validate_numbers(source, counts=counts)
+    assert next(numbers) == "5511900000000"
+    assert sum(1 for _ in numbers) == 999
+    assert counts == {}
+
+def test_calculate_send_delay():
+    assert [calculate_send_delay(index) for index in (0, 9, 10, 11, 100)] == [5, 5, 6, 7, 30]
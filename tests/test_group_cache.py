@@ -0,0 +1,51 @@
+from evolutionapi_client import EvolutionAPIClient
+from evolutionapi_client.group.cache import GroupCache
+from evolutionapi_client.instance.webhook import WebhookEvents
+
+GROUP = "120363000000000001@g.us"
+
+def cache_with_group(**kwargs) -> GroupCache:
+    cache = GroupCache(**kwargs)
+    cache.load([{"id": GROUP, "subject": "Vendas SP", "participants": [{"id": "5511999991111@s.whatsapp.net", "admin": "superadmin"}]}])
+    return cache
+
+def test_participant_events_update_the_indexes():
+    cache = cache_with_group()
+    cache.apply_event(WebhookEvents.GROUP_PARTICIPANTS_UPDATE, {"data": {"id": GROUP, "action": "add", "participants": ["5511999992222"]}})
+    assert [group["id"] for group in cache.groups_of("5511999992222")] == [GROUP]
+    cache.apply_event(WebhookEvents.GROUP_PARTICIPANTS_UPDATE, {"data": {"id": GROUP, "action": "promote", "participants": ["5511999992222@s.whatsapp.net"]}})
+    assert cache.get(GROUP)["participants"][1]["admin"] == "admin"
+    cache.apply_event(WebhookEvents.GROUP_PARTICIPANTS_UPDATE, {"data": {"id": GROUP, "action": "remove", "participants": ["5511999991111"]}})
+    assert cache.groups_of("5511999991111") == []
+    assert cache.get(GROUP)["size"] == 1
+
+def test_subject_index_follows_updates():
+    cache = cache_with_group()
+    cache.apply_event(WebhookEvents.GROUP_UPDATE, {"data": {"id": GROUP, "subject": "Vendas RJ"}})
+    assert cache.find_by_subject("vendas sp") == []
+    assert [group["id"] for group in cache.find_by_subject("VENDAS RJ")] == [GROUP]
+    assert len(cache.find_by_subject("vendas", exact=False)) == 1
+
+def test_unknown_group_marks_cache_stale():
+    cache = cache_with_group()
+    assert not cache.is_stale()
+    cache.apply_event(WebhookEvents.GROUP_UPDATE, {"data": {"id": "999@g.us", "subject": "x"}})
+    assert cache.is_stale()
+
+def test_reconcile_loads_once_until_stale(mock_api):
+    url, config = mock_api
+    with EvolutionAPIClient(url, "key", "instance-0") as client:
+        cache = GroupCache(client.group)
+        requests = config.stats["requests"]
+        total = len(cache.all())
+        cache.groups_of("5511999991111")
+        assert total == config.groups
+        assert config.stats["requests"] == requests + 1
+
+def test_persisted_cache_is_restored(tmp_path):
+    db_path = str(tmp_path / "groups.sqlite")
+    cache_with_group(db_path=db_path).close()
+    restored = GroupCache(db_path=db_path)
+    assert not restored.is_stale()
+    assert restored.get(GROUP)["subject"] == "Vendas SP"
+    restored.close()
@@ -0,0 +1,44 @@
+import os
+import shutil
+import pytest
+from PIL import Image
+from evolutionapi_client.tools.func_tools import preprocess_image
+from evolutionapi_client.tools.image_pipeline import ImagePipeline
+
+@pytest.fixture
+def photo(tmp_path):
+    path = tmp_path / "foto.jpg"
+    Image.effect_noise((2400, 1800), 40).convert("RGB").save(path, quality=95)
+    return str(path)
+
+def test_process_resizes_and_caches(photo, tmp_path):
+    with ImagePipeline(output_dir=str(tmp_path / "out"), max_edge=800) as pipeline:
+        first = pipeline.process(photo)
+        second = pipeline.process(photo)
+        assert pipeline.processed == 1
+    assert first == second
+    with Image.open(first["path"]) as image:
+        assert max(image.size) == 800
+    assert os.path.exists(first["thumbnail"])
+
+def test_cleaned_output_dir_is_rebuilt(photo, tmp_path):
+    output_dir = tmp_path / "out"
+    with ImagePipeline(output_dir=str(output_dir), max_edge=800) as pipeline:
+        pipeline.process(photo)
+        shutil.rmtree(output_dir)
+        os.makedirs(output_dir)
+        result = pipeline.process(photo)
+        assert pipeline.processed == 2
+    assert os.path.exists(result["path"])
+    assert os.path.exists(result["thumbnail"])
+
+def test_non_processed_types_pass_through(tmp_path):
+    gif = tmp_path / "anim.gif"
+    Image.new("RGB", (10, 10)).save(gif)
+    with ImagePipeline(output_dir=str(tmp_path / "out")) as pipeline:
+        assert pipeline.path(str(gif)) == str(gif)
+
+def test_low_quality_with_size_limit(photo, tmp_path):
+    output = str(tmp_path / "low.jpg")
+    result = preprocess_image(photo, output, max_edge=2400, quality=10, max_kb=100)
+    assert result["bytes"] <= 100 * 1024
@@ -0,0 +1,14 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_importing_the_client_skips_heavy_modules():
+    code = (
+        "import sys, evolutionapi_client\n"
+        "from evolutionapi_client import EvolutionAPIClient\n"
+        "print(','.join(name for name in ('fitz', 'PIL', 'httpx') if name in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import pytest
+from PIL import Image
+from evolutionapi_client import EvolutionAPIClient
+from evolutionapi_client.tools.func_tools import compress_to_target
+
+@pytest.fixture
+def photo(tmp_path):
+    path = tmp_path / "foto.jpg"
+    Image.effect_noise((800, 600), 40).convert("RGB").save(path, quality=95)
+    return str(path)
+
+@pytest.fixture
+def temp_dir(tmp_path, monkeypatch):
+    """Isola o diretório temporário usado por compress_to_target."""
+    directory = tmp_path / "tmp"
+    directory.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(directory))
+    return directory
+
+def test_compressed_file_is_removed_after_send(mock_api, photo, temp_dir):
+    url, _ = mock_api
+    with EvolutionAPIClient(url, "key", "instance-0") as client:
+        result = client.media.send_media("5511999991111", photo, delay=0, max_size_mb=0.05)
+    assert result["success"]
+    assert os.listdir(temp_dir) == []
+
+def test_compressed_dir_reuses_output(mock_api, photo, temp_dir, tmp_path):
+    url, _ = mock_api
+    with EvolutionAPIClient(url, "key", "instance-0") as client:
+        client.media.compressed_dir = str(tmp_path / "compressed")
+        for _ in range(2):
+            assert client.media.send_media("5511999991111", photo, delay=0, max_size_mb=0.05)["success"]
+    outputs = os.listdir(tmp_path / "compressed")
+    assert len(outputs) == 1 and outputs[0].endswith("-0.05mb.jpg")
+    assert os.path.getsize(tmp_path / "compressed" / outputs[0]) <= 0.05 * 1024 * 1024
+
+def test_video_over_limit_is_sent_unchanged(mock_api, tmp_path, capsys):
+    url, config = mock_api
+    video = tmp_path / "video.mp4"
+    video.write_bytes(os.urandom(200 * 1024))
+    with EvolutionAPIClient(url, "key", "instance-0") as client:
+        result = client.media.send_media("5511999991111", str(video), delay=0, max_size_mb=0.05)
+    assert result["success"]
+    assert "sem compressão" in capsys.readouterr().out
+    assert config.stats["bytes_in"] > 200 * 1024
+
+def test_compress_to_target_fits_the_limit(photo, tmp_path):
+    output = str(tmp_path / "alvo.jpg")
+    assert compress_to_target(photo, 0.05, output) == output
+    assert os.path.getsize(output) <= 0.05 * 1024 * 1024
+    assert compress_to_target(photo, 10) == photo
+
+def test_compress_to_target_rejects_what_cannot_fit(photo, tmp_path, temp_dir):
+    video = tmp_path / "video.mp4"
+    video.write_bytes(os.urandom(64 * 1024))
+    with pytest.raises(ValueError):
+        compress_to_target(str(video), 0.01)
+    with pytest.raises(ValueError):
+        compress_to_target(photo, 0.0001, min_scale=0.9)
+    assert os.listdir(temp_dir) == []
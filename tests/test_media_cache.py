@@ -0,0 +1,51 @@
+import asyncio
+import shutil
+import threading
+from evolutionapi_client.aio.client import AsyncEvolutionAPIClient
+from evolutionapi_client.tools.media_cache import MediaCache
+
+def test_media_info_is_keyed_by_extension(tmp_path):
+    image = tmp_path / "arquivo.jpg"
+    image.write_bytes(b"mesmo conteudo")
+    document = tmp_path / "arquivo.pdf"
+    shutil.copy(image, document)
+    cache = MediaCache()
+    assert cache.media_info(str(image))["mime_type"] == "image/jpeg"
+    assert cache.media_info(str(document))["mime_type"] == "application/pdf"
+    assert cache.fingerprint(str(image)) == cache.fingerprint(str(document))
+
+def test_fingerprints_are_bounded(tmp_path):
+    cache = MediaCache(max_paths=3)
+    for index in range(5):
+        path = tmp_path / f"{index}.bin"
+        path.write_bytes(bytes([index]))
+        cache.fingerprint(str(path))
+    assert len(cache._fingerprints) == 3
+
+def test_changed_file_is_hashed_again(tmp_path):
+    path = tmp_path / "a.bin"
+    path.write_bytes(b"a")
+    cache = MediaCache()
+    first = cache.fingerprint(str(path))
+    path.write_bytes(b"bb")
+    assert cache.fingerprint(str(path)) != first
+
+def test_async_media_payload_runs_off_the_event_loop(mock_api, tmp_path):
+    url, _ = mock_api
+    image = tmp_path / "foto.jpg"
+    image.write_bytes(b"\xff\xd8\xff" + b"0" * 1024)
+    threads = []
+
+    async def scenario():
+        async with AsyncEvolutionAPIClient(url, "key", "instance-0") as client:
+            build = client.media._media_payload
+
+            def recording(*args):
+                threads.append(threading.current_thread())
+                return build(*args)
+
+            client.media._media_payload = recording
+            return await client.media.send_media("5511999991111", str(image), delay=0)
+
+    assert asyncio.run(scenario())["success"]
+    assert threads and threads[0] is not threading.main_thread()
@@ -0,0 +1,48 @@
+import requests
+from evolutionapi_client import EvolutionAPIClient
+from evolutionapi_client.metrics import Histogram, Metrics, endpoint_label
+from evolutionapi_client.transport import HTTPTransport
+
+def test_endpoint_label_hides_the_instance():
+    assert endpoint_label("http://api/message/sendText/minha", "minha") == "/message/sendText/{instance}"
+    assert endpoint_label("http://api") == "/"
+
+def test_histogram_is_cumulative():
+    histogram = Histogram((0.1, 1))
+    for value in (0.05, 0.5, 5):
+        histogram.observe(value)
+    assert histogram.cumulative() == [("0.1", 1), ("1", 2), ("+Inf", 3)]
+
+def test_transport_requests_and_sleeps_are_measured(mock_api):
+    url, _ = mock_api
+    metrics = Metrics()
+    events = []
+    metrics.add_hook(events.append)
+    with EvolutionAPIClient(url, "key", "instance-0", transport=HTTPTransport(metrics=metrics)) as client:
+        client.message.send_text_message("5511999991111", "oi", delay=0)
+    key = ("POST", "/message/sendText/{instance}")
+    assert metrics.requests[key + ("201",)] == 1
+    assert metrics.request_bytes[key] > 0
+    assert [event["type"] for event in events] == ["request", "request", "sleep"]
+    text = metrics.render_prometheus()
+    assert 'evolutionapi_request_duration_seconds_count{method="POST",endpoint="/message/sendText/{instance}"} 1' in text
+
+def test_failed_attempt_is_labelled_with_the_exception():
+    metrics = Metrics()
+    transport = HTTPTransport(resilience=False, metrics=metrics, timeout=0.5)
+    try:
+        transport.get("http://127.0.0.1:9/x")
+    except requests.ConnectionError:
+        pass
+    assert list(metrics.requests) == [("GET", "/x", "ConnectionError")]
+
+def test_exporter_serves_prometheus_text():
+    metrics = Metrics()
+    metrics.observe_sleep(1.5)
+    server = metrics.serve("127.0.0.1", 0)
+    try:
+        body = requests.get(f"http://127.0.0.1:{server.server_address[1]}/metrics", timeout=5).text
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert 'evolutionapi_sleep_seconds_total{reason="delay"} 1.5' in body
@@ -0,0 +1,43 @@
+import pytest
+import requests
+from bench_suite import WORKLOADS, percentile, run_workload
+from mock_server import MockConfig, start_mock_server
+
+@pytest.fixture
+def flaky_api():
+    config = MockConfig(rate_429=0.3, error_rate=0.3, retry_after=2)
+    server, url = start_mock_server(config)
+    yield url, config
+    server.shutdown()
+    server.server_close()
+
+def test_failures_are_reproducible_with_the_same_seed():
+    first, second = MockConfig(error_rate=0.5, rate_429=0.2, seed=7), MockConfig(error_rate=0.5, rate_429=0.2, seed=7)
+    assert [first.draw()[1] for _ in range(50)] == [second.draw()[1] for _ in range(50)]
+    assert {MockConfig(error_rate=0.5, rate_429=0.2).draw()[1] for _ in range(50)} <= {None, "429", "500"}
+
+def test_injected_failures(flaky_api):
+    url, config = flaky_api
+    responses = [requests.get(f"{url}/instance/fetchInstances", timeout=5) for _ in range(30)]
+    statuses = [response.status_code for response in responses]
+    assert statuses.count(429) == config.stats["throttled"] > 0
+    assert statuses.count(500) == config.stats["errors"] > 0
+    assert all(response.headers["Retry-After"] == "2" for response in responses if response.status_code == 429)
+
+def test_unknown_route_is_404(mock_api):
+    url, _ = mock_api
+    assert requests.post(f"{url}/nada/aqui/instance-0", json={}, timeout=5).status_code == 404
+
+def test_percentile():
+    assert percentile([], 0.5) == 0.0
+    assert percentile([3, 1, 2, 4, 5], 0.5) == 3
+    assert percentile(list(range(101)), 0.99) == 99
+
+@pytest.mark.parametrize("workload", WORKLOADS)
+def test_workloads_run_against_the_mock(mock_api, tmp_path, workload):
+    url, config = mock_api
+    media = tmp_path / "media.jpg"
+    media.write_bytes(b"\xff\xd8\xff" + b"0" * 4096)
+    result = run_workload(url, workload, 8, 2, str(media))
+    assert result["requests"] == 8 and result["throughput"] > 0
+    assert config.stats["requests"] >= 1 + 1 + 8
@@ -0,0 +1,28 @@
+import json
+import time
+from evolutionapi_client.instance.manager import InstanceManager
+from evolutionapi_client.instance.monitor import ConnectionMonitor
+from evolutionapi_client.transport import HTTPTransport
+
+def test_initial_load_is_retried_on_the_minimum_interval(stub_api):
+    calls = []
+
+    def handler(method, path):
+        calls.append(path)
+        if len(calls) == 1:
+            return 502, "text/html", b"<html>Bad Gateway</html>"
+        return 200, "application/json", json.dumps([{"name": "instance-0", "connectionStatus": "open"}]).encode()
+
+    manager = InstanceManager(stub_api(handler), "key", transport=HTTPTransport(resilience=False))
+    with ConnectionMonitor(manager, min_interval=0.05, max_interval=60) as monitor:
+        deadline = time.monotonic() + 2
+        while monitor.state("instance-0") is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert monitor.is_open("instance-0")
+    assert calls[:2] == ["/instance/fetchInstances"] * 2
+
+def test_refresh_all_reports_failure(stub_api):
+    url = stub_api(lambda method, path: (500, "text/plain", b"erro"))
+    monitor = ConnectionMonitor(InstanceManager(url, "key", transport=HTTPTransport(resilience=False)))
+    assert monitor.refresh_all() is False
+    assert monitor.states() == {}
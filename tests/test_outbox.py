@@ -0,0 +1,79 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from evolutionapi_client import EvolutionAPIClient
+from evolutionapi_client.send.outbox import check_job
+from evolutionapi_client.transport import HTTPTransport
+
+INSTANCES = json.dumps([{"name": "instance-0", "connectionStatus": "open", "token": "token-0"}]).encode()
+
+def gateway_error(method, path):
+    """Lista a instância e responde os envios com a página HTML de um gateway fora do ar."""
+    if "fetchInstances" in path:
+        return 200, "application/json", INSTANCES
+    return 502, "text/html", b"<html><body>502 Bad Gateway</body></html>"
+
+def no_delay(index: int) -> float:
+    return 0
+
+def test_gateway_error_is_retried(stub_api, tmp_path):
+    url = stub_api(gateway_error)
+    with EvolutionAPIClient(url, "key", "instance-0", transport=HTTPTransport(resilience=False)) as client:
+        with client.outbox(str(tmp_path / "outbox.db"), retry_backoff=0) as outbox:
+            key = outbox.enqueue_text("5511999991111", "oi")
+            outbox.flush()
+            with ThreadPoolExecutor(1) as executor:
+                outbox.worker(threads=1, delay_policy=no_delay).run_once(executor)
+            status = outbox.status(key)
+    assert status["state"] == "pending"
+    assert status["attempts"] == 1
+
+def test_missing_file_fails_without_retry(mock_api, tmp_path):
+    url, _ = mock_api
+    media = tmp_path / "foto.jpg"
+    media.write_bytes(b"\xff\xd8\xff")
+    with EvolutionAPIClient(url, "key", "instance-0") as client, client.outbox(str(tmp_path / "outbox.db")) as outbox:
+        key = outbox.enqueue_media("5511999991111", str(media))
+        outbox.flush()
+        os.remove(media)
+        outbox.worker(threads=1, delay_policy=no_delay).run(until_empty=True)
+        status = outbox.status(key)
+    assert status["state"] == "failed"
+    assert status["attempts"] == 1
+    assert "Arquivo não encontrado" in status["result"]["error"]
+
+def test_check_job():
+    assert check_job("text", {"number": "5511999991111"}) is None
+    assert check_job("fax", {}) == "Tipo de envio inválido: fax"
+    assert "number" in check_job("text", {})
+    assert check_job("status", {"payload": {}, "file_path": None}) is None
+    assert "Arquivo não encontrado" in check_job("status", {"payload": {}, "file_path": "/nao/existe.jpg"})
+
+def test_sends_are_paced_per_instance(mock_api, tmp_path):
+    url, _ = mock_api
+    with EvolutionAPIClient(url, "key", "instance-0") as client, client.outbox(str(tmp_path / "outbox.db")) as outbox:
+        for index in range(3):
+            outbox.enqueue_text(f"551199999111{index}", "oi")
+        outbox.flush()
+        start = time.monotonic()
+        outbox.worker(threads=3, delay_policy=lambda index: 0.2).run(until_empty=True)
+        elapsed = time.monotonic() - start
+        assert outbox.stats()["done"] == 3
+    assert elapsed >= 0.4
+
+def test_expired_lease_is_reclaimed(mock_api, tmp_path):
+    url, _ = mock_api
+    with EvolutionAPIClient(url, "key", "instance-0") as client:
+        with client.outbox(str(tmp_path / "outbox.db"), visibility_timeout=0.1) as outbox:
+            outbox.enqueue_text("5511999991111", "oi")
+            outbox.flush()
+            first = outbox.claim("worker-a")
+            assert len(first) == 1
+            assert outbox.claim("worker-b") == []
+            time.sleep(0.15)
+            second = outbox.claim("worker-b")
+            assert [job.attempts for job in second] == [2]
+            # O dono antigo perdeu o lease: seu resultado é ignorado.
+            outbox.complete("worker-a", [(first[0], "done", {"ok": True})])
+            assert outbox.status(second[0].key)["state"] == "pending"
@@ -0,0 +1,26 @@
+import fitz
+import pytest
+from PIL import Image
+from evolutionapi_client.tools.func_tools import compress_pdf_file
+
+PAGE_SIZES = [(300, 400), (400, 300), (200, 200), (300, 400), (250, 500)]
+
+@pytest.fixture
+def scanned_pdf(tmp_path):
+    image = tmp_path / "scan.png"
+    Image.effect_noise((600, 800), 60).convert("RGB").save(image)
+    path = tmp_path / "scan.pdf"
+    with fitz.open() as doc:
+        for width, height in PAGE_SIZES:
+            page = doc.new_page(width=width, height=height)
+            page.insert_image(page.rect, filename=str(image))
+        doc.save(path)
+    return str(path)
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_pages_keep_order_and_size(scanned_pdf, tmp_path, workers):
+    output = str(tmp_path / f"out-{workers}.pdf")
+    assert compress_pdf_file(scanned_pdf, output, quality=30, dpi=72, workers=workers, chunk_pages=2) == output
+    with fitz.open(output) as doc:
+        sizes = [(round(page.rect.width), round(page.rect.height)) for page in doc]
+    assert sizes == PAGE_SIZES
@@ -0,0 +1,56 @@
+import json
+import pytest
+from evolutionapi_client import EvolutionAPIClient
+from evolutionapi_client.transport import HTTPTransport
+
+INSTANCES = json.dumps([
+    {"name": "instance-0", "connectionStatus": "open", "token": "token-0"},
+    {"name": "instance-1", "connectionStatus": "open", "token": "token-1"}
+]).encode()
+
+def broken_instance_1(method, path):
+    """instance-1 responde os envios com a página HTML de um gateway; instance-0 funciona."""
+    if "fetchInstances" in path:
+        return 200, "application/json", INSTANCES
+    if path.endswith("/instance-1"):
+        return 502, "text/html", b"<html><body>502 Bad Gateway</body></html>"
+    return 201, "application/json", json.dumps({"key": {"id": "ABC"}}).encode()
+
+def test_non_json_gateway_error_benches_instance(stub_api):
+    url = stub_api(broken_instance_1)
+    with EvolutionAPIClient(url, "key", transport=HTTPTransport(resilience=False)) as client:
+        pool = client.instance_pool("round_robin")
+        for index in range(2):
+            try:
+                pool.send_text_message(f"551199999111{index}", "oi", delay=0)
+            except ValueError:
+                pass
+        stats = pool.stats()
+    assert stats["instance-1"]["failures"] == 1
+    assert stats["instance-1"]["available"] is False
+    assert stats["instance-0"]["available"] is True
+
+def test_request_errors_do_not_bench_instance(mock_api):
+    url, _ = mock_api
+    with EvolutionAPIClient(url, "key") as client:
+        pool = client.instance_pool("round_robin")
+        with pytest.raises(FileNotFoundError):
+            pool.send_media("5511999991111", "/nao/existe.jpg", delay=0)
+        assert all(member["available"] for member in pool.stats().values())
+
+def test_sticky_strategy_keeps_recipient_on_one_instance(mock_api):
+    url, _ = mock_api
+    with EvolutionAPIClient(url, "key") as client:
+        pool = client.instance_pool("sticky")
+        for _ in range(4):
+            pool.send_text_message("5511999991111", "oi", delay=0)
+        sent = [member["sent"] for member in pool.stats().values()]
+    assert sorted(sent) == [0, 0, 4]
+
+def test_round_robin_spreads_sends(mock_api):
+    url, _ = mock_api
+    with EvolutionAPIClient(url, "key") as client:
+        pool = client.instance_pool("round_robin")
+        for index in range(6):
+            pool.send_text_message(f"551199999111{index}", "oi", delay=0)
+        assert [member["sent"] for member in pool.stats().values()] == [2, 2, 2]
@@ -0,0 +1,31 @@
+import json
+from evolutionapi_client.instance.manager import InstanceManager
+from evolutionapi_client.instance.provisioner import InstanceSpec, Provisioner, diff_fields
+from evolutionapi_client.instance.webhook import WebhookConfig
+from evolutionapi_client.transport import HTTPTransport
+
+WEBHOOK_URL = "https://example.com/hook"
+
+def test_diff_fields_uses_aliases_and_reports_unverified():
+    desired = {"byEvents": False, "base64": True, "events": ["A", "B"], "token": "x"}
+    current = {"webhookByEvents": False, "webhookBase64": False, "events": ["B", "A"]}
+    assert diff_fields(desired, current) == (["base64"], ["token"])
+    assert diff_fields(desired, None) == (list(desired), [])
+
+def test_decode_error_fails_only_that_instance(stub_api):
+    webhook = WebhookConfig().set_webhook(WEBHOOK_URL, None)["webhook"]
+    instances = [{"name": f"instance-{index}", "connectionStatus": "open"} for index in range(2)]
+
+    def handler(method, path):
+        if path == "/instance/fetchInstances":
+            return 200, "application/json", json.dumps(instances).encode()
+        if path == "/webhook/find/instance-0":
+            return 200, "text/html", b"<html>proxy error</html>"
+        return 200, "application/json", json.dumps(webhook).encode()
+
+    manager = InstanceManager(stub_api(handler), "key", transport=HTTPTransport(resilience=False))
+    result = Provisioner(manager).apply([InstanceSpec(instance["name"], webhook_url=WEBHOOK_URL) for instance in instances])
+    failed, unchanged = result["instances"]
+    assert failed["status"] == "failed" and "webhook" in failed["errors"]
+    assert unchanged["status"] == "unchanged" and unchanged["unchanged"] == ["webhook"]
+    assert result["summary"] == {"created": 0, "updated": 0, "unchanged": 1, "failed": 1}
@@ -0,0 +1,34 @@
+import time
+from evolutionapi_client import EvolutionAPIClient
+from evolutionapi_client.instance.registry import InstanceRegistry
+
+def test_client_startup_fetches_instances_once(mock_api):
+    url, config = mock_api
+    with EvolutionAPIClient(url, "key", "instance-0") as client:
+        assert config.stats["requests"] == 1
+        assert client.group.instance_name == client.chatwoot.instance_name == "instance-0"
+        client.instance.fetch_instances()
+        assert config.stats["requests"] == 1
+        client.instance.fetch_instances(refresh=True)
+        assert config.stats["requests"] == 2
+
+def test_entries_expire():
+    registry = InstanceRegistry(ttl=0.05, state_ttl=0.01)
+    registry.store_instances([{"name": "a"}])
+    registry.store("state", "a", "open")
+    registry.store("settings", "a", {})
+    time.sleep(0.02)
+    assert registry.get("state", "a") is None
+    assert registry.get("settings", "a") == {}
+    assert registry.find("a") == {"name": "a"}
+    time.sleep(0.04)
+    assert registry.instances() is None
+
+def test_invalidate_one_instance():
+    registry = InstanceRegistry()
+    registry.store_instances([{"name": "a"}, {"name": "b"}])
+    registry.store("settings", "a", 1)
+    registry.store("settings", "b", 2)
+    registry.invalidate("a")
+    assert registry.instances() is None
+    assert (registry.get("settings", "a"), registry.get("settings", "b")) == (None, 2)
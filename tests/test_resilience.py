@@ -0,0 +1,128 @@
+import asyncio
+import pytest
+from evolutionapi_client.resilience import CircuitBreaker, CircuitOpenError, Resilience, RetryPolicy
+
+class Response:
+    def __init__(self, status_code: int, headers: dict = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+def replay(*responses):
+    """Retorna uma função de envio que devolve as respostas em ordem e conta as tentativas."""
+    pending = list(responses)
+    def send():
+        send.attempts += 1
+        return pending.pop(0)
+    send.attempts = 0
+    return send
+
+def no_wait(**kwargs) -> Resilience:
+    return Resilience(RetryPolicy(backoff_base=0, jitter=False, **kwargs), failure_threshold=10)
+
+def half_open(resilience: Resilience, key: str):
+    """Abre o circuito de `key` e expira o tempo de recuperação."""
+    breaker = resilience.breaker(key)
+    for _ in range(resilience.failure_threshold):
+        breaker.record_failure()
+    breaker.opened_at -= resilience.recovery_timeout + 1
+    return breaker
+
+def test_interrupted_probe_releases_half_open_circuit():
+    resilience = Resilience(failure_threshold=1, recovery_timeout=10)
+    half_open(resilience, "instance-0")
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        resilience.call("POST", "instance-0", interrupted, lambda e: False)
+
+    response = resilience.call("POST", "instance-0", lambda: Response(200), lambda e: False)
+    assert response.status_code == 200
+    assert resilience.breaker_states()["instance-0"] == CircuitBreaker.CLOSED
+
+def test_cancelled_async_probe_releases_half_open_circuit():
+    resilience = Resilience(failure_threshold=1, recovery_timeout=10)
+    half_open(resilience, "instance-0")
+
+    async def slow():
+        await asyncio.sleep(10)
+
+    async def ok():
+        return Response(200)
+
+    async def scenario():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(resilience.acall("POST", "instance-0", slow, lambda e: False), 0.01)
+        return await resilience.acall("POST", "instance-0", ok, lambda e: False)
+
+    assert asyncio.run(scenario()).status_code == 200
+    assert resilience.breaker_states()["instance-0"] == CircuitBreaker.CLOSED
+
+def test_open_circuit_still_short_circuits():
+    resilience = Resilience(failure_threshold=1, recovery_timeout=10)
+    resilience.breaker("instance-0").record_failure()
+    with pytest.raises(CircuitOpenError):
+        resilience.call("POST", "instance-0", lambda: Response(200), lambda e: False)
+
+def test_throttled_post_is_retried():
+    send = replay(Response(429, {"Retry-After": "0"}), Response(503), Response(201))
+    assert no_wait().call("POST", "instance-0", send, lambda e: False).status_code == 201
+    assert send.attempts == 3
+
+def test_server_error_is_retried_only_for_idempotent_methods():
+    post = replay(Response(500), Response(201))
+    assert no_wait().call("POST", "instance-0", post, lambda e: False).status_code == 500
+    get = replay(Response(500), Response(200))
+    assert no_wait().call("GET", "instance-0", get, lambda e: False).status_code == 200
+    assert (post.attempts, get.attempts) == (1, 2)
+
+def test_connect_errors_are_retried_for_any_method():
+    attempts = []
+
+    def send():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionRefusedError()
+        return Response(201)
+
+    assert no_wait().call("POST", "instance-0", send, lambda e: isinstance(e, ConnectionRefusedError)).status_code == 201
+    assert len(attempts) == 2
+
+def test_read_errors_are_not_retried_for_post():
+    attempts = []
+
+    def send():
+        attempts.append(1)
+        raise TimeoutError()
+
+    with pytest.raises(TimeoutError):
+        no_wait().call("POST", "instance-0", send, lambda e: False)
+    assert len(attempts) == 1
+
+def test_retries_stop_at_max_retries_and_budget():
+    resilience = no_wait(max_retries=2)
+    send = replay(*[Response(503)] * 5)
+    assert resilience.call("GET", "a", send, lambda e: False).status_code == 503
+    assert send.attempts == 3 and resilience.stats()["retries_exhausted"] == 1
+
+    resilience = no_wait(budget_max=1, budget_ratio=0)
+    send = replay(*[Response(503)] * 5)
+    resilience.call("GET", "a", send, lambda e: False)
+    assert send.attempts == 2 and resilience.stats()["budget_exhausted"] == 1
+
+def test_circuit_opens_per_instance():
+    resilience = Resilience(RetryPolicy(max_retries=0), failure_threshold=2)
+    for _ in range(2):
+        resilience.call("POST", "instance-0", lambda: Response(500), lambda e: False)
+    with pytest.raises(CircuitOpenError):
+        resilience.call("POST", "instance-0", lambda: Response(201), lambda e: False)
+    assert resilience.call("POST", "instance-1", lambda: Response(201), lambda e: False).status_code == 201
+    assert resilience.breaker_states() == {"instance-0": CircuitBreaker.OPEN, "instance-1": CircuitBreaker.CLOSED}
+
+def test_backoff_honors_retry_after():
+    policy = RetryPolicy(backoff_base=1, backoff_max=30, jitter=False)
+    assert policy.backoff(3) == 4
+    assert policy.backoff(1, "2.5") == 2.5
+    assert policy.backoff(1, "120") == 30
+    assert policy.backoff(2, "data inválida") == 2
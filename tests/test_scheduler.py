@@ -0,0 +1,58 @@
+import asyncio
+import time
+from evolutionapi_client import EvolutionAPIClient
+from evolutionapi_client.aio.client import AsyncEvolutionAPIClient
+from evolutionapi_client.aio.scheduler import AsyncSendScheduler
+from evolutionapi_client.send.scheduler import SendPacer, SendScheduler
+
+def test_pacer_spaces_slots_per_key():
+    pacer = SendPacer(lambda index: index + 1)
+    assert [pacer.reserve("a", now=0) for _ in range(3)] == [0, 1, 3]
+    assert pacer.reserve("b", now=0) == 0
+    assert pacer.reserve("a", now=10) == 10
+    pacer.reset("a")
+    assert pacer.reserve("a", now=0) == 0
+
+def test_submit_returns_immediately_and_paces_each_key():
+    started = {}
+    with SendScheduler(lambda index: 0.1, max_workers=4) as scheduler:
+        begin = time.monotonic()
+        futures = [
+            scheduler.submit(lambda key, index: started.setdefault((key, index), time.monotonic() - begin), key, index, key=key)
+            for index in range(3) for key in ("a", "b")
+        ]
+        assert time.monotonic() - begin < 0.05
+        [future.result(2) for future in futures]
+    assert started[("a", 2)] >= 0.2 and started[("b", 2)] >= 0.2
+    assert started[("b", 0)] < 0.1
+
+def test_sender_delay_is_replaced_by_pacing(mock_api):
+    url, _ = mock_api
+    with EvolutionAPIClient(url, "key", "instance-0") as client, SendScheduler(lambda index: 0) as scheduler:
+        future = scheduler.submit(client.message.send_text_message, "5511999991111", "oi")
+        begin = time.monotonic()
+        assert "key" in future.result(2)
+        assert time.monotonic() - begin < 1
+
+def test_shutdown_cancels_pending():
+    scheduler = SendScheduler(lambda index: 60)
+    first = scheduler.submit(lambda: "ok", key="a")
+    second = scheduler.submit(lambda: "ok", key="a")
+    assert first.result(2) == "ok"
+    scheduler.shutdown(cancel_pending=True)
+    assert second.cancelled()
+
+def test_async_scheduler_paces_sends(mock_api):
+    url, _ = mock_api
+
+    async def scenario():
+        async with AsyncEvolutionAPIClient(url, "key", "instance-0") as client:
+            scheduler = AsyncSendScheduler(lambda index: 0.1)
+            start = time.monotonic()
+            tasks = [scheduler.submit(client.message.send_text_message, f"551199999{index:03d}1", "oi") for index in range(3)]
+            results = await asyncio.gather(*tasks)
+            return results, time.monotonic() - start
+
+    results, elapsed = asyncio.run(scenario())
+    assert all("key" in result for result in results)
+    assert 0.2 <= elapsed < 1
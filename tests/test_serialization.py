@@ -0,0 +1,27 @@
+import json
+import pytest
+from evolutionapi_client import EvolutionAPIClient
+from evolutionapi_client.serialization import PayloadTemplate, dumps, loads
+
+@pytest.mark.parametrize("value", ["5511999991111", ["a@s.whatsapp.net", "b@s.whatsapp.net"], 'aspas " e \\ barra', 12])
+def test_render_matches_full_serialization(value):
+    payload = {"number": None, "text": "Olá ☃\nlinha", "options": {"delay": 0}}
+    template = PayloadTemplate(payload)
+    assert json.loads(template.render(value)) == template.to_dict(value) == {**payload, "number": value}
+
+def test_dumps_accepts_what_the_standard_json_accepts():
+    assert loads(dumps({1: "a", "b": [1, 2]})) == {"1": "a", "b": [1, 2]}
+    assert loads(dumps({"n": 2 ** 70})) == {"n": 2 ** 70}
+    assert dumps({"t": "ação"}) == '{"t":"ação"}'.encode()
+
+def test_loads_rejects_invalid_json():
+    with pytest.raises(ValueError):
+        loads(b"<html>")
+
+def test_send_prepared(mock_api):
+    url, config = mock_api
+    with EvolutionAPIClient(url, "key", "instance-0") as client:
+        template = client.message.prepare_text_message("oi")
+        results = [client.message.send_prepared(template, number, delay=0) for number in ("5511999991111", "5511999992222")]
+    assert [result["key"]["remoteJid"] for result in results] == ["5511999991111@s.whatsapp.net", "5511999992222@s.whatsapp.net"]
+    assert [result["message"]["conversation"] for result in results] == ["oi", "oi"]
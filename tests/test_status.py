@@ -0,0 +1,38 @@
+import os
+import pytest
+from evolutionapi_client import EvolutionAPIClient
+from evolutionapi_client.tools.file_server import FileServer
+
+NUMBERS = [f"5511{900000001 + index * 10:09d}" for index in range(25)]
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(os.urandom(2 * 1024 * 1024))
+    return str(path)
+
+def test_broadcast_counts_invalid_and_duplicates_apart(mock_api):
+    url, _ = mock_api
+    with EvolutionAPIClient(url, "key", "instance-0") as client:
+        template = client.status.prepare_status_text("oi")
+        result = client.status.broadcast_status(template, NUMBERS + NUMBERS[:3] + ["123"], chunk_size=10, interval=0)
+    assert (result["total"], result["sent"], result["failed"]) == (25, 25, 0)
+    assert (result["invalid"], result["duplicates"]) == (1, 3)
+    assert [chunk["size"] for chunk in result["chunks"]] == [10, 10, 5]
+    assert result["failed_jids"] == []
+
+def test_media_broadcast_without_file_server_warns(mock_api, video, capsys):
+    url, config = mock_api
+    with EvolutionAPIClient(url, "key", "instance-0") as client:
+        template = client.status.prepare_status("video", video)
+        client.status.broadcast_status(template, NUMBERS, chunk_size=10, interval=0)
+    assert "reenviada em cada lote" in capsys.readouterr().out
+    assert config.stats["bytes_in"] > 3 * 2 * 1024 * 1024
+
+def test_media_broadcast_with_file_server_uploads_once(mock_api, video, capsys):
+    url, config = mock_api
+    with FileServer(host="127.0.0.1") as file_server, EvolutionAPIClient(url, "key", "instance-0", file_server=file_server) as client:
+        template = client.status.prepare_status("video", video)
+        client.status.broadcast_status(template, NUMBERS, chunk_size=10, interval=0)
+    assert "reenviada" not in capsys.readouterr().out
+    assert config.stats["bytes_in"] < 64 * 1024
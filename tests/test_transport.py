@@ -0,0 +1,18 @@
+from evolutionapi_client import EvolutionAPIClient
+from evolutionapi_client.transport import HTTPTransport
+
+def test_managers_and_senders_share_one_transport(mock_api):
+    url, _ = mock_api
+    with EvolutionAPIClient(url, "key", "instance-0") as client:
+        transports = {id(part.transport) for part in (client.instance, client.group, client.message, client.media, client.status, client.location, client.chatwoot)}
+    assert transports == {id(client.transport)}
+
+def test_connection_is_reused_between_requests(mock_api):
+    url, _ = mock_api
+    transport = HTTPTransport()
+    with EvolutionAPIClient(url, "key", "instance-0", transport=transport) as client:
+        for _ in range(5):
+            assert "key" in client.message.send_text_message("5511999991111", "oi", delay=0)
+        client.group.fetch_all_groups(get_participants=False)
+        pools = list(transport.session.get_adapter(url).poolmanager.pools._container.values())
+    assert len(pools) == 1 and pools[0].num_connections == 1
@@ -0,0 +1,90 @@
+import asyncio
+import json
+from evolutionapi_client.instance.webhook import WebhookEvents
+from evolutionapi_client.instance.webhook_receiver import WebhookReceiver, parse_event_name
+
+def body(event: str, **data) -> bytes:
+    return json.dumps({"event": event, "instance": "instance-0", "data": data}).encode()
+
+def test_parse_event_name():
+    assert parse_event_name("messages.upsert") is WebhookEvents.MESSAGES_UPSERT
+    assert parse_event_name("/webhook/messages-upsert") is WebhookEvents.MESSAGES_UPSERT
+    assert parse_event_name("CONNECTION_UPDATE") is WebhookEvents.CONNECTION_UPDATE
+    assert parse_event_name(123) is None
+    assert parse_event_name("nada") is None
+
+def test_receive_validates_body():
+    receiver = WebhookReceiver(max_body_bytes=256)
+
+    async def scenario():
+        return [
+            await receiver.receive(b"{nao json"),
+            await receiver.receive(json.dumps({"event": 1}).encode()),
+            await receiver.receive(b"x" * 257),
+            await receiver.receive(body("messages.upsert"))
+        ]
+
+    statuses = [status for status, _ in asyncio.run(scenario())]
+    assert statuses == [400, 400, 413, 200]
+
+def test_handlers_run_and_errors_return_500():
+    receiver = WebhookReceiver(ack_fast=False)
+    seen = []
+
+    @receiver.on(WebhookEvents.MESSAGES_UPSERT)
+    async def handle(event, payload):
+        seen.append(payload["data"]["id"])
+
+    @receiver.on(WebhookEvents.CONNECTION_UPDATE)
+    def broken(event, payload):
+        raise RuntimeError("falhou")
+
+    async def scenario():
+        ok = await receiver.receive(body("messages.upsert", id="A"))
+        failed = await receiver.receive(body("connection.update", state="open"))
+        await receiver.stop()
+        return ok[0], failed[0]
+
+    assert asyncio.run(scenario()) == (200, 500)
+    assert seen == ["A"]
+
+def test_stop_without_drain_answers_waiting_requests_with_503():
+    receiver = WebhookReceiver(ack_fast=False, workers=1)
+    release = None
+
+    @receiver.on(WebhookEvents.MESSAGES_UPSERT)
+    async def slow(event, payload):
+        await release.wait()
+
+    async def scenario():
+        nonlocal release
+        release = asyncio.Event()
+        requests = [asyncio.create_task(receiver.receive(body("messages.upsert"))) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        await receiver.stop(drain=False)
+        return [status for status, _ in await asyncio.wait_for(asyncio.gather(*requests), 1)]
+
+    assert asyncio.run(scenario()) == [503, 503, 503]
+
+def test_builtin_server_reads_chunked_bodies():
+    receiver = WebhookReceiver()
+    receiver.add_handler("messages.upsert", lambda event, payload: None)
+
+    async def scenario():
+        await receiver.start()
+        server = await asyncio.start_server(receiver._handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        data = body("messages.upsert")
+        writer.write(
+            b"POST /webhook HTTP/1.1\r\nTransfer-Encoding: chunked\r\nConnection: close\r\n\r\n"
+            + f"{len(data):x}\r\n".encode() + data + b"\r\n0\r\n\r\n"
+        )
+        await writer.drain()
+        status_line = await reader.readline()
+        writer.close()
+        server.close()
+        await receiver.stop()
+        return status_line
+
+    assert asyncio.run(scenario()).startswith(b"HTTP/1.1 200")